@@ -7,14 +7,13 @@ Version: 1.0.0
 Date: Feb 2026
 """
 import argparse
+import logging
 # Copyright (c) 2026 shyjun
 # This project is licensed under the MIT License - see the LICENSE file for details.
 import sys
 import os
 from datetime import datetime
 
-from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtGui import QIcon
 import tempfile
 import stat
 
@@ -24,11 +23,20 @@ from lib.git_helpers import (
     has_uncommitted_changes, stash_changes, get_unstaged_files, commit_file,
     bulk_commit_all, stash_pop, get_full_head_sha
 )
-from lib.app_window import GitInteractiveRebaseApp
-from lib.dialogs import UnstagedChangesDialog, ProgressDialog
 
 import shutil
 
+def _qt_import():
+    """
+    Loads PySide6 and the Qt-based modules. Kept out of module scope so that
+    `--help` and argument errors exit before any Qt initialisation happens.
+    """
+    from PySide6.QtWidgets import QApplication, QMessageBox
+    from PySide6.QtGui import QIcon
+    from lib.app_window import GitInteractiveRebaseApp
+    from lib.dialogs import UnstagedChangesDialog, ProgressDialog
+    return QApplication, QMessageBox, QIcon, GitInteractiveRebaseApp, UnstagedChangesDialog, ProgressDialog
+
 def main():
     # 1. Runtime check for Git CLI
     if not shutil.which("git"):
@@ -37,8 +45,13 @@ def main():
     parser = argparse.ArgumentParser(description="git-interactive-rebase-gui-tool: A premium PySide6 GUI for interactive git rebasing.")
     parser.add_argument("-C", "--location", type=str, default=os.getcwd())
     parser.add_argument("commit_sha", type=str, nargs="?", help="Starting commit SHA (optional, defaults to root)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print a trace line for every action")
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING, format="%(message)s")
+
+    QApplication, QMessageBox, QIcon, GitInteractiveRebaseApp, UnstagedChangesDialog, ProgressDialog = _qt_import()
+
     repo_path = os.path.abspath(os.path.expanduser(args.location))
 
     now = datetime.now()
@@ -60,7 +73,7 @@ def main():
     # Check if we are inside a git repository
     import subprocess
     try:
-        subprocess.run(["git", "rev-parse", "--is-inside-work-tree"], cwd=repo_path, check=True, capture_output=True, encoding='utf-8', errors='replace')
+        subprocess.run(["git", "rev-parse", "--is-inside-work-tree"], cwd=repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     except Exception:
         QMessageBox.critical(None, "Not a Git Repository",
             f"The directory '{repo_path}' is not a valid git repository.\n\n"
@@ -6,10 +6,18 @@ if __name__ == "__main__":
 
 import subprocess
 import os
+import sys
 import webbrowser
 import tempfile
+import shutil
+import atexit
 import stat
 import time
+import itertools
+import shlex
+import re
+import logging
+from functools import partial
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QListWidget, QVBoxLayout, 
@@ -19,21 +27,293 @@ from PySide6.QtWidgets import (
     QStyledItemDelegate, QStyle, QStyleOptionViewItem, QTabWidget
 )
 from PySide6.QtGui import QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QAction, QShortcut, QKeySequence, QIcon, QBrush
-from PySide6.QtCore import Qt, QSize, QSettings, QThread, Signal, QRect
+from PySide6.QtCore import Qt, QSize, QSettings, QThread, Signal, QRect, QRunnable, QThreadPool, QObject, QEventLoop, QTimer, QEvent
 
 from lib.git_helpers import (
-    get_git_history, get_head_sha, get_full_head_sha, get_current_branch, get_commit_diff,
-    get_full_commit_message, get_commit_metadata, get_commit_files,
-    has_uncommitted_changes, branch_exists, get_local_branches_map, get_remote_head_sha,
-    get_file_diff_only_in_commit, get_revert_commit_message
+    iter_git_history, get_full_head_sha, get_current_branch, get_head_state,
+    get_commit_stat,
+    has_uncommitted_changes, has_staged_changes, uses_message_rules, branch_exists, get_local_branches_map, get_remote_head_sha,
+    get_revert_commit_message, GitCatFileBatch,
+    ensure_commit_graph
 )
 from lib.dialogs import (
     DiffHighlighter, DiffViewerDialog, SplitCommitDialog, ViewCommitDialog,
     DropDialog, RephraseDialog, RevertCommitDialog, SquashDialog, FileWiseViewDialog,
-    MultiSquashDialog, ProgressDialog
+    MultiSquashDialog, ProgressDialog, configure_diff_view, clip_diff
 )
 from lib.utils import get_assets_path
 
+# Per-action trace output; shown with --verbose (see git_interactive_rebase.py)
+logger = logging.getLogger(__name__)
+
+# Number of commits read from the history stream per page
+HISTORY_CHUNK_SIZE = 500
+# Fetch the next page once the viewport gets this close to the last loaded row
+HISTORY_PREFETCH_ROWS = 100
+# Delay after the last keystroke before the commit list is filtered
+FILTER_DEBOUNCE_MS = 120
+# Refresh button / F5 presses within this window collapse into one history reload
+REFRESH_DEBOUNCE_MS = 100
+# QThreadPool priority for work the user is waiting on (side panel, blocking actions); queued
+# prefetch/warm-up tasks run at the default priority 0 and yield to it
+INTERACTIVE_TASK_PRIORITY = 1
+# Delay after the last selection change before the side panel loads that commit
+SIDE_DIFF_DEBOUNCE_MS = 120
+# Rows above and below the selection whose diffs are warmed once scrolling pauses
+NEIGHBOUR_PREFETCH_ROWS = 2
+NEIGHBOUR_PREFETCH_DELAY_MS = 150
+# How long "Copied ..." notices stay in the status bar
+STATUS_MESSAGE_MS = 3000
+# Sequence editor used by the split actions, driven by GIT_IR_* environment variables
+SEQUENCE_EDITOR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sequence_editor.py")
+
+# VS Code Dark+ inspired palette
+_DARK_COLORS = {
+    "added": "#4ec9b0",   # Soft teal/green
+    "removed": "#f48771", # Soft coral/red
+    "header": "#569cd6",  # VS Code blue
+    "bg": "#1e1e1e",      # Main background
+    "fg": "#cccccc",      # Standard text
+    "accent": "#007acc"   # VS Code accent blue
+}
+_DARK_QSS = """
+    QMainWindow, QWidget {
+        background-color: #1e1e1e;
+        color: #cccccc;
+    }
+    QListWidget {
+        background-color: #252526;
+        border: 1px solid #3c3c3c;
+        border-radius: 8px;
+        padding: 5px;
+        color: #cccccc;
+    }
+    QListWidget::item { 
+        padding: 8px; 
+        border-bottom: 1px solid #333333; 
+    }
+    QListWidget::item:selected {
+        background-color: #37373d;
+        color: #ffffff;
+    }
+    QGroupBox {
+        border: 1px solid #3c3c3c;
+        border-radius: 5px;
+        margin-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 3px 0 3px;
+    }
+    QPushButton {
+        background-color: #333333;
+        color: #cccccc;
+        border: 1px solid #3c3c3c;
+        padding: 8px 15px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #444444;
+    }
+    QPushButton:pressed {
+        background-color: #007acc;
+        color: white;
+    }
+    QPushButton.dialog-btn {
+        background-color: #333333;
+        border: 1px solid #444444;
+    }
+    QPushButton.dialog-btn:hover {
+        background-color: #007acc;
+        color: white;
+    }
+    QLabel {
+        font-weight: bold;
+    }
+    QDialog, QMenu {
+        background-color: #1e1e1e;
+        color: #d4d4d4;
+        border: 1px solid #3c3c3c;
+    }
+    QMenu::item:selected {
+        background-color: #007acc;
+        color: white;
+    }
+    QTextEdit {
+        background-color: #1e1e1e;
+        color: #d4d4d4;
+        border: 1px solid #3c3c3c;
+        border-radius: 4px;
+    }
+    QScrollBar:vertical {
+        background: #1e1e1e;
+        width: 12px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #37373d;
+        min-height: 20px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #4f4f4f;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+"""
+
+_LIGHT_COLORS = {
+    "added": "#228b22",  # Darker green for light bg
+    "removed": "#b22222", # Darker red for light bg
+    "header": "#00008b", # Darker blue for light bg
+    "bg": "#f5f5f7",
+    "fg": "#333333",
+    "accent": "#007aff"
+}
+_LIGHT_QSS = """
+    QMainWindow, QWidget {
+        background-color: #f5f5f7;
+        color: #333;
+    }
+    QListWidget {
+        background-color: #ffffff;
+        border: 1px solid #ddd;
+        border-radius: 8px;
+        padding: 5px;
+        color: #333;
+    }
+    QListWidget::item { 
+        padding: 8px; 
+        border-bottom: 1px solid #eee; 
+    }
+    QListWidget::item:selected {
+        background-color: #007aff;
+        color: white;
+    }
+    QGroupBox {
+        border: 1px solid #ccc;
+        border-radius: 5px;
+        margin-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 3px 0 3px;
+    }
+    QPushButton {
+        background-color: #ffffff;
+        color: #333;
+        border: 1px solid #ccc;
+        padding: 8px 15px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #f0f0f0;
+    }
+    QPushButton:pressed {
+        background-color: #d0d0d0;
+    }
+    QPushButton.dialog-btn {
+        background-color: #e1e1e1;
+        border: 1px solid #bbb;
+    }
+    QPushButton.dialog-btn:hover {
+        background-color: #007aff;
+        color: white;
+    }
+    QLabel {
+        font-weight: bold;
+        color: #333;
+    }
+    QDialog, QMenu {
+        background-color: #f5f5f7;
+        color: #333;
+        border: 1px solid #ccc;
+    }
+    QMenu::item:selected {
+        background-color: #007aff;
+        color: white;
+    }
+    QTextEdit {
+        background-color: #ffffff;
+        color: #333;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+    }
+    QScrollBar:vertical {
+        background: #f5f5f7;
+        width: 12px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #ccc;
+        min-height: 20px;
+        border-radius: 6px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+"""
+
+# theme name -> (diff/accent colors, application stylesheet)
+_THEMES = {
+    "dark": (_DARK_COLORS, _DARK_QSS),
+    "light": (_LIGHT_COLORS, _LIGHT_QSS),
+}
+
+
+def remove_temp_files(paths):
+    """Best-effort removal of temporary scripts/messages written for a rebase."""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+def rebase_env(sequence_editor):
+    """
+    Environment for a scripted `git rebase -i`: sequence_editor supplies the todo and
+    GIT_EDITOR=true accepts every commit message unchanged. Built in a single merge
+    instead of copying os.environ and then setting keys one by one.
+    """
+    return {**os.environ, "GIT_SEQUENCE_EDITOR": sequence_editor, "GIT_EDITOR": "true"}
+
+# Hooks a rebase or amend runs on a rewritten message but `git commit-tree` does not
+COMMIT_REWRITE_HOOKS = ("prepare-commit-msg", "commit-msg", "post-rewrite")
+
+# Step counter git prints to stderr while replaying a rebase todo
+REBASE_PROGRESS_RE = re.compile(rb"Rebasing \((\d+)/(\d+)\)")
+
+def run_rebase_with_progress(cmd, cwd, env, on_progress):
+    """
+    Runs a `git rebase` like subprocess.run(stdout=DEVNULL, stderr=PIPE), but reads stderr
+    as it arrives and reports git's "Rebasing (n/m)" counter through on_progress(n, m).
+    Returns a CompletedProcess whose stderr holds the full (bytes) output.
+    """
+    proc = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    chunks = []
+    with proc:
+        while True:
+            # read1 returns whatever is available instead of waiting for a full buffer
+            chunk = proc.stderr.read1(4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            steps = REBASE_PROGRESS_RE.findall(chunk)
+            if steps:
+                done, total = steps[-1]
+                on_progress(int(done), int(total))
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, b"".join(chunks))
+
+def decode_output(data):
+    """Decodes captured git output (bytes) for display; only done on the error path."""
+    return data.decode('utf-8', errors='replace') if data else ""
+
+
 class GitWorker(QThread):
     """Generic worker for running git commands in a separate thread."""
     finished = Signal(bool, str, str)  # (success, stdout, stderr)
@@ -53,6 +333,37 @@ class GitWorker(QThread):
             self.finished.emit(False, "", str(e))
 
 
+class GitTaskSignals(QObject):
+    finished = Signal(object, object)  # (result, error)
+
+
+class RebaseProgressSignals(QObject):
+    advanced = Signal(int, int)  # (done, total)
+
+
+class GitTask(QRunnable):
+    """Runs a callable on the global QThreadPool and reports back via a signal."""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = GitTaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            result, error = None, e
+        else:
+            error = None
+        try:
+            self.signals.finished.emit(result, error)
+        except RuntimeError:
+            pass  # Owner went away (e.g. window closed) while the task was running
+
+
 class HelpDialog(QDialog):
     """Simple Help dialog with links to Video Demo, Readme, and Mail to Author."""
 
@@ -60,6 +371,9 @@ class HelpDialog(QDialog):
     README_URL = "https://github.com/shyjun/git-interactive-rebase-gui-tool/blob/master/README.md"
     MAILTO = "mailto:n.shyju@gmail.com"
 
+    # Decoded 32x32 icons by path, shared by every HelpDialog instance
+    _ICON_CACHE = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Help")
@@ -88,9 +402,6 @@ class HelpDialog(QDialog):
             QPushButton.help-btn:pressed {
                 background-color: #ececec;
             }
-            QLabel.help-icon {
-                margin-right: 10px;
-            }
             QPushButton.close-btn {
                 background-color: transparent;
                 border: 1px solid #ccc;
@@ -108,31 +419,21 @@ class HelpDialog(QDialog):
         layout.setContentsMargins(25, 25, 25, 20)
 
         def make_help_button(text, icon_path, slot):
-            btn = QPushButton(self)
+            # Icon and text are drawn by the button itself, no child layout/labels needed
+            btn = QPushButton(text, self)
             btn.setObjectName("help_button")
             btn.setCursor(Qt.PointingHandCursor)
             btn.setMinimumHeight(60)
             btn.setProperty("class", "help-btn")
-            btn.setStyleSheet("QPushButton { padding-left: 60px; }") # Space for icon
+            btn.setStyleSheet("QPushButton { padding-left: 15px; font-size: 15px; color: #444; }")
+
+            pixmap = HelpDialog._ICON_CACHE.get(icon_path)
+            if pixmap is None:
+                # A missing file just gives a null pixmap, i.e. no icon
+                pixmap = HelpDialog._ICON_CACHE[icon_path] = QIcon(icon_path).pixmap(32, 32)
+            btn.setIcon(QIcon(pixmap))
+            btn.setIconSize(QSize(32, 32))
 
-            # Create an icon label and overlay it or use layout
-            btn_layout = QHBoxLayout(btn)
-            btn_layout.setContentsMargins(15, 0, 15, 0)
-            
-            icon_label = QLabel()
-            if os.path.exists(icon_path):
-                pixmap = QIcon(icon_path).pixmap(32, 32)
-                icon_label.setPixmap(pixmap)
-            icon_label.setFixedSize(32, 32)
-            icon_label.setStyleSheet("background: transparent;")
-            
-            text_label = QLabel(text)
-            text_label.setStyleSheet("font-size: 15px; color: #444; background: transparent;")
-            
-            btn_layout.addWidget(icon_label)
-            btn_layout.addWidget(text_label)
-            btn_layout.addStretch()
-            
             btn.clicked.connect(slot)
             return btn
 
@@ -178,12 +479,18 @@ class CommitItemDelegate(QStyledItemDelegate):
         
         widget = option.widget
         main_win = widget.window() if widget else None
-        sha = index.data(Qt.DisplayRole).split()[0] if index.data(Qt.DisplayRole) else ""
+        sha = index.data(Qt.UserRole) or ""
         is_marked = main_win and getattr(main_win, 'marked_shas', None) and sha in main_win.marked_shas
         
+        if main_win is not None and getattr(main_win, 'multi_select_mode', False):
+            # Multi-select checkboxes are drawn from main_win._checked_shas, so
+            # entering/leaving the mode never touches the items themselves
+            opt.features |= QStyleOptionViewItem.HasCheckIndicator
+            opt.checkState = Qt.Checked if sha in main_win._checked_shas else Qt.Unchecked
+
         painter.save()
         if is_marked and not (opt.state & QStyle.State_Selected):
-            is_dark = main_win.settings.value("theme", "light") == "dark" if main_win else True
+            is_dark = getattr(main_win, "_applied_theme", None) == "dark" if main_win else True
             marked_bg = QColor("#000000") if is_dark else QColor("#e0e0e0")
             painter.fillRect(option.rect, marked_bg)
         painter.restore()
@@ -205,7 +512,7 @@ class CommitItemDelegate(QStyledItemDelegate):
         if branch_text:
             branches = branch_text.split(", ")
             current_x = text_rect.left()
-            is_dark = main_win.settings.value("theme", "light") == "dark" if main_win else True
+            is_dark = getattr(main_win, "_applied_theme", None) == "dark" if main_win else True
             
             # Setup bold font
             bold_font = QFont(opt.font)
@@ -252,6 +559,34 @@ class CommitItemDelegate(QStyledItemDelegate):
             
         painter.restore()
 
+    def editorEvent(self, event, model, option, index):
+        """Toggles the multi-select checkbox on click or Space, like a checkable item would."""
+        widget = option.widget
+        main_win = widget.window() if widget else None
+        if main_win is None or not getattr(main_win, 'multi_select_mode', False):
+            return super().editorEvent(event, model, option, index)
+
+        if event.type() in (QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick):
+            if event.button() != Qt.LeftButton:
+                return False
+            opt = QStyleOptionViewItem(option)
+            self.initStyleOption(opt, index)
+            opt.features |= QStyleOptionViewItem.HasCheckIndicator
+            style = widget.style() if widget else QApplication.style()
+            check_rect = style.subElementRect(QStyle.SE_ItemViewItemCheckIndicator, opt, widget)
+            if not check_rect.contains(event.position().toPoint()):
+                return False
+            if event.type() == QEvent.MouseButtonDblClick:
+                return True  # eat the double click so it doesn't open the commit
+        elif event.type() == QEvent.KeyPress:
+            if event.key() not in (Qt.Key_Space, Qt.Key_Select):
+                return False
+        else:
+            return False
+
+        main_win.toggle_multi_select(index.data(Qt.UserRole))
+        return True
+
 class CommitListWidget(QListWidget):
     """Subclassed QListWidget to handle Drag & Drop move confirmation."""
     def __init__(self, main_window):
@@ -272,7 +607,7 @@ class CommitListWidget(QListWidget):
                 super().dropEvent(event)
                 return
 
-            sha = dragged_item.text().split()[0]
+            sha = dragged_item.data(Qt.UserRole)
             
             # Identify the target location to give a more descriptive message
             # event.position() returns QPointF, indexAt() needs QPoint
@@ -282,37 +617,77 @@ class CommitListWidget(QListWidget):
                 target_msg = "to the end of the list"
             else:
                 target_item = self.item(target_row)
-                target_sha = target_item.text().split()[0] if target_item else "N/A"
-                target_msg = f"near commit <b>{target_sha}</b>"
+                target_sha = target_item.data(Qt.UserRole) if target_item else "N/A"
+                target_msg = f"near commit <b>{target_sha[:8]}</b>"
 
             # Ask for confirmation BEFORE any visual change in the list
             reply = QMessageBox.question(
                 self, 
                 "Confirm Reorder",
-                f"Do you want to move commit <b>{sha}</b> {target_msg}?",
+                f"Do you want to move commit <b>{sha[:8]}</b> {target_msg}?",
                 QMessageBox.Yes | QMessageBox.No, 
                 QMessageBox.No
             )
             
             if reply == QMessageBox.Yes:
                 # Capture the original order BEFORE the move
-                original_shas = [self.item(i).text().split()[0] for i in range(self.count())]
+                original_shas = [self.item(i).data(Qt.UserRole) for i in range(self.count())]
                 
                 # Now perform the visual move
                 super().dropEvent(event)
                 
-                # Capture the new order and perform rebase
-                new_shas = [self.item(i).text().split()[0] for i in range(self.count())]
+                # Derive the new order from the dragged row's new position instead of
+                # walking every item again
+                new_row = self.row(dragged_item)
+                if new_row >= 0:
+                    new_shas = list(original_shas)
+                    new_shas.remove(sha)
+                    new_shas.insert(new_row, sha)
+                else:
+                    new_shas = [self.item(i).data(Qt.UserRole) for i in range(self.count())]
                 self.main_window.perform_move(new_shas, original_shas)
             else:
                 # If No, ignore the drop event completely so the list does not change
                 event.ignore()
         except Exception as e:
-            print(f"[DRAG-DROP ERROR] {e}")
+            logger.error("Drag-drop failed: %s", e)
             import traceback
             traceback.print_exc()
 
+    def restore_order(self, shas, removed=()):
+        """
+        Puts the rows back into the given SHA order (latest-first) without re-reading
+        git history; rows whose SHA is in removed are taken out. Returns False and
+        leaves the list untouched unless shas and removed name exactly the current rows
+        (e.g. a page was appended meanwhile), so the caller can reload history instead.
+        """
+        current_shas = [self.item(row).data(Qt.UserRole) for row in range(self.count())]
+        if len(set(shas)) != len(shas) or set(shas) | set(removed) != set(current_shas):
+            return False
+        current = self.currentItem()
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            rows = {}
+            while self.count():
+                hidden = self.item(0).isHidden()
+                item = self.takeItem(0)
+                rows[item.data(Qt.UserRole)] = (item, hidden)
+            for sha in shas:
+                item, hidden = rows[sha]
+                self.addItem(item)
+                item.setHidden(hidden)
+            if current is not None and current.listWidget() is self:
+                self.setCurrentItem(current)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        return True
+
 class GitInteractiveRebaseApp(QMainWindow):
+    # Monospace fonts by point size, reused across zoom steps
+    _FONT_CACHE = {}
+
     def __init__(self, repo_path, commit_sha, app_start_time, base_branch=None):
         super().__init__()
         self.repo_path = repo_path
@@ -320,21 +695,47 @@ class GitInteractiveRebaseApp(QMainWindow):
         self.app_start_time = app_start_time
         self.base_branch = base_branch  # set only when auto-detected; None when SHA provided manually
         self.start_time_full_head = get_full_head_sha(self.repo_path)
-        self.start_time_head = get_head_sha(self.repo_path)
+        # Full SHA (shown abbreviated); saves a second rev-parse and is never ambiguous
+        self.start_time_head = self.start_time_full_head
         self.last_head = None
         self.best_commit_sha = None
         self.marked_shas = set()
+        # Persistent git process for diff/object lookups (View, Drop, side diff)
+        self.git_batch = GitCatFileBatch(self.repo_path)
+        # Session folder for rebase scripts and messages; anything a failed rebase
+        # leaves behind goes with it on close (or at interpreter exit)
+        self._tmpdir = tempfile.mkdtemp(prefix="git_irebase_")
+        atexit.register(shutil.rmtree, self._tmpdir, ignore_errors=True)
+        # Open `git log` stream; further pages are pulled as the list is scrolled
+        self._history_stream = None
+        self._history_branch_map = {}
+        self._applied_theme = None
+        self._context_menu = None
+        self._context_item = None
+        self._view_dialog = None
+        self._help_dialog = None
+        # Fire-and-forget pool tasks, held until they report back (see start_background)
+        self._background_tasks = {}
+        self._background_task_ids = itertools.count()
+        # Bumped per failsafe refresh so a stale `git status` result is ignored
+        self._failsafe_check = 0
+        self._failsafe_status_running = False
+        self._failsafe_status_wanted = False
+        # (sha, filewise) the side panel is currently showing; stale background loads are dropped
+        self._side_diff_key = None
         
         # Global application icon is handled in the main entry point
         
         # Persistence
         self.settings = QSettings("shyjun", "GitInteractiveRebase")
-        self.current_font_size = int(self.settings.value("font_size", 10))
-        self.show_diffs = self.settings.value("show_diffs", False, type=bool)
-        self.show_origin_options = self.settings.value("show_origin_options", False, type=bool)
-        self.show_rebase_options = self.settings.value("show_rebase_options", False, type=bool)
-        self.show_squash_options = self.settings.value("show_squash_options", True, type=bool)
-        self.show_local_branches = self.settings.value("show_local_branches", False, type=bool)
+        # Last known value of every setting we read or wrote, so unchanged values aren't rewritten
+        self._settings_cache = {}
+        self.current_font_size = self._get_setting("font_size", 10, int)
+        self.show_diffs = self._get_setting("show_diffs", False, bool)
+        self.show_origin_options = self._get_setting("show_origin_options", False, bool)
+        self.show_rebase_options = self._get_setting("show_rebase_options", False, bool)
+        self.show_squash_options = self._get_setting("show_squash_options", True, bool)
+        self.show_local_branches = self._get_setting("show_local_branches", False, bool)
         
         self.setWindowTitle(f"git-interactive-rebase-gui-tool : branch=..., HEAD=..., path={self.repo_path}") # Temporary name until load_history updates it
         self.resize(1100, 800)
@@ -343,23 +744,41 @@ class GitInteractiveRebaseApp(QMainWindow):
         self.setup_ui()
         self.load_settings()
         self.restore_visibility_settings()
+        # History and branch checks run once the event loop starts, so the window
+        # is shown and painted before the first `git log`
+        QTimer.singleShot(0, self._load_initial_state)
+        # Warm the diff cache for the newest commits with one `git log -p` in the background
+        self.start_background(self.git_batch.prefetch_diffs, f"{self.commit_sha}..HEAD")
+        # First run on a repo without a commit-graph: build one so later refreshes walk it
+        self.start_background(ensure_commit_graph, self.repo_path)
+
+    def _load_initial_state(self):
         self.load_history()
         self.update_rebase_buttons()
 
+    def _get_setting(self, key, default, value_type):
+        value = self.settings.value(key, default, type=value_type)
+        self._settings_cache[key] = value
+        return value
+
+    def _set_setting(self, key, value):
+        """Writes a setting only if it differs from the last value read or written."""
+        if key in self._settings_cache and self._settings_cache[key] == value:
+            return
+        self._settings_cache[key] = value
+        self.settings.setValue(key, value)
+
     def load_settings(self):
         """Loads persistent user settings like font size and theme."""
         # Diff Tab
-        diff_tab_index = self.settings.value("diff_tab_index", 0, type=int)
+        diff_tab_index = self._get_setting("diff_tab_index", 0, int)
         if hasattr(self, 'diff_tab_widget'):
             self.diff_tab_widget.setCurrentIndex(diff_tab_index)
             
-        # Font Size
-        size = self.settings.value("font_size", 10, type=int)
-        self.current_font_size = size
-        self.update_font()
-        
+        # Font size was read in __init__; apply_theme() below applies it via update_font()
+
         # Theme
-        theme = self.settings.value("theme", "light", type=str)
+        theme = self._get_setting("theme", "light", str)
         if theme == "dark":
             self.dark_radio.setChecked(True)
         else:
@@ -384,10 +803,17 @@ class GitInteractiveRebaseApp(QMainWindow):
         self.settings.setValue("geometry", self.saveGeometry())
         self.settings.setValue("windowState", self.saveState())
         self.settings.setValue("isMaximized", self.isMaximized())
+        self.settings.sync()
+        # Let pending prefetch tasks finish before the git processes go away
+        QThreadPool.globalInstance().waitForDone(2000)
+        self._close_history_stream()
+        self.git_batch.close()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
         super().closeEvent(event)
-    def update_window_title(self):
+    def update_window_title(self, branch=None):
         """Updates window title with branch, HEAD, and path."""
-        branch = get_current_branch(self.repo_path)
+        if branch is None:
+            branch = get_current_branch(self.repo_path)
         app_time = self.app_start_time if self.app_start_time else "N/A"
         title = f"git-interactive-rebase-gui-tool : branch={branch}, path={self.repo_path}, app_start_time={app_time}"
         self.setWindowTitle(title)
@@ -415,6 +841,8 @@ class GitInteractiveRebaseApp(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         layout = QVBoxLayout(central_widget)
+        # Created up front so the first copy notice doesn't shift the layout
+        self.statusBar()
         
         # Use our custom list widget
         self.list_widget = CommitListWidget(self)
@@ -422,13 +850,25 @@ class GitInteractiveRebaseApp(QMainWindow):
         self.update_font()
         self.list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
         self.list_widget.customContextMenuRequested.connect(self.show_context_menu)
+        self.list_widget.verticalScrollBar().valueChanged.connect(self._on_history_scrolled)
+        # Row SHAs are read back from Qt once and reused until the list model changes
+        self._sha_list = None
+        model = self.list_widget.model()
+        for signal in (model.rowsInserted, model.rowsRemoved, model.rowsMoved, model.modelReset, model.layoutChanged):
+            signal.connect(self._invalidate_sha_list)
+        model.dataChanged.connect(self._on_list_data_changed)
         
         # Search / Filter Bar
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search commits (SHA or Message)...")
         self.search_edit.setClearButtonEnabled(True)
         self.search_edit.setMinimumHeight(35)
-        self.search_edit.textChanged.connect(self.filter_commits)
+        # Filter once typing pauses instead of re-scanning the list on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(lambda: self.filter_commits(self.search_edit.text()))
+        self.search_edit.textChanged.connect(lambda _text: self._filter_timer.start())
         layout.addWidget(self.search_edit)
 
         # Main Splitter
@@ -468,6 +908,7 @@ class GitInteractiveRebaseApp(QMainWindow):
         # Page 0: Plain Diff
         self.side_diff_view = QTextEdit()
         self.side_diff_view.setReadOnly(True)
+        configure_diff_view(self.side_diff_view)
         self.diff_tab_widget.addTab(self.side_diff_view, "Plain Diff")
         
         # Page 1: Filewise Diff
@@ -485,10 +926,11 @@ class GitInteractiveRebaseApp(QMainWindow):
         # File diff
         self.filewise_diff_view = QTextEdit()
         self.filewise_diff_view.setReadOnly(True)
+        configure_diff_view(self.filewise_diff_view)
         self.filewise_diff_view.setMinimumHeight(100)
         
         # Apply highlighter
-        self.filewise_highlighter = DiffHighlighter(self.filewise_diff_view.document())
+        self.filewise_highlighter = DiffHighlighter(self.filewise_diff_view.document(), text_edit=self.filewise_diff_view)
         
         self.filewise_splitter.addWidget(self.filewise_file_list)
         self.filewise_splitter.addWidget(self.filewise_diff_view)
@@ -520,11 +962,21 @@ class GitInteractiveRebaseApp(QMainWindow):
         layout.addWidget(self.main_splitter, 1)
         
         self.list_widget.itemDoubleClicked.connect(self.view_commit)
-        self.list_widget.itemSelectionChanged.connect(self.update_side_diff)
+        self._neighbour_prefetch_timer = QTimer(self)
+        self._neighbour_prefetch_timer.setSingleShot(True)
+        self._neighbour_prefetch_timer.setInterval(NEIGHBOUR_PREFETCH_DELAY_MS)
+        self._neighbour_prefetch_timer.timeout.connect(self._prefetch_neighbour_diffs)
+        # Holding an arrow key changes the selection for every row passed; only the
+        # row the user stops on is loaded
+        self._side_diff_timer = QTimer(self)
+        self._side_diff_timer.setSingleShot(True)
+        self._side_diff_timer.setInterval(SIDE_DIFF_DEBOUNCE_MS)
+        self._side_diff_timer.timeout.connect(self.update_side_diff)
+        self.list_widget.itemSelectionChanged.connect(self._side_diff_timer.start)
+        self.list_widget.currentItemChanged.connect(self._prefetch_diff)
         
         self.diff_tab_widget.currentChanged.connect(self.on_diff_tab_changed)
-        
-        self.update_window_title()
+        # Window title is set by load_history(), which already reads the branch
 
         # Bottom Control Bar
         controls_layout = QHBoxLayout()
@@ -581,7 +1033,11 @@ class GitInteractiveRebaseApp(QMainWindow):
         self.help_btn.clicked.connect(self._show_help_dialog)
         self.undo_btn.clicked.connect(self.handle_undo)
         self.check_update_btn.clicked.connect(self.handle_check_for_updates)
-        self.refresh_btn.clicked.connect(self.handle_manual_refresh)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self.handle_manual_refresh)
+        self.refresh_btn.clicked.connect(lambda _checked=False: self._refresh_timer.start())
         self.failsafe_btn.clicked.connect(self.handle_failsafe_reset)
         self.best_commit_btn.clicked.connect(self.handle_best_commit_reset)
         self.custom_reset_btn.clicked.connect(self.handle_custom_reset)
@@ -639,6 +1095,8 @@ class GitInteractiveRebaseApp(QMainWindow):
 
         # Squash multiple commits group
         self.multi_select_mode = False
+        # SHAs of the checked rows; the delegate paints the checkboxes from this set
+        self._checked_shas = set()
         self.squash_group = QGroupBox("Squash multiple commits")
         self.squash_group.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         squash_layout = QHBoxLayout()
@@ -705,11 +1163,76 @@ class GitInteractiveRebaseApp(QMainWindow):
         self.esc_shortcut.activated.connect(self.handle_esc_shortcut)
 
         self.f5_shortcut = QShortcut(QKeySequence("F5"), self)
-        self.f5_shortcut.activated.connect(self.handle_manual_refresh)
+        self.f5_shortcut.activated.connect(self._refresh_timer.start)
+
+    def run_in_background(self, fn, *args, progress_title=None, progress_text=None, **kwargs):
+        """
+        Runs fn(*args, **kwargs) on the thread pool while the UI keeps painting,
+        optionally behind a ProgressDialog. Returns the result or re-raises its error.
+        """
+        progress = None
+        if progress_title:
+            progress = ProgressDialog(progress_title, progress_text or "", self)
+            progress.show()
+
+        outcome = {}
+        loop = QEventLoop()
+
+        def on_finished(result, error):
+            outcome["result"] = result
+            outcome["error"] = error
+            loop.quit()
+
+        # The nested loop keeps delivering input; unless a modal dialog already holds it,
+        # the window is disabled so no other action can start on the SHAs the caller
+        # is still working with
+        lock_window = progress is None and QApplication.activeModalWidget() is None and self.isEnabled()
+        focus = QApplication.focusWidget() if lock_window else None
+        if lock_window:
+            self.setEnabled(False)
+
+        task = GitTask(fn, *args, **kwargs)
+        task.signals.finished.connect(on_finished)
+        # The user is blocked on this one, so it goes ahead of queued prefetches
+        QThreadPool.globalInstance().start(task, INTERACTIVE_TASK_PRIORITY)
+        try:
+            loop.exec()
+        finally:
+            if lock_window:
+                self.setEnabled(True)
+                if focus is not None and self.isAncestorOf(focus):
+                    focus.setFocus()
+
+        if progress:
+            progress.close()
+        if outcome["error"] is not None:
+            raise outcome["error"]
+        return outcome["result"]
+
+    def start_background(self, fn, *args, on_finished=None, priority=0):
+        """
+        Starts fn(*args) on the thread pool without waiting for it; on_finished(result, error)
+        is then called on the UI thread. Queued tasks with a higher priority start first.
+        The task is kept referenced until it reports back, otherwise its signal object
+        could be collected while it is still running.
+        """
+        task_id = next(self._background_task_ids)
+        task = GitTask(fn, *args)
+        self._background_tasks[task_id] = task
+        task.signals.finished.connect(partial(self._on_background_finished, task_id, on_finished))
+        QThreadPool.globalInstance().start(task, priority)
+
+    def _on_background_finished(self, task_id, on_finished, result, error):
+        self._background_tasks.pop(task_id, None)
+        if on_finished is not None:
+            on_finished(result, error)
 
     def update_side_diff(self):
+        # A direct call supersedes any debounced one still pending
+        self._side_diff_timer.stop()
         item = self.list_widget.currentItem()
         if not item:
+            self._side_diff_key = None
             if hasattr(self, 'side_commit_label'):
                 self.side_commit_label.setText("Select a commit to view details")
                 self.side_commit_msg.clear()
@@ -719,41 +1242,104 @@ class GitInteractiveRebaseApp(QMainWindow):
                 self.filewise_diff_view.clear()
             return
 
-        sha = item.text().split()[0]
+        if not self.show_diffs:
+            # Panel is hidden: nothing to show, so don't fetch anything either.
+            # toggle_side_diff_visibility() loads the current commit when it is shown.
+            self._side_diff_key = None
+            return
+
+        sha = item.data(Qt.UserRole)
+        filewise = self.diff_tab_widget.currentIndex() != 0
+        self._side_diff_key = (sha, filewise)
         try:
-            meta = get_commit_metadata(self.repo_path, sha)
-            msg = get_full_commit_message(self.repo_path, sha)
+            # Header and message come from the cat-file cache; only the diff (or the
+            # file list) may need a git round-trip, so that part is loaded off the UI thread
+            meta = self.git_batch.get_commit_metadata(sha)
+            msg = self.git_batch.get_commit_message(sha)
             
             self.side_commit_label.setText(f"Commit: <b>{sha}</b>  <span style='color:gray;'>({meta})</span>")
             self.side_commit_msg.setPlainText(msg)
-            
-            if self.diff_tab_widget.currentIndex() == 0:
-                diff_text = get_commit_diff(self.repo_path, sha)
-                self.side_diff_view.setPlainText(diff_text)
-            else:
-                self.side_diff_view.clear()
-                files = get_commit_files(self.repo_path, sha)
-                # Temporarily block signals to avoid triggering on_filewise_file_selected prematurely
-                self.filewise_file_list.blockSignals(True)
-                self.filewise_file_list.clear()
-                for f in files:
-                    self.filewise_file_list.addItem(f)
-                self.filewise_file_list.blockSignals(False)
-                
-                if files:
-                    self.filewise_file_list.setCurrentRow(0)
-                else:
-                    self.filewise_diff_view.clear()
         except Exception as e:
-            self.side_diff_view.setPlainText(f"Error loading diff: {e}")
-            if hasattr(self, 'side_commit_msg'):
-                self.side_commit_msg.clear()
-                self.side_commit_label.setText("Error")
-            if hasattr(self, 'filewise_diff_view'):
-                self.filewise_diff_view.setPlainText(f"Error loading diff: {e}")
+            self._show_side_diff_error(e)
+            return
+
+        if not filewise:
+            # Users mostly step through neighbouring commits; warm those once scrolling pauses
+            self._neighbour_prefetch_timer.start()
+            diff_text = self.git_batch.peek_diff(sha)
+            if diff_text is not None:
+                self.side_diff_view.setPlainText(clip_diff(diff_text))
+                return
+            self.side_diff_view.setPlainText("Loading diff...")
+            self.start_background(self.git_batch.get_diff, sha,
+                                  on_finished=partial(self._on_side_diff_loaded, sha, filewise),
+                                  priority=INTERACTIVE_TASK_PRIORITY)
+        else:
+            self.side_diff_view.clear()
+            # Temporarily block signals to avoid triggering on_filewise_file_selected prematurely
+            self.filewise_file_list.blockSignals(True)
+            self.filewise_file_list.clear()
+            self.filewise_file_list.blockSignals(False)
+            self.filewise_diff_view.setPlainText("Loading files...")
+            self.start_background(self.git_batch.get_commit_files, sha,
+                                  on_finished=partial(self._on_side_diff_loaded, sha, filewise),
+                                  priority=INTERACTIVE_TASK_PRIORITY)
+
+    def _on_side_diff_loaded(self, sha, filewise, result, error):
+        """Applies a background side-panel load, unless the selection moved on meanwhile."""
+        if self._side_diff_key != (sha, filewise):
+            return
+        if error is not None:
+            self._show_side_diff_error(error)
+            return
+        if not filewise:
+            self.side_diff_view.setPlainText(clip_diff(result))
+            return
+        # Temporarily block signals to avoid triggering on_filewise_file_selected prematurely
+        self.filewise_file_list.blockSignals(True)
+        self.filewise_file_list.clear()
+        self.filewise_file_list.addItems(result)
+        self.filewise_file_list.blockSignals(False)
+
+        if result:
+            self.filewise_file_list.setCurrentRow(0)
+        else:
+            self.filewise_diff_view.clear()
+
+    def _prefetch_neighbour_diffs(self):
+        """Fetches the diffs of the rows around the selection in one background task."""
+        row = self.list_widget.currentRow()
+        if row < 0:
+            return
+        shas = []
+        for offset in range(1, NEIGHBOUR_PREFETCH_ROWS + 1):
+            for neighbour in (row + offset, row - offset):
+                item = self.list_widget.item(neighbour) if neighbour >= 0 else None
+                if item is not None and self.git_batch.peek_diff(item.data(Qt.UserRole)) is None:
+                    shas.append(item.data(Qt.UserRole))
+        if shas:
+            self.start_background(self.git_batch.warm_diffs, shas)
+
+    def _show_side_diff_error(self, e):
+        self.side_diff_view.setPlainText(f"Error loading diff: {e}")
+        if hasattr(self, 'side_commit_msg'):
+            self.side_commit_msg.clear()
+            self.side_commit_label.setText("Error")
+        if hasattr(self, 'filewise_diff_view'):
+            self.filewise_diff_view.setPlainText(f"Error loading diff: {e}")
+
+    def _prefetch_diff(self, item, previous=None):
+        """Warms the diff cache for the selected commit so View/Drop open instantly."""
+        if not item:
+            return
+        # The side panel already loads the diff itself when it is showing it
+        if self.show_diffs and self.diff_tab_widget.currentIndex() == 0:
+            return
+        sha = item.data(Qt.UserRole)
+        self.start_background(self.git_batch.get_diff, sha)
 
     def on_diff_tab_changed(self, index):
-        self.settings.setValue("diff_tab_index", index)
+        self._set_setting("diff_tab_index", index)
         self.update_side_diff()
 
     def on_filewise_file_selected(self, filepath):
@@ -763,10 +1349,10 @@ class GitInteractiveRebaseApp(QMainWindow):
         item = self.list_widget.currentItem()
         if not item:
             return
-        sha = item.text().split()[0]
+        sha = item.data(Qt.UserRole)
         try:
-            diff = get_file_diff_only_in_commit(self.repo_path, sha, filepath)
-            self.filewise_diff_view.setPlainText(diff)
+            diff = self.git_batch.get_file_diff(sha, filepath)
+            self.filewise_diff_view.setPlainText(clip_diff(diff))
         except Exception as e:
             self.filewise_diff_view.setPlainText(f"Error loading diff: {e}")
 
@@ -774,12 +1360,15 @@ class GitInteractiveRebaseApp(QMainWindow):
         new_visibility = not self.right_panel.isVisible()
         self.right_panel.setVisible(new_visibility)
         self.show_diffs = new_visibility
-        self.settings.setValue("show_diffs", self.show_diffs)
+        self._set_setting("show_diffs", self.show_diffs)
+        if new_visibility:
+            self.update_side_diff()
 
     def _show_help_dialog(self):
-        """Opens the Help dialog."""
-        dialog = HelpDialog(self)
-        dialog.exec()
+        """Opens the Help dialog (built on first use, then reused)."""
+        if self._help_dialog is None:
+            self._help_dialog = HelpDialog(self)
+        self._help_dialog.exec()
 
     def handle_slash_shortcut(self):
         """Focus search bar when / is pressed."""
@@ -798,17 +1387,22 @@ class GitInteractiveRebaseApp(QMainWindow):
     def filter_commits(self, text):
         """Live-filters the commits in the list based on search text."""
         search_term = text.lower()
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            # Match against SHA or Message
-            item_text = item.text().lower()
-            if search_term in item_text:
-                item.setHidden(False)
-            else:
-                item.setHidden(True)
+        if search_term and self._history_stream is not None:
+            # Filtering must see every commit, not just the pages scrolled so far
+            self._load_history_page(None)
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            for i in range(self.list_widget.count()):
+                item = self.list_widget.item(i)
+                # Match against SHA or Message (lowercased once in _add_history_items)
+                hidden = search_term not in item.data(Qt.UserRole + 2)
+                if item.isHidden() != hidden:
+                    item.setHidden(hidden)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
 
     def handle_set_best_commit(self, item):
-        sha = item.text().split()[0]
+        sha = item.data(Qt.UserRole)
         self.best_commit_sha = sha
         self.best_commit_btn.setText(f"Reset Hard to BEST_COMMITID ({sha[:8]})")
         self.best_commit_btn.setEnabled(True)
@@ -865,12 +1459,13 @@ class GitInteractiveRebaseApp(QMainWindow):
         )
         if reply == QMessageBox.Yes:
             try:
-                subprocess.run(["git", "reset", "--hard", self.last_head], cwd=self.repo_path, check=True, capture_output=True, text=True, encoding='utf-8', errors='replace')
+                self.run_in_background(subprocess.run, ["git", "reset", "--hard", self.last_head], cwd=self.repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                       progress_title="Undoing", progress_text=f"Resetting to {self.last_head[:8]}. Please wait...")
                 QMessageBox.information(self, "Success", f"Successfully undid the last operation (reset to {self.last_head[:8]}).")
                 self.last_head = None
                 self.undo_btn.setEnabled(False)
             except subprocess.CalledProcessError as e:
-                QMessageBox.critical(self, "Undo Failed", f"Could not perform undo.\n\nError: {e.stderr}")
+                QMessageBox.critical(self, "Undo Failed", f"Could not perform undo.\n\nError: {decode_output(e.stderr)}")
             finally:
                 self.load_history()
 
@@ -895,7 +1490,6 @@ class GitInteractiveRebaseApp(QMainWindow):
         else:
             # Check for app_version.json (pip install case)
             try:
-                from lib.utils import get_assets_path
                 import json
 
                 assets_dir = get_assets_path()
@@ -940,9 +1534,9 @@ class GitInteractiveRebaseApp(QMainWindow):
             remote_sha = stdout.split()[0]
             
             # Debug prints
-            print(f"[DEBUG] Check for Updates:")
-            print(f"        Local SHA:  {local_sha}")
-            print(f"        Remote SHA: {remote_sha}")
+            logger.debug("Check for Updates:")
+            logger.debug("        Local SHA:  %s", local_sha)
+            logger.debug("        Remote SHA: %s", remote_sha)
             
             if remote_sha == local_sha:
                 QMessageBox.information(self, "No Updates", "You are already using the latest version.")
@@ -981,7 +1575,7 @@ class GitInteractiveRebaseApp(QMainWindow):
 
     def handle_git_fetch(self):
         """Runs git fetch."""
-        print("Running git fetch...")
+        logger.debug("Running git fetch...")
         self.progress_dialog = ProgressDialog("Git Fetching", "git fetch in progress...", self)
         
         self.worker = GitWorker(["git", "fetch"], self.repo_path)
@@ -1003,18 +1597,15 @@ class GitInteractiveRebaseApp(QMainWindow):
 
     def handle_git_reset_hard_origin(self):
         """Runs git reset --hard origin/<current_branch>."""
-        branch = get_current_branch(self.repo_path)
+        branch, head_sha = get_head_state(self.repo_path)
         origin_ref = f"origin/{branch}"
         
         # Check if HEAD is already at origin_ref
-        try:
-            head_sha = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=self.repo_path).decode('utf-8').strip()
-            origin_sha = subprocess.check_output(["git", "rev-parse", origin_ref], cwd=self.repo_path).decode('utf-8').strip()
-            if head_sha == origin_sha:
-                QMessageBox.information(self, "Nothing to do", f"Current HEAD is same as {origin_ref} HEAD. Nothing to do.")
-                return
-        except Exception:
-            pass # Probably origin_ref doesn't exist, proceed to confirmation which will fail naturally if so
+        # (if origin_ref doesn't exist, proceed to confirmation which will fail naturally)
+        origin_sha = self.git_batch.resolve_commit(origin_ref)
+        if origin_sha is not None and head_sha == origin_sha:
+            QMessageBox.information(self, "Nothing to do", f"Current HEAD is same as {origin_ref} HEAD. Nothing to do.")
+            return
             
         reply = QMessageBox.question(
             self, 
@@ -1026,12 +1617,13 @@ class GitInteractiveRebaseApp(QMainWindow):
         )
         if reply == QMessageBox.Yes:
             self.save_undo_state()
-            print(f"Resetting hard to {origin_ref}...")
+            logger.debug("Resetting hard to %s...", origin_ref)
             try:
-                subprocess.run(["git", "reset", "--hard", origin_ref], cwd=self.repo_path, check=True, capture_output=True, text=True, encoding='utf-8', errors='replace')
+                self.run_in_background(subprocess.run, ["git", "reset", "--hard", origin_ref], cwd=self.repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                       progress_title="Resetting", progress_text=f"Resetting to {origin_ref}. Please wait...")
                 QMessageBox.information(self, "Success", f"Successfully reset --hard to {origin_ref}.")
             except subprocess.CalledProcessError as e:
-                QMessageBox.critical(self, "Reset Failed", f"Could not perform reset to {origin_ref}.\n\nError: {e.stderr}")
+                QMessageBox.critical(self, "Reset Failed", f"Could not perform reset to {origin_ref}.\n\nError: {decode_output(e.stderr)}")
             finally:
                 self.load_history()
 
@@ -1046,7 +1638,7 @@ class GitInteractiveRebaseApp(QMainWindow):
             QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            print("Performing git push --force...")
+            logger.debug("Performing git push --force...")
             self.progress_dialog = ProgressDialog("Git Pushing", "git push --force in progress...", self)
             
             self.worker = GitWorker(["git", "push", "--force"], self.repo_path)
@@ -1098,13 +1690,14 @@ class GitInteractiveRebaseApp(QMainWindow):
         )
         if reply == QMessageBox.Yes:
             self.save_undo_state()
-            print(f"Rebasing onto {target}...")
+            logger.debug("Rebasing onto %s...", target)
             try:
-                subprocess.run(["git", "rebase", target], cwd=self.repo_path, check=True, capture_output=True, text=True)
+                self.run_in_background(subprocess.run, ["git", "rebase", target], cwd=self.repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                       progress_title="Rebasing", progress_text=f"Rebasing onto {target}. Please wait...")
                 QMessageBox.information(self, "Success", f"Successfully rebased onto {target}.")
                 self.load_history()
             except subprocess.CalledProcessError as e:
-                QMessageBox.critical(self, "Rebase Failed", f"Could not perform rebase onto {target}.\n\nError: {e.stderr}")
+                QMessageBox.critical(self, "Rebase Failed", f"Could not perform rebase onto {target}.\n\nError: {decode_output(e.stderr)}")
 
     def handle_zoom_in(self):
         self.current_font_size += 1
@@ -1118,29 +1711,29 @@ class GitInteractiveRebaseApp(QMainWindow):
     def on_theme_toggled(self):
         theme = "dark" if self.dark_radio.isChecked() else "light"
         self.apply_theme(theme)
-        self.settings.setValue("theme", theme)
+        self._set_setting("theme", theme)
 
     def on_origin_visibility_toggled(self):
         visible = self.show_origin_cb.isChecked()
         self.origin_group.setVisible(visible)
-        self.settings.setValue("show_origin_options", visible)
+        self._set_setting("show_origin_options", visible)
         self.force_window_resize()
 
     def on_rebase_visibility_toggled(self):
         visible = self.show_rebase_cb.isChecked()
         self.rebase_group.setVisible(visible)
-        self.settings.setValue("show_rebase_options", visible)
+        self._set_setting("show_rebase_options", visible)
         self.force_window_resize()
 
     def on_squash_visibility_toggled(self):
         visible = self.show_squash_cb.isChecked()
         self.squash_group.setVisible(visible)
-        self.settings.setValue("show_squash_options", visible)
+        self._set_setting("show_squash_options", visible)
         self.force_window_resize()
 
     def on_local_branches_visibility_toggled(self):
         self.show_local_branches = self.show_local_branches_cb.isChecked()
-        self.settings.setValue("show_local_branches", self.show_local_branches)
+        self._set_setting("show_local_branches", self.show_local_branches)
         self.list_widget.viewport().update()
 
     def force_window_resize(self):
@@ -1160,393 +1753,174 @@ class GitInteractiveRebaseApp(QMainWindow):
 
     def apply_theme(self, theme_name):
         """Applies a theme to the entire application globally."""
-        if theme_name == "dark":
-            # VS Code Dark+ inspired palette
-            self.current_theme_colors = {
-                "added": "#4ec9b0",   # Soft teal/green
-                "removed": "#f48771", # Soft coral/red
-                "header": "#569cd6",  # VS Code blue
-                "bg": "#1e1e1e",      # Main background
-                "fg": "#cccccc",      # Standard text
-                "accent": "#007acc"   # VS Code accent blue
-            }
-            qss = """
-                QMainWindow, QWidget {
-                    background-color: #1e1e1e;
-                    color: #cccccc;
-                }
-                QListWidget {
-                    background-color: #252526;
-                    border: 1px solid #3c3c3c;
-                    border-radius: 8px;
-                    padding: 5px;
-                    color: #cccccc;
-                }
-                QListWidget::item { 
-                    padding: 8px; 
-                    border-bottom: 1px solid #333333; 
-                }
-                QListWidget::item:selected {
-                    background-color: #37373d;
-                    color: #ffffff;
-                }
-                QGroupBox {
-                    border: 1px solid #3c3c3c;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 3px 0 3px;
-                }
-                QPushButton {
-                    background-color: #333333;
-                    color: #cccccc;
-                    border: 1px solid #3c3c3c;
-                    padding: 8px 15px;
-                    border-radius: 5px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #444444;
-                }
-                QPushButton:pressed {
-                    background-color: #007acc;
-                    color: white;
-                }
-                QPushButton.dialog-btn {
-                    background-color: #333333;
-                    border: 1px solid #444444;
-                }
-                QPushButton.dialog-btn:hover {
-                    background-color: #007acc;
-                    color: white;
-                }
-                QLabel {
-                    font-weight: bold;
-                }
-                QDialog, QMenu {
-                    background-color: #1e1e1e;
-                    color: #d4d4d4;
-                    border: 1px solid #3c3c3c;
-                }
-                QMenu::item:selected {
-                    background-color: #007acc;
-                    color: white;
-                }
-                QTextEdit {
-                    background-color: #1e1e1e;
-                    color: #d4d4d4;
-                    border: 1px solid #3c3c3c;
-                    border-radius: 4px;
-                }
-                QScrollBar:vertical {
-                    background: #1e1e1e;
-                    width: 12px;
-                    margin: 0px;
-                }
-                QScrollBar::handle:vertical {
-                    background: #37373d;
-                    min-height: 20px;
-                    border-radius: 6px;
-                }
-                QScrollBar::handle:vertical:hover {
-                    background: #4f4f4f;
-                }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                    height: 0px;
-                }
-            """
-        else:
-            self.current_theme_colors = {
-                "added": "#228b22",  # Darker green for light bg
-                "removed": "#b22222", # Darker red for light bg
-                "header": "#00008b", # Darker blue for light bg
-                "bg": "#f5f5f7",
-                "fg": "#333333",
-                "accent": "#007aff"
-            }
-            qss = """
-                QMainWindow, QWidget {
-                    background-color: #f5f5f7;
-                    color: #333;
-                }
-                QListWidget {
-                    background-color: #ffffff;
-                    border: 1px solid #ddd;
-                    border-radius: 8px;
-                    padding: 5px;
-                    color: #333;
-                }
-                QListWidget::item { 
-                    padding: 8px; 
-                    border-bottom: 1px solid #eee; 
-                }
-                QListWidget::item:selected {
-                    background-color: #007aff;
-                    color: white;
-                }
-                QGroupBox {
-                    border: 1px solid #ccc;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 3px 0 3px;
-                }
-                QPushButton {
-                    background-color: #ffffff;
-                    color: #333;
-                    border: 1px solid #ccc;
-                    padding: 8px 15px;
-                    border-radius: 5px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #f0f0f0;
-                }
-                QPushButton:pressed {
-                    background-color: #d0d0d0;
-                }
-                QPushButton.dialog-btn {
-                    background-color: #e1e1e1;
-                    border: 1px solid #bbb;
-                }
-                QPushButton.dialog-btn:hover {
-                    background-color: #007aff;
-                    color: white;
-                }
-                QLabel {
-                    font-weight: bold;
-                    color: #333;
-                }
-                QDialog, QMenu {
-                    background-color: #f5f5f7;
-                    color: #333;
-                    border: 1px solid #ccc;
-                }
-                QMenu::item:selected {
-                    background-color: #007aff;
-                    color: white;
-                }
-                QTextEdit {
-                    background-color: #ffffff;
-                    color: #333;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                }
-                QScrollBar:vertical {
-                    background: #f5f5f7;
-                    width: 12px;
-                    margin: 0px;
-                }
-                QScrollBar::handle:vertical {
-                    background: #ccc;
-                    min-height: 20px;
-                    border-radius: 6px;
-                }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                    height: 0px;
-                }
-            """
+        if theme_name == self._applied_theme:
+            # Both radio buttons emit toggled() on a switch; restyling the whole app twice is wasted work
+            return
+        self._applied_theme = theme_name
+        colors, qss = _THEMES["dark" if theme_name == "dark" else "light"]
+        self.current_theme_colors = dict(colors)
         
         QApplication.instance().setStyleSheet(qss)
         
-        # Update highlighter colors according to the theme
+        # Update highlighter colors according to the theme (existing highlighters are
+        # recolored in place rather than rebuilt, which would re-highlight from scratch)
+        colors = (self.current_theme_colors["added"], self.current_theme_colors["removed"], self.current_theme_colors["header"])
         if hasattr(self, 'side_diff_view'):
-            if hasattr(self, 'side_highlighter') and self.side_highlighter is not None:
-                self.side_highlighter.setDocument(None)
-            self.side_highlighter = DiffHighlighter(
-                self.side_diff_view.document(),
-                added_color=self.current_theme_colors["added"],
-                removed_color=self.current_theme_colors["removed"],
-                header_color=self.current_theme_colors["header"]
-            )
-            
+            if getattr(self, 'side_highlighter', None) is not None:
+                self.side_highlighter.update_colors(*colors)
+            else:
+                self.side_highlighter = DiffHighlighter(self.side_diff_view.document(), *colors, text_edit=self.side_diff_view)
+
         if hasattr(self, 'filewise_diff_view'):
-            if hasattr(self, 'filewise_highlighter') and self.filewise_highlighter is not None:
-                self.filewise_highlighter.setDocument(None)
-            self.filewise_highlighter = DiffHighlighter(
-                self.filewise_diff_view.document(),
-                added_color=self.current_theme_colors["added"],
-                removed_color=self.current_theme_colors["removed"],
-                header_color=self.current_theme_colors["header"]
-            )
+            if getattr(self, 'filewise_highlighter', None) is not None:
+                self.filewise_highlighter.update_colors(*colors)
+            else:
+                self.filewise_highlighter = DiffHighlighter(self.filewise_diff_view.document(), *colors, text_edit=self.filewise_diff_view)
         
         self.update_font()
         
     def update_font(self):
-        font = QFont("Monospace", self.current_font_size)
-        self.list_widget.setFont(font)
-        if hasattr(self, 'side_diff_view'):
-            self.side_diff_view.setFont(font)
-        if hasattr(self, 'side_commit_msg'):
-            self.side_commit_msg.setFont(font)
-        if hasattr(self, 'filewise_diff_view'):
-            self.filewise_diff_view.setFont(font)
-        if hasattr(self, 'filewise_file_list'):
-            self.filewise_file_list.setFont(font)
-        # Save persistence
-        self.settings.setValue("font_size", self.current_font_size)
-
-    def show_context_menu(self, position):
-        # Allow context menu in multi-select mode, but we will restrict it later
-        pass
-
-        item = self.list_widget.itemAt(position)
-        if not item:
-            return
-            
-        sha = item.text().split()[0]
-        menu = QMenu()
-        menu_font = QFont("Monospace", max(8, self.current_font_size - 2))
-        menu.setFont(menu_font)
-        
-        mark_action = QAction(f"Mark / Unmark commit {sha}", self)
-        view_action = QAction(f"Show / View commit {sha}", self)
-        move_action = QAction("Move (Drag item to reorder)", self)
-        reset_action = QAction(f"Reset Hard to {sha}", self)
-        set_best_action = QAction("set as BEST_COMMITID", self)
-        drop_action = QAction("Drop", self)
-        rephrase_action = QAction("Rephrase", self)
-        revert_action = QAction("Revert", self)
-        
-        # Clipboard items
-        copy_sha_action = QAction("Copy SHA to clipboard", self)
-        copy_msg_action = QAction("Copy commit msg to clipboard", self)
-        copy_sha_msg_action = QAction("Copy SHA and commit msg to clipboard", self)
-        
-        # Squash items
-        index = self.list_widget.row(item)
-        count = self.list_widget.count()
-        
-        def format_squash_label(neighbor_item):
-            parts = neighbor_item.text().split(maxsplit=1)
-            n_sha = parts[0]
-            return f"{n_sha}"
-
-        squash_above_action = None
-        if index > 0:
-            above_item = self.list_widget.item(index - 1)
-            label = f"squash with above commit ({format_squash_label(above_item)})"
-            squash_above_action = QAction(label, self)
-            squash_above_action.triggered.connect(lambda: self.handle_squash_above(item))
-        else:
-            squash_above_action = QAction("squash with above commit (N/A)", self)
-            squash_above_action.setEnabled(False)
-
-        squash_below_action = None
-        if index < count - 1:
-            below_item = self.list_widget.item(index + 1)
-            label = f"squash with below commit ({format_squash_label(below_item)})"
-            squash_below_action = QAction(label, self)
-            squash_below_action.triggered.connect(lambda: self.handle_squash_below(item))
-        else:
-            squash_below_action = QAction("squash with below commit (N/A)", self)
-            squash_below_action.setEnabled(False)
-
-        mark_action.triggered.connect(lambda: self.toggle_mark_commit(item))
-        view_action.triggered.connect(lambda: self.view_commit(item))
-        view_filewise_action = QAction(f"Show / View commit {sha} -- file-wise", self)
-        view_filewise_action.triggered.connect(lambda: self.handle_view_commit_file_wise(item))
-        move_action.triggered.connect(lambda: self.handle_move_info(item))
-        reset_action.triggered.connect(lambda: self.handle_reset(item))
-        set_best_action.triggered.connect(lambda: self.handle_set_best_commit(item))
-        drop_action.triggered.connect(lambda: self.handle_drop(item))
-        rephrase_action.triggered.connect(lambda: self.handle_rephrase(item))
-        revert_action.triggered.connect(lambda: self.handle_revert_commit(item))
-        copy_sha_action.triggered.connect(lambda: self.handle_copy_sha(item))
-        copy_msg_action.triggered.connect(lambda: self.handle_copy_message(item))
-        copy_sha_msg_action.triggered.connect(lambda: self.handle_copy_sha_and_message(item))
-        
-        # Disable most actions if in multi-select mode
-        if self.multi_select_mode:
-            mark_action.setEnabled(False)
-            view_action.setEnabled(False)
-            view_filewise_action.setEnabled(False)
-            reset_action.setEnabled(False)
-            set_best_action.setEnabled(False)
-            drop_action.setEnabled(False)
-            rephrase_action.setEnabled(False)
-            revert_action.setEnabled(False)
-            move_action.setEnabled(False)
-            copy_sha_action.setEnabled(False)
-            copy_msg_action.setEnabled(False)
-            copy_sha_msg_action.setEnabled(False)
-            if squash_above_action: squash_above_action.setEnabled(False)
-            if squash_below_action: squash_below_action.setEnabled(False)
-        # Construct the menu
-        
-        menu.addAction(mark_action)
+        font = self._FONT_CACHE.get(self.current_font_size)
+        if font is None:
+            font = self._FONT_CACHE[self.current_font_size] = QFont("Monospace", self.current_font_size)
+        for name in ('list_widget', 'side_diff_view', 'side_commit_msg', 'filewise_diff_view', 'filewise_file_list'):
+            widget = getattr(self, name, None)
+            # setFont relayouts the widget even for an identical font (e.g. on theme switches)
+            if widget is not None and widget.font() != font:
+                widget.setFont(font)
+        # Save persistence (skipped when nothing changed, e.g. on theme switches)
+        self._set_setting("font_size", self.current_font_size)
+
+    def _build_context_menu(self):
+        """
+        Creates the commit context menu and its actions once; show_context_menu()
+        only refreshes labels and enabled states before each popup.
+        """
+        menu = QMenu(self)
+        actions = {}
+
+        def add(menu_, key, handler):
+            # Item handlers receive the right-clicked item stored in self._context_item
+            action = QAction(menu_)
+            action.triggered.connect(partial(self._run_context_action, handler))
+            menu_.addAction(action)
+            actions[key] = action
+            return action
+
+        add(menu, "mark", self.toggle_mark_commit)
         menu.addSeparator()
-        menu.addAction(view_action)
-        menu.addAction(view_filewise_action)
+        add(menu, "view", self.view_commit)
+        add(menu, "view_filewise", self.handle_view_commit_file_wise)
         menu.addSeparator()
-        menu.addAction(reset_action)
-        menu.addAction(set_best_action)
+        add(menu, "reset", self.handle_reset)
+        add(menu, "set_best", self.handle_set_best_commit).setText("set as BEST_COMMITID")
         menu.addSeparator()
-        menu.addAction(rephrase_action)
-        menu.addAction(drop_action)
-        menu.addAction(revert_action)
+        add(menu, "rephrase", self.handle_rephrase).setText("Rephrase")
+        add(menu, "drop", self.handle_drop).setText("Drop")
+        add(menu, "revert", self.handle_revert_commit).setText("Revert")
         menu.addSeparator()
-        
+
         # Squash commits submenu
         squash_menu = menu.addMenu("Squash commits")
-        squash_menu.setFont(menu_font)
-        
-        # Move individual squash actions here
-        if squash_above_action:
-            squash_menu.addAction(squash_above_action)
-        if squash_below_action:
-            squash_menu.addAction(squash_below_action)
-        
+        # Neighbour labels are only filled in when the submenu is actually opened
+        squash_menu.aboutToShow.connect(self._update_squash_labels)
+        add(squash_menu, "squash_above", self.handle_squash_above)
+        add(squash_menu, "squash_below", self.handle_squash_below)
         squash_menu.addSeparator()
 
-        select_multi_action = QAction("Select commits to squash", self)
-        select_multi_action.setEnabled(not self.multi_select_mode)
+        select_multi_action = QAction("Select commits to squash", squash_menu)
         select_multi_action.triggered.connect(self.enter_multi_select_mode)
-        
-        squash_selected_action = QAction("Squash selected commits", self)
-        checked_count = 0
-        if self.multi_select_mode:
-            checked_count = sum(1 for i in range(self.list_widget.count()) 
-                                if self.list_widget.item(i).checkState() == Qt.Checked)
-        squash_selected_action.setEnabled(self.multi_select_mode and checked_count >= 2)
+        squash_selected_action = QAction("Squash selected commits", squash_menu)
         squash_selected_action.triggered.connect(self.handle_squash_selected)
-        
-        cancel_multi_action = QAction("Cancel multi selection", self)
-        cancel_multi_action.setEnabled(self.multi_select_mode)
+        cancel_multi_action = QAction("Cancel multi selection", squash_menu)
         cancel_multi_action.triggered.connect(self.handle_cancel_multi_select)
-        
         squash_menu.addAction(select_multi_action)
         squash_menu.addAction(squash_selected_action)
         squash_menu.addAction(cancel_multi_action)
-        
-        menu.addAction(move_action)
-        
+        actions["select_multi"] = select_multi_action
+        actions["squash_selected"] = squash_selected_action
+        actions["cancel_multi"] = cancel_multi_action
+
+        add(menu, "move", self.handle_move_info).setText("Move (Drag item to reorder)")
+
         # Split Commit submenu
         split_menu = menu.addMenu("Split Commit")
-        split_menu.setFont(menu_font)
-        split_move_out_action = QAction("move one file changes out of this commit", self)
-        split_move_out_action.triggered.connect(lambda: self.handle_split_commit(item))
-        split_menu.addAction(split_move_out_action)
-        
-        split_all_action = QAction("split all changes to separate commits", self)
-        split_all_action.triggered.connect(lambda: self.handle_split_all_commits(item))
-        split_menu.addAction(split_all_action)
+        add(split_menu, "split_move_out", self.handle_split_commit).setText("move one file changes out of this commit")
+        add(split_menu, "split_all", self.handle_split_all_commits).setText("split all changes to separate commits")
+        add(split_menu, "split_per_file", self.handle_split_per_file).setText("split each file changes to separate commit")
 
-        split_per_file_action = QAction("split each file changes to separate commit", self)
-        split_per_file_action.triggered.connect(lambda: self.handle_split_per_file(item))
-        split_menu.addAction(split_per_file_action)
-        
         menu.addSeparator()
-        menu.addAction(copy_sha_action)
-        menu.addAction(copy_msg_action)
-        menu.addAction(copy_sha_msg_action)
-        menu.exec(self.list_widget.mapToGlobal(position))
+        # Clipboard items
+        add(menu, "copy_sha", self.handle_copy_sha).setText("Copy SHA to clipboard")
+        add(menu, "copy_msg", self.handle_copy_message).setText("Copy commit msg to clipboard")
+        add(menu, "copy_sha_msg", self.handle_copy_sha_and_message).setText("Copy SHA and commit msg to clipboard")
+
+        self._context_menu = menu
+        self._context_submenus = (squash_menu, split_menu)
+        self._context_actions = actions
+
+    def _update_squash_labels(self):
+        """Names the neighbour commits on the squash above/below actions."""
+        item = self._context_item
+        if item is None:
+            return
+        actions = self._context_actions
+        index = self.list_widget.row(item)
+        neighbour_above = self.list_widget.item(index - 1) if index > 0 else None
+        neighbour_below = self.list_widget.item(index + 1)
+        above = neighbour_above.data(Qt.UserRole)[:8] if neighbour_above is not None else "N/A"
+        below = neighbour_below.data(Qt.UserRole)[:8] if neighbour_below is not None else "N/A"
+        actions["squash_above"].setText(f"squash with above commit ({above})")
+        actions["squash_below"].setText(f"squash with below commit ({below})")
+
+    def _run_context_action(self, handler):
+        item = self._context_item
+        if item is not None:
+            handler(item)
+
+    def show_context_menu(self, position):
+        # Allow context menu in multi-select mode, but we will restrict it later
+        item = self.list_widget.itemAt(position)
+        if not item:
+            return
+
+        if self._context_menu is None:
+            self._build_context_menu()
+        actions = self._context_actions
+
+        sha = item.data(Qt.UserRole)
+        menu_font = QFont("Monospace", max(8, self.current_font_size - 2))
+        self._context_menu.setFont(menu_font)
+        for submenu in self._context_submenus:
+            submenu.setFont(menu_font)
+
+        actions["mark"].setText(f"Mark / Unmark commit {sha[:8]}")
+        actions["view"].setText(f"Show / View commit {sha[:8]}")
+        actions["view_filewise"].setText(f"Show / View commit {sha[:8]} -- file-wise")
+        actions["reset"].setText(f"Reset Hard to {sha[:8]}")
+
+        # Squash items
+        index = self.list_widget.row(item)
+        count = self.list_widget.count()
+
+        # Disable most actions if in multi-select mode
+        single_mode = not self.multi_select_mode
+        for key in ("mark", "view", "view_filewise", "reset", "set_best", "drop", "rephrase",
+                    "revert", "move", "copy_sha", "copy_msg", "copy_sha_msg"):
+            actions[key].setEnabled(single_mode)
+        actions["squash_above"].setEnabled(single_mode and index > 0)
+        actions["squash_below"].setEnabled(single_mode and index < count - 1)
+
+        checked_count = len(self._checked_shas) if self.multi_select_mode else 0
+        actions["select_multi"].setEnabled(not self.multi_select_mode)
+        actions["squash_selected"].setEnabled(self.multi_select_mode and checked_count >= 2)
+        actions["cancel_multi"].setEnabled(self.multi_select_mode)
+
+        self._context_item = item
+        try:
+            self._context_menu.exec(self.list_widget.mapToGlobal(position))
+        finally:
+            self._context_item = None
 
     def handle_move_info(self, item):
         QMessageBox.information(
@@ -1558,10 +1932,10 @@ class GitInteractiveRebaseApp(QMainWindow):
 
     def handle_rephrase(self, item):
         """Handles the rephrase action."""
-        sha = item.text().split()[0]
-        print(f"Preparing to rephrase {sha}...")
+        sha = item.data(Qt.UserRole)
+        logger.debug("Preparing to rephrase %s...", sha)
         try:
-            current_message = get_full_commit_message(self.repo_path, sha)
+            current_message = self.git_batch.get_commit_message(sha)
             dialog = RephraseDialog(sha, current_message, self.current_font_size, self)
             if dialog.exec() == QDialog.Accepted:
                 new_message = dialog.get_message()
@@ -1574,13 +1948,13 @@ class GitInteractiveRebaseApp(QMainWindow):
         """Executes the rephrase using unified rebase logic."""
         try:
             # Current list of SHAs in UI
-            current_shas = []
-            for i in range(self.list_widget.count()):
-                current_shas.append(self.list_widget.item(i).text().split()[0])
+            current_shas = self._list_shas()
             
             if self.run_interactive_rebase(current_shas, rephrase_map={sha: new_message}, progress_title="Rephrasing Commit", progress_text=f"Rephrasing commit {sha}. Please wait..."):
-                print(f"Rephrased {sha}.")
-                self.load_history()
+                logger.debug("Rephrased %s.", sha)
+                # Same rows, same order: only the rephrased commit and those above it changed
+                if not self._apply_rewrite_in_place(current_shas, current_shas, rewritten=current_shas.index(sha) + 1):
+                    self.load_history()
                 QMessageBox.information(self, "Success", f"Commit {sha} rephrased successfully.")
                 return
             
@@ -1591,8 +1965,8 @@ class GitInteractiveRebaseApp(QMainWindow):
 
     def handle_revert_commit(self, item):
         """Handles the 'Revert this commit' context menu action."""
-        sha = item.text().split()[0]
-        print(f"Preparing to revert {sha}...")
+        sha = item.data(Qt.UserRole)
+        logger.debug("Preparing to revert %s...", sha)
         try:
             default_message = get_revert_commit_message(self.repo_path, sha)
             dialog = RevertCommitDialog(sha, default_message, self.current_font_size, self)
@@ -1607,49 +1981,50 @@ class GitInteractiveRebaseApp(QMainWindow):
         self.save_undo_state()
         try:
             # Revert without auto-committing so we can supply our own message
-            subprocess.run(
-                ["git", "revert", "--no-commit", sha],
-                cwd=self.repo_path, check=True, capture_output=True, text=True
+            self.run_in_background(
+                subprocess.run, ["git", "revert", "--no-commit", sha],
+                cwd=self.repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                progress_title="Reverting Commit", progress_text=f"Reverting commit {sha}. Please wait..."
             )
             # Commit with the (possibly edited) revert message
-            subprocess.run(
-                ["git", "commit", "-m", revert_message],
-                cwd=self.repo_path, check=True, capture_output=True, text=True
+            self.run_in_background(
+                subprocess.run, ["git", "commit", "-m", revert_message],
+                cwd=self.repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
             )
-            print(f"Reverted {sha}.")
+            logger.debug("Reverted %s.", sha)
             self.load_history()
             QMessageBox.information(self, "Success", f"Commit {sha} reverted successfully.")
         except subprocess.CalledProcessError as e:
             # Abort any lingering revert state so the repo stays clean
-            subprocess.run(["git", "revert", "--abort"], cwd=self.repo_path, capture_output=True)
+            subprocess.run(["git", "revert", "--abort"], cwd=self.repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             QMessageBox.critical(self, "Revert Failed",
-                                 f"Could not revert commit {sha}.\n\nError: {e.stderr}")
+                                 f"Could not revert commit {sha}.\n\nError: {decode_output(e.stderr)}")
             self.load_history()
 
     def handle_copy_sha(self, item):
-        sha = item.text().split()[0]
-        print(f"Copying SHA {sha} to clipboard...")
+        sha = item.data(Qt.UserRole)
+        logger.debug("Copying SHA %s to clipboard...", sha)
         QApplication.clipboard().setText(sha)
-        QMessageBox.information(self, "Copied", f"Copied {sha} to clipboard.")
+        self.statusBar().showMessage(f"Copied {sha} to clipboard.", STATUS_MESSAGE_MS)
 
     def handle_copy_message(self, item):
-        sha = item.text().split()[0]
-        print(f"Copying message of {sha} to clipboard...")
+        sha = item.data(Qt.UserRole)
+        logger.debug("Copying message of %s to clipboard...", sha)
         try:
-            msg = get_full_commit_message(self.repo_path, sha)
+            msg = self.git_batch.get_commit_message(sha)
             QApplication.clipboard().setText(msg)
-            QMessageBox.information(self, "Copied", f"Copied commit message of {sha} to clipboard.")
+            self.statusBar().showMessage(f"Copied commit message of {sha} to clipboard.", STATUS_MESSAGE_MS)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not fetch message: {str(e)}")
 
     def handle_copy_sha_and_message(self, item):
-        sha = item.text().split()[0]
-        print(f"Copying SHA and message of {sha} to clipboard...")
+        sha = item.data(Qt.UserRole)
+        logger.debug("Copying SHA and message of %s to clipboard...", sha)
         try:
-            msg = get_full_commit_message(self.repo_path, sha)
+            msg = self.git_batch.get_commit_message(sha)
             combined = f"{sha} {msg}"
             QApplication.clipboard().setText(combined)
-            QMessageBox.information(self, "Copied", f"Copied SHA and commit message of {sha} to clipboard.")
+            self.statusBar().showMessage(f"Copied SHA and commit message of {sha} to clipboard.", STATUS_MESSAGE_MS)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not fetch message: {str(e)}")
 
@@ -1657,33 +2032,38 @@ class GitInteractiveRebaseApp(QMainWindow):
         """Helper to open the diff viewer for a commit item."""
         if not item:
             return
-        sha = item.text().split()[0]
-        print(f"Viewing {sha}...")
+        sha = item.data(Qt.UserRole)
+        logger.debug("Viewing %s...", sha)
         try:
-            diff_text = get_commit_diff(self.repo_path, sha)
-            commit_msg = get_full_commit_message(self.repo_path, sha)
-            commit_meta = get_commit_metadata(self.repo_path, sha)
-            dialog = ViewCommitDialog(sha, commit_msg, commit_meta, diff_text, self.current_font_size, self)
-            dialog.exec()
+            diff_text = self.run_in_background(self.git_batch.get_diff, sha)
+            commit_msg = self.git_batch.get_commit_message(sha)
+            commit_meta = self.git_batch.get_commit_metadata(sha)
+            # One dialog (text document, highlighter, splitter) is kept and re-targeted per open
+            if self._view_dialog is None:
+                self._view_dialog = ViewCommitDialog(sha, commit_msg, commit_meta, diff_text, self.current_font_size, self)
+            else:
+                self._view_dialog.set_commit(sha, commit_msg, commit_meta, diff_text, self.current_font_size)
+            self._view_dialog.exec()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not fetch commit diff: {str(e)}")
 
     def handle_view_commit_file_wise(self, item):
         if not item:
             return
-        sha = item.text().split()[0]
+        sha = item.data(Qt.UserRole)
         try:
-            files = get_commit_files(self.repo_path, sha)
+            files = self.run_in_background(self.git_batch.get_commit_files, sha)
             if not files:
                 QMessageBox.information(self, "No Files", f"Commit {sha} has no file changes to view.")
                 return
             dialog = FileWiseViewDialog(self.repo_path, sha, files, self.current_font_size, self)
             dialog.exec()
+            dialog.deleteLater()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not open file-wise view: {str(e)}")
 
     def toggle_mark_commit(self, item):
-        sha = item.text().split()[0]
+        sha = item.data(Qt.UserRole)
         
         if sha in self.marked_shas:
             self.marked_shas.remove(sha)
@@ -1694,7 +2074,7 @@ class GitInteractiveRebaseApp(QMainWindow):
         self.list_widget.viewport().update()
 
     def handle_reset(self, item):
-        sha = item.text().split()[0]
+        sha = item.data(Qt.UserRole)
         reply = QMessageBox.question(
             self, 
             "Confirm Reset Hard",
@@ -1708,14 +2088,16 @@ class GitInteractiveRebaseApp(QMainWindow):
             self.perform_reset(sha)
 
     def perform_reset(self, sha):
-        print(f"Resetting hard to {sha}...")
+        logger.debug("Resetting hard to %s...", sha)
         self.save_undo_state()
         try:
-            subprocess.run(["git", "reset", "--hard", sha], cwd=self.repo_path, check=True, capture_output=True, text=True)
+            self.run_in_background(subprocess.run, ["git", "reset", "--hard", sha], cwd=self.repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                   progress_title="Resetting", progress_text=f"git reset --hard {sha[:10]} in progress...")
+            self.git_batch.clear_cache()
             QMessageBox.information(self, "Success", f"Successfully reset --hard to {sha[:10]}.")
             self.load_history()
         except subprocess.CalledProcessError as e:
-            QMessageBox.critical(self, "Reset Failed", f"Could not perform reset.\n\nError: {e.stderr}")
+            QMessageBox.critical(self, "Reset Failed", f"Could not perform reset.\n\nError: {decode_output(e.stderr)}")
 
     def handle_squash_above(self, item):
         """Squashes the current commit with the one above it (newer)."""
@@ -1723,17 +2105,18 @@ class GitInteractiveRebaseApp(QMainWindow):
         if index <= 0: return
         
         above_item = self.list_widget.item(index - 1)
-        sha_above = above_item.text().split()[0]
-        sha_current = item.text().split()[0]
+        sha_above = above_item.data(Qt.UserRole)
+        sha_current = item.data(Qt.UserRole)
         
         try:
-            msg_above = get_full_commit_message(self.repo_path, sha_above)
-            msg_current = get_full_commit_message(self.repo_path, sha_current)
+            self.git_batch.prefetch_commits([sha_above, sha_current])
+            msg_above = self.git_batch.get_commit_message(sha_above)
+            msg_current = self.git_batch.get_commit_message(sha_current)
             
             dialog = SquashDialog(sha_above, msg_above, sha_current, msg_current, self.current_font_size, self)
             if dialog.exec() == QDialog.Accepted:
                 final_msg = dialog.get_message()
-                print(f"Preparing to squash {sha_above} into {sha_current}...")
+                logger.debug("Preparing to squash %s into %s...", sha_above, sha_current)
                 self.perform_squash(sha_above, final_msg)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not prepare squash: {str(e)}")
@@ -1743,18 +2126,19 @@ class GitInteractiveRebaseApp(QMainWindow):
         index = self.list_widget.row(item)
         if index >= self.list_widget.count() - 1: return
         
-        sha_current = item.text().split()[0]
+        sha_current = item.data(Qt.UserRole)
         below_item = self.list_widget.item(index + 1)
-        sha_below = below_item.text().split()[0]
+        sha_below = below_item.data(Qt.UserRole)
         
         try:
-            msg_current = get_full_commit_message(self.repo_path, sha_current)
-            msg_below = get_full_commit_message(self.repo_path, sha_below)
+            self.git_batch.prefetch_commits([sha_current, sha_below])
+            msg_current = self.git_batch.get_commit_message(sha_current)
+            msg_below = self.git_batch.get_commit_message(sha_below)
             
             dialog = SquashDialog(sha_current, msg_current, sha_below, msg_below, self.current_font_size, self)
             if dialog.exec() == QDialog.Accepted:
                 final_msg = dialog.get_message()
-                print(f"Preparing to squash {sha_current} into {sha_below}...")
+                logger.debug("Preparing to squash %s into %s...", sha_current, sha_below)
                 self.perform_squash(sha_current, final_msg)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not prepare squash: {str(e)}")
@@ -1763,16 +2147,18 @@ class GitInteractiveRebaseApp(QMainWindow):
         """Executes the squash using unified rebase logic."""
         try:
             # Current list of SHAs in UI
-            current_shas = []
-            for i in range(self.list_widget.count()):
-                current_shas.append(self.list_widget.item(i).text().split()[0])
+            current_shas = self._list_shas()
             
             # Use final_msg for the rebase - we associate it with the SHA being squashed
             # so the amend happens right after the squash command in the todo list.
             if self.run_interactive_rebase(current_shas, squash_shas=[sha_to_squash], 
                                           rephrase_map={sha_to_squash: final_msg}):
-                print(f"Squashed {sha_to_squash}.")
-                self.load_history()
+                logger.debug("Squashed %s.", sha_to_squash)
+                # The squashed row folds into its parent, which now sits at its index
+                new_shas = [s for s in current_shas if s != sha_to_squash]
+                rewritten = current_shas.index(sha_to_squash) + 1
+                if not self._apply_rewrite_in_place(new_shas, current_shas, rewritten=rewritten):
+                    self.load_history()
                 QMessageBox.information(self, "Success", "Commits squashed successfully.")
                 return
             
@@ -1786,14 +2172,9 @@ class GitInteractiveRebaseApp(QMainWindow):
     def enter_multi_select_mode(self):
         """Enters checkbox multi-select mode on the commit list."""
         self.multi_select_mode = True
-        # Block signals to prevent spurious itemChanged during setup
-        self.list_widget.blockSignals(True)
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Unchecked)
-        self.list_widget.blockSignals(False)
-        self.list_widget.itemChanged.connect(self.on_multi_select_changed)
+        self._checked_shas.clear()
+        # The delegate draws the checkboxes from _checked_shas; a repaint is all it takes
+        self.list_widget.viewport().update()
         self.multi_select_btn.setEnabled(False)
         self.squash_selected_btn.setEnabled(False)
         self.cancel_multi_btn.setEnabled(True)
@@ -1801,29 +2182,22 @@ class GitInteractiveRebaseApp(QMainWindow):
     def exit_multi_select_mode(self):
         """Exits checkbox multi-select mode and restores normal list behaviour."""
         self.multi_select_mode = False
-        try:
-            self.list_widget.itemChanged.disconnect(self.on_multi_select_changed)
-        except Exception: # Widened exception catch
-            pass
-        self.list_widget.blockSignals(True)
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            item.setFlags(item.flags() & ~Qt.ItemIsUserCheckable)
-            item.setData(Qt.CheckStateRole, None)
-        self.list_widget.blockSignals(False)
+        self._checked_shas.clear()
+        self.list_widget.viewport().update()
         self.multi_select_btn.setEnabled(True)
         self.squash_selected_btn.setEnabled(False)
         self.cancel_multi_btn.setEnabled(False)
 
-    def on_multi_select_changed(self, changed_item):
-        """Enables 'Squash selected commits' only when ≥ 2 commits are checked."""
+    def toggle_multi_select(self, sha):
+        """Checks/unchecks sha; enables 'Squash selected commits' only when ≥ 2 commits are checked."""
         if not self.multi_select_mode:
             return
-        checked_count = sum(
-            1 for i in range(self.list_widget.count())
-            if self.list_widget.item(i).checkState() == Qt.Checked
-        )
-        self.squash_selected_btn.setEnabled(checked_count >= 2)
+        if sha in self._checked_shas:
+            self._checked_shas.discard(sha)
+        else:
+            self._checked_shas.add(sha)
+        self.squash_selected_btn.setEnabled(len(self._checked_shas) >= 2)
+        self.list_widget.viewport().update()
 
     def handle_cancel_multi_select(self):
         """Cancels multi-select mode without merging."""
@@ -1832,35 +2206,33 @@ class GitInteractiveRebaseApp(QMainWindow):
     def handle_squash_selected(self):
         """Collects checked commits, validates contiguity, confirms, then squashes."""
         # Collect selected indices and SHAs in list order (newest → oldest)
-        selected_indices = []
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.checkState() == Qt.Checked:
-                selected_indices.append(i)
+        all_shas = self._list_shas()
+        selected_indices = [i for i, sha in enumerate(all_shas) if sha in self._checked_shas]
 
         if len(selected_indices) < 2:
             QMessageBox.warning(self, "Not Enough Selected", "Please select at least 2 commits to squash.")
             return
 
-        # Contiguity check
-        for k in range(len(selected_indices) - 1):
-            if selected_indices[k + 1] != selected_indices[k] + 1:
-                QMessageBox.critical(
-                    self, "Non-Adjacent Commits",
-                    "Selected commits must be adjacent (contiguous) in the log.\n\n"
-                    "Please select only neighbouring commits."
-                )
-                return
+        # Contiguity check: sorted distinct rows are adjacent iff they span exactly len rows
+        if selected_indices[-1] - selected_indices[0] != len(selected_indices) - 1:
+            QMessageBox.critical(
+                self, "Non-Adjacent Commits",
+                "Selected commits must be adjacent (contiguous) in the log.\n\n"
+                "Please select only neighbouring commits."
+            )
+            return
 
-        selected_shas = [self.list_widget.item(i).text().split()[0] for i in selected_indices]
+        selected_shas = [all_shas[i] for i in selected_indices]
 
         self.perform_multi_squash(selected_shas)
 
     def perform_multi_squash(self, selected_shas):
         """Squashes multiple adjacent commits into the topmost selected commit."""
+        needs_reload = True
         try:
             # Collect (sha, message) pairs preserving order
-            sha_msg_pairs = [(sha, get_full_commit_message(self.repo_path, sha)) for sha in selected_shas]
+            self.git_batch.prefetch_commits(selected_shas)
+            sha_msg_pairs = [(sha, self.git_batch.get_commit_message(sha)) for sha in selected_shas]
 
             # The oldest item (last in our list) is the "pick" target; rest become squash
             # List is newest -> oldest
@@ -1872,26 +2244,33 @@ class GitInteractiveRebaseApp(QMainWindow):
             # Open the N-option message selection dialog directly
             dialog = MultiSquashDialog(sha_msg_pairs, self.current_font_size, self)
             if dialog.exec() != QDialog.Accepted:
+                needs_reload = False  # nothing was rewritten
                 return  # finally block handles cleanup
 
             final_msg = dialog.get_message()
 
             # Build all SHAs list from current view
-            all_shas = [self.list_widget.item(i).text().split()[0] for i in range(self.list_widget.count())]
+            all_shas = self._list_shas()
 
             if self.run_interactive_rebase(all_shas, squash_shas=squash_shas, rephrase_map={rephrase_sha: final_msg}, progress_title="Squashing Commits", progress_text="Squashing selected commits together. Please wait..."):
-                self.load_history()
+                # The selected rows collapse into one at the newest selected index
+                new_shas = [s for s in all_shas if s not in squash_shas]
+                rewritten = all_shas.index(rephrase_sha) + 1
+                self.exit_multi_select_mode()
+                needs_reload = not self._apply_rewrite_in_place(new_shas, all_shas, rewritten=rewritten)
                 QMessageBox.information(self, "Success", f"Successfully squashed {len(selected_shas)} commits.")
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred while merging: {str(e)}")
         finally:
-            self.exit_multi_select_mode()
-            self.load_history()
+            if self.multi_select_mode:
+                self.exit_multi_select_mode()
+            if needs_reload:
+                self.load_history()
 
     def handle_drop(self, item):
-        sha = item.text().split()[0]
-        print(f"Preparing to drop {sha}...")
+        sha = item.data(Qt.UserRole)
+        logger.debug("Preparing to drop %s...", sha)
 
         # Guard: if this is the only commit in the list and we're in branch-detection
         # mode, dropping it is equivalent to a hard-reset to the base — not supported.
@@ -1909,9 +2288,18 @@ class GitInteractiveRebaseApp(QMainWindow):
             return
 
         try:
-            diff_text = get_commit_diff(self.repo_path, sha)
-            dialog = DropDialog(sha, diff_text, self.current_font_size, self)
-            if dialog.exec() == QDialog.Accepted:
+            # Show the full diff only if it is already cached; otherwise start with the
+            # cheap diffstat and let the user pull the full diff on demand.
+            diff_text = self.git_batch.peek_diff(sha)
+            full_diff_loader = None
+            if diff_text is None:
+                diff_text = self.run_in_background(get_commit_stat, self.repo_path, sha)
+                full_diff_loader = lambda: self.run_in_background(self.git_batch.get_diff, sha)
+            dialog = DropDialog(sha, diff_text, self.current_font_size, self, full_diff_loader=full_diff_loader)
+            accepted = dialog.exec() == QDialog.Accepted
+            # Parented to the window, so it would otherwise live (diff text included) until exit
+            dialog.deleteLater()
+            if accepted:
                 self.perform_drop(sha)
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
@@ -1920,16 +2308,19 @@ class GitInteractiveRebaseApp(QMainWindow):
         """Drops a commit using our unified rebase logic."""
         try:
             # Current list of SHAs in UI
-            current_shas = []
-            for i in range(self.list_widget.count()):
-                current_shas.append(self.list_widget.item(i).text().split()[0])
+            current_shas = self._list_shas()
             
             # New list without the dropped SHA
             new_shas = [s for s in current_shas if s != sha]
+            if len(new_shas) == len(current_shas):
+                # Not (or no longer) in the list, e.g. rewritten by an earlier action
+                QMessageBox.warning(self, "Drop", f"Commit {sha} is not in the current history.")
+                return
             
             if self.run_interactive_rebase(new_shas, progress_title="Dropping Commit", progress_text=f"Dropping commit {sha}. Please wait..."):
-                print(f"Dropped {sha}.")
-                self.load_history()
+                logger.debug("Dropped %s.", sha)
+                if not self._apply_rewrite_in_place(new_shas, current_shas):
+                    self.load_history()
                 QMessageBox.information(self, "Success", f"Commit {sha} dropped successfully.")
                 return
             
@@ -1940,9 +2331,9 @@ class GitInteractiveRebaseApp(QMainWindow):
 
     def handle_split_commit(self, item):
         """Opens SplitCommitDialog to allow moving a file out of a commit."""
-        sha = item.text().split()[0]
+        sha = item.data(Qt.UserRole)
         try:
-            files = get_commit_files(self.repo_path, sha)
+            files = self.run_in_background(self.git_batch.get_commit_files, sha)
             if not files:
                 QMessageBox.information(self, "No Files", f"Commit {sha} has no file changes to split.")
                 return
@@ -1951,19 +2342,33 @@ class GitInteractiveRebaseApp(QMainWindow):
                 return
                 
             dialog = SplitCommitDialog(self.repo_path, sha, files, self.current_font_size, self)
-            if dialog.exec() == QDialog.Accepted:
-                selected_file = dialog.get_selected_file()
-                if selected_file:
-                    self.perform_move_file_out(sha, selected_file)
+            accepted = dialog.exec() == QDialog.Accepted
+            selected_file = dialog.get_selected_file()
+            dialog.deleteLater()
+            if accepted and selected_file:
+                self.perform_move_file_out(sha, selected_file)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not open split dialog: {str(e)}")
 
+    def _exec_after_env(self, sha, single_exec):
+        """
+        Rebase environment whose sequence editor (lib/sequence_editor.py) inserts
+        single_exec right after the todo line for sha. The editor file ships with
+        the app, so nothing is written to disk per rebase.
+        """
+        editor = f"{shlex.quote(sys.executable)} {shlex.quote(SEQUENCE_EDITOR_PATH)}"
+        env = rebase_env(editor)
+        env["GIT_IR_TARGET_SHA"] = sha
+        env["GIT_IR_EXEC_CMD"] = single_exec
+        return env
+
     def perform_move_file_out(self, sha, filepath):
         """
         Moves a single file's changes out of a commit into a new commit after it.
         """
+        temp_paths = []
         try:
-            all_files = get_commit_files(self.repo_path, sha)
+            all_files = self.git_batch.get_commit_files(sha)
             other_files = [f for f in all_files if f != filepath]
             short_sha = sha[:8]
 
@@ -1971,117 +2376,84 @@ class GitInteractiveRebaseApp(QMainWindow):
                 QMessageBox.information(self, "Info", f"File '{filepath}' is the only modified file in this commit. Nothing to split.")
                 return
 
-            original_msg = get_full_commit_message(self.repo_path, sha)
+            original_msg = self.git_batch.get_commit_message(sha)
             new_msg = f"{filepath} changes separated out from {short_sha}\n\n{original_msg}"
             
             # Action script content
             action_script_content = f"""#!/usr/bin/env python3
-import subprocess, os, tempfile, sys
+import subprocess
 
-sha = {repr(sha)}
 filepath = {repr(filepath)}
 new_msg = {repr(new_msg)}
 
-# 1. Soft-reset to unstage the commit
-subprocess.check_call(['git', 'reset', '--soft', 'HEAD~1'])
-# 2. Un-stage the target file from the index
-subprocess.check_call(['git', 'reset', 'HEAD', '--', filepath])
-# 3. Re-commit the remaining files with the original commit message
-subprocess.check_call(['git', 'commit', '-C', sha])
-# 4. Stage the target file
+# 1. Put the target file back to its parent state in the index (HEAD stays put)
+subprocess.check_call(['git', 'reset', '-q', 'HEAD~1', '--', filepath])
+# 2. Amend the commit without it, keeping the original message and author
+subprocess.check_call(['git', 'commit', '--amend', '--no-edit'])
+# 3. Stage the target file and commit it with the new message (read from stdin)
 subprocess.check_call(['git', 'add', '--all', '--', filepath])
-# 5. Commit the target file with the new descriptive message
-msg_fd, msg_path = tempfile.mkstemp(prefix='git_msg_', text=True)
-with os.fdopen(msg_fd, 'w', encoding='utf-8') as f:
-    f.write(new_msg)
-try:
-    subprocess.check_call(['git', 'commit', '-F', msg_path])
-finally:
-    try:
-        os.unlink(msg_path)
-    except:
-        pass
+subprocess.run(['git', 'commit', '-F', '-'], input=new_msg.encode('utf-8'), check=True)
 """
-            action_fd, action_path = tempfile.mkstemp(prefix='git_split_action_', suffix='.py', text=True)
+            action_fd, action_path = tempfile.mkstemp(prefix='git_split_action_', suffix='.py', dir=self._tmpdir, text=True)
+            temp_paths.append(action_path)
             with os.fdopen(action_fd, 'w', encoding='utf-8') as f:
                 f.write(action_script_content)
             os.chmod(action_path, os.stat(action_path).st_mode | stat.S_IEXEC)
             
-            single_exec = f"exec python3 {action_path}"
-
-            current_shas = [self.list_widget.item(i).text().split()[0]
-                            for i in range(self.list_widget.count())]
-
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.py') as f:
-                f.write("#!/usr/bin/env python3\n")
-                f.write("import sys\n")
-                f.write(f"target_sha = {repr(sha)}\n")
-                f.write(f"single_exec = {repr(single_exec)}\n")
-                f.write("todo_path = sys.argv[1]\n")
-                f.write("with open(todo_path, 'r') as tf:\n")
-                f.write("    lines = tf.readlines()\n")
-                f.write("output = []\n")
-                f.write("for line in lines:\n")
-                f.write("    output.append(line)\n")
-                f.write("    stripped = line.strip()\n")
-                f.write("    if not stripped.startswith('#') and len(stripped.split()) >= 2 and stripped.split()[1].startswith(target_sha):\n")
-                f.write("        output.append(single_exec + '\\n')\n")
-                f.write("with open(todo_path, 'w') as tf:\n")
-                f.write("    tf.writelines(output)\n")
-                editor_script = f.name
-
-            os.chmod(editor_script, os.stat(editor_script).st_mode | stat.S_IEXEC)
-
-            sha_idx = current_shas.index(sha) if sha in current_shas else -1
-            if sha_idx == len(current_shas) - 1:
-                has_parent = False
-                try:
-                    subprocess.run(["git", "rev-parse", f"{sha}^"],
-                                   cwd=self.repo_path, check=True, capture_output=True)
-                    has_parent = True
-                except Exception:
-                    pass
-                upstream = f"{sha}^" if has_parent else "--root"
+            single_exec = f"exec {shlex.quote(sys.executable)} {shlex.quote(action_path)}"
+
+            current_shas = self._list_shas()
+
+            # Splitting HEAD needs no rebase at all: the action script runs directly
+            # on the clean tree, and a failure is undone by resetting back to sha.
+            # The index must be clean too (a staged submodule bump included), or the
+            # amend would take it in and the reset would throw it away.
+            at_head = (current_shas[:1] == [sha] and self.git_batch.resolve_commit("HEAD") == sha
+                       and not self.run_in_background(has_staged_changes, self.repo_path)
+                       and not self.run_in_background(has_uncommitted_changes, self.repo_path))
+            if at_head:
+                cmd = [sys.executable, action_path]
+                env = None
             else:
-                upstream = current_shas[sha_idx + 1]
+                sha_idx = current_shas.index(sha) if sha in current_shas else -1
+                if sha_idx == len(current_shas) - 1:
+                    has_parent = self.git_batch.has_parent(sha)
+                    upstream = f"{sha}^" if has_parent else "--root"
+                else:
+                    upstream = current_shas[sha_idx + 1]
 
-            env = os.environ.copy()
-            env["GIT_SEQUENCE_EDITOR"] = editor_script
-            env["GIT_EDITOR"] = "true"
+                env = self._exec_after_env(sha, single_exec)
 
-            if upstream == "--root":
-                cmd = ["git", "rebase", "-i", "--root"]
-            else:
-                cmd = ["git", "rebase", "-i", upstream]
+                if upstream == "--root":
+                    cmd = ["git", "rebase", "-i", "--root"]
+                else:
+                    cmd = ["git", "rebase", "-i", upstream]
 
-            result = subprocess.run(cmd, cwd=self.repo_path, env=env,
-                                    capture_output=True, text=True)
-            
-            try:
-                os.unlink(editor_script)
-                os.unlink(action_path)
-            except:
-                pass
+            result = self.run_in_background(subprocess.run, cmd, cwd=self.repo_path, env=env,
+                                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                            progress_title="Splitting Commit", progress_text=f"Moving '{filepath}' out of {short_sha}. Please wait...")
 
             if result.returncode == 0:
                 QMessageBox.information(self, "Success",
                     f"File '{filepath}' has been moved out of commit {short_sha}.\n\n"
                     f"A new commit was created with message: \"{filepath} changes separated out from {short_sha}\"")
             else:
-                subprocess.run(["git", "rebase", "--abort"],
-                               cwd=self.repo_path, capture_output=True)
+                abort_cmd = ["git", "reset", "--hard", sha] if at_head else ["git", "rebase", "--abort"]
+                subprocess.run(abort_cmd, cwd=self.repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 QMessageBox.critical(self, "Split Failed",
                     f"The split operation failed and has been aborted.\n\n"
-                    f"Error: {result.stderr}")
+                    f"Error: {decode_output(result.stderr)}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred during split: {str(e)}")
         finally:
+            # Scripts are removed even if writing them or the rebase itself raised
+            remove_temp_files(temp_paths)
             self.load_history()
 
     def handle_split_all_commits(self, item):
-        sha = item.text().split()[0]
+        sha = item.data(Qt.UserRole)
         try:
-            files = get_commit_files(self.repo_path, sha)
+            files = self.run_in_background(self.git_batch.get_commit_files, sha)
             if len(files) != 1:
                 QMessageBox.critical(
                     self,
@@ -2097,13 +2469,14 @@ finally:
             QMessageBox.critical(self, "Error", f"Could not check commit files: {str(e)}")
 
     def perform_split_all_commits(self, sha, filepath):
+        temp_paths = []
         try:
             short_sha = sha[:8]
-            original_msg = get_full_commit_message(self.repo_path, sha)
+            original_msg = self.git_batch.get_commit_message(sha)
             
             # The script will be executed when the sequence editor sees 'exec python3 <script>'
             split_script_content = f"""#!/usr/bin/env python3
-import sys, subprocess, os, tempfile
+import sys, subprocess
 
 target_sha = {repr(sha)}
 filepath = {repr(filepath)}
@@ -2140,110 +2513,67 @@ if current_hunk:
 if not hunks:
     sys.exit(0)
 
-# 3. Reset the working tree & index to parent commit state
-subprocess.check_call(['git', 'reset', '--hard', 'HEAD~1'])
+# 3. Move HEAD and the index back to the parent commit. The work tree is left
+# alone: it already holds the final content the last hunk will reach.
+subprocess.check_call(['git', 'reset', '-q', 'HEAD~1'])
 
-# 4. Apply each hunk as a separate patch and commit
+# 4. Apply each hunk to the index only and commit it. The patch and the message
+# go through stdin, so the file is never rewritten on disk per hunk and there
+# is no temp file, no external `patch` and no separate `git add`.
 for i, hunk in enumerate(hunks):
-    patch_content = '\\n'.join(header) + '\\n' + '\\n'.join(hunk) + '\\n'
-    with open('temp.patch', 'w', encoding='utf-8') as f:
-        f.write(patch_content)
-    
-    # Apply patch. --no-backup-if-mismatch ignores minor offset issues.
-    subprocess.check_call(['patch', '-p1', '-i', 'temp.patch', '--no-backup-if-mismatch'])
-    subprocess.check_call(['git', 'add', filepath])
-    
+    patch_content = '\\n'.join(header) + '\\n' + '\\n'.join(hunk).rstrip('\\n') + '\\n'
+    subprocess.run(['git', 'apply', '--cached', '--whitespace=nowarn', '-'],
+                   input=patch_content.encode('utf-8'), check=True)
+
     new_msg = f"change-{{i+1}} of {{target_sha[:8]}}\\n\\n{{original_msg}}"
-    
-    # Use temp file for multiline message
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8') as mf:
-        mf.write(new_msg)
-        mf_path = mf.name
-    try:
-        subprocess.check_call(['git', 'commit', '-F', mf_path])
-    finally:
-        if os.path.exists(mf_path):
-            os.unlink(mf_path)
-
-if os.path.exists('temp.patch'):
-    os.unlink('temp.patch')
+    subprocess.run(['git', 'commit', '-F', '-'], input=new_msg.encode('utf-8'), check=True)
 """
             
             # Write the action script
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.py', encoding='utf-8') as sf:
+            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.py', dir=self._tmpdir, encoding='utf-8') as sf:
                 sf.write(split_script_content)
                 split_action_script = sf.name
+            temp_paths.append(split_action_script)
             os.chmod(split_action_script, os.stat(split_action_script).st_mode | stat.S_IEXEC)
 
-            single_exec = f"exec python3 {split_action_script}"
-
-            current_shas = [self.list_widget.item(i).text().split()[0] for i in range(self.list_widget.count())]
-
-            # Write the sequence editor script
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.py', encoding='utf-8') as f:
-                f.write("#!/usr/bin/env python3\n")
-                f.write("import sys\n")
-                f.write(f"target_sha = {repr(sha)}\n")
-                f.write(f"single_exec = {repr(single_exec)}\n")
-                f.write("todo_path = sys.argv[1]\n")
-                f.write("with open(todo_path, 'r') as tf:\n")
-                f.write("    lines = tf.readlines()\n")
-                f.write("output = []\n")
-                f.write("for line in lines:\n")
-                f.write("    output.append(line)\n")
-                f.write("    stripped = line.strip()\n")
-                f.write("    if not stripped.startswith('#') and len(stripped.split()) >= 2 and stripped.split()[1].startswith(target_sha):\n")
-                f.write("        # Add our exec script AFTER the pick line\n")
-                f.write("        output.append(single_exec + '\\n')\n")
-                f.write("with open(todo_path, 'w') as tf:\n")
-                f.write("    tf.writelines(output)\n")
-                editor_script = f.name
-            os.chmod(editor_script, os.stat(editor_script).st_mode | stat.S_IEXEC)
+            single_exec = f"exec {shlex.quote(sys.executable)} {shlex.quote(split_action_script)}"
+
+            current_shas = self._list_shas()
 
             # Upstream logic
             sha_idx = current_shas.index(sha) if sha in current_shas else -1
             if sha_idx == len(current_shas) - 1:
-                has_parent = False
-                try:
-                    subprocess.run(["git", "rev-parse", f"{sha}^"], cwd=self.repo_path, check=True, capture_output=True)
-                    has_parent = True
-                except Exception:
-                    pass
+                has_parent = self.git_batch.has_parent(sha)
                 upstream = f"{sha}^" if has_parent else "--root"
             else:
                 upstream = current_shas[sha_idx + 1]
 
-            env = os.environ.copy()
-            env["GIT_SEQUENCE_EDITOR"] = editor_script
-            env["GIT_EDITOR"] = "true"
+            env = self._exec_after_env(sha, single_exec)
 
             cmd = ["git", "rebase", "-i", upstream] if upstream != "--root" else ["git", "rebase", "-i", "--root"]
 
-            result = subprocess.run(cmd, cwd=self.repo_path, env=env, capture_output=True, text=True)
-            
-            try:
-                os.unlink(editor_script)
-                os.unlink(split_action_script)
-            except:
-                pass
+            result = self.run_in_background(subprocess.run, cmd, cwd=self.repo_path, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                            progress_title="Splitting Commit", progress_text=f"Splitting {short_sha} for '{filepath}'. Please wait...")
 
             if result.returncode == 0:
                 QMessageBox.information(self, "Success",
                     f"Commit {short_sha} has been split into multiple commits for file '{filepath}'.")
             else:
-                subprocess.run(["git", "rebase", "--abort"], cwd=self.repo_path, capture_output=True)
+                subprocess.run(["git", "rebase", "--abort"], cwd=self.repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 QMessageBox.critical(self, "Split Failed",
-                    f"The split operation failed and has been aborted.\n\nError: {result.stderr}\nOutput: {result.stdout}")
+                    f"The split operation failed and has been aborted.\n\nError: {decode_output(result.stderr)}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred during split: {str(e)}")
         finally:
+            # Scripts are removed even if writing them or the rebase itself raised
+            remove_temp_files(temp_paths)
             self.load_history()
 
     def handle_split_per_file(self, item):
         """Splits each file in a commit into its own separate commit."""
-        sha = item.text().split()[0]
+        sha = item.data(Qt.UserRole)
         try:
-            files = get_commit_files(self.repo_path, sha)
+            files = self.run_in_background(self.git_batch.get_commit_files, sha)
             if not files:
                 QMessageBox.information(self, "No Files", f"Commit {sha} has no file changes to split.")
                 return
@@ -2257,9 +2587,10 @@ if os.path.exists('temp.patch'):
 
     def perform_split_per_file(self, sha, files):
         """Executes splitting each file into its own commit using rebase exec."""
+        temp_paths = []
         try:
             short_sha = sha[:8]
-            original_msg = get_full_commit_message(self.repo_path, sha)
+            original_msg = self.git_batch.get_commit_message(sha)
             
             # Action script content for splitting each file
             action_script_content = f"""#!/usr/bin/env python3
@@ -2297,83 +2628,124 @@ for i, filename in enumerate(files):
             except:
                 pass
 """
-            action_fd, action_path = tempfile.mkstemp(prefix='git_split_perfile_', suffix='.py', text=True)
+            action_fd, action_path = tempfile.mkstemp(prefix='git_split_perfile_', suffix='.py', dir=self._tmpdir, text=True)
+            temp_paths.append(action_path)
             with os.fdopen(action_fd, 'w', encoding='utf-8') as f:
                 f.write(action_script_content)
             os.chmod(action_path, os.stat(action_path).st_mode | stat.S_IEXEC)
             
-            single_exec = f"exec python3 {action_path}"
-
-            current_shas = [self.list_widget.item(i).text().split()[0]
-                            for i in range(self.list_widget.count())]
-
-            # Write the sequence editor script
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.py', encoding='utf-8') as f:
-                f.write("#!/usr/bin/env python3\n")
-                f.write("import sys\n")
-                f.write(f"target_sha = {repr(sha)}\n")
-                f.write(f"single_exec = {repr(single_exec)}\n")
-                f.write("todo_path = sys.argv[1]\n")
-                f.write("with open(todo_path, 'r') as tf:\n")
-                f.write("    lines = tf.readlines()\n")
-                f.write("output = []\n")
-                f.write("for line in lines:\n")
-                f.write("    output.append(line)\n")
-                f.write("    stripped = line.strip()\n")
-                f.write("    if not stripped.startswith('#') and len(stripped.split()) >= 2 and stripped.split()[1].startswith(target_sha):\n")
-                f.write("        # Add our exec line AFTER the pick line\n")
-                f.write("        output.append(single_exec + '\\n')\n")
-                f.write("with open(todo_path, 'w') as tf:\n")
-                f.write("    tf.writelines(output)\n")
-                editor_script = f.name
-            os.chmod(editor_script, os.stat(editor_script).st_mode | stat.S_IEXEC)
+            single_exec = f"exec {shlex.quote(sys.executable)} {shlex.quote(action_path)}"
+
+            current_shas = self._list_shas()
 
             # Upstream logic
             sha_idx = current_shas.index(sha) if sha in current_shas else -1
             if sha_idx == len(current_shas) - 1:
-                has_parent = False
-                try:
-                    subprocess.run(["git", "rev-parse", f"{sha}^"], cwd=self.repo_path, check=True, capture_output=True)
-                    has_parent = True
-                except Exception:
-                    pass
+                has_parent = self.git_batch.has_parent(sha)
                 upstream = f"{sha}^" if has_parent else "--root"
             else:
                 upstream = current_shas[sha_idx + 1]
 
-            env = os.environ.copy()
-            env["GIT_SEQUENCE_EDITOR"] = editor_script
-            env["GIT_EDITOR"] = "true"
+            env = self._exec_after_env(sha, single_exec)
 
             cmd = ["git", "rebase", "-i", upstream] if upstream != "--root" else ["git", "rebase", "-i", "--root"]
 
-            result = subprocess.run(cmd, cwd=self.repo_path, env=env, capture_output=True, text=True)
-            
-            try:
-                os.unlink(editor_script)
-                os.unlink(action_path) # Clean up the action script as well
-            except:
-                pass
+            result = self.run_in_background(subprocess.run, cmd, cwd=self.repo_path, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                            progress_title="Splitting Commit", progress_text=f"Splitting {short_sha} into {len(files)} commits. Please wait...")
 
             if result.returncode == 0:
                 QMessageBox.information(self, "Success",
                     f"Commit {short_sha} has been split into {len(files)} commits.")
             else:
-                subprocess.run(["git", "rebase", "--abort"], cwd=self.repo_path, capture_output=True)
+                subprocess.run(["git", "rebase", "--abort"], cwd=self.repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 QMessageBox.critical(self, "Split Failed",
-                    f"The split operation failed and has been aborted.\n\nError: {result.stderr}")
+                    f"The split operation failed and has been aborted.\n\nError: {decode_output(result.stderr)}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred during split: {str(e)}")
         finally:
+            # Scripts are removed even if writing them or the rebase itself raised
+            remove_temp_files(temp_paths)
             self.load_history()
 
+    def _read_rewritten_top(self, rewritten, is_root):
+        """
+        Reads what _apply_rewrite_in_place needs from git in one pool task: the branch,
+        the full HEAD SHA, the newest rewritten history entries and the branch labels.
+        """
+        branch, current_full_head = get_head_state(self.repo_path)
+        history = iter_git_history(self.repo_path, self.commit_sha, is_root=is_root)
+        try:
+            entries = list(itertools.islice(history, rewritten))
+        finally:
+            history.close()
+        branch_map = get_local_branches_map(self.repo_path, current_branch=branch)
+        return branch, current_full_head, entries, branch_map
+
+    def _apply_rewrite_in_place(self, new_shas, original_shas, rewritten=None):
+        """
+        After a successful rewrite, reorders the existing rows to new_shas and
+        relabels only the rewritten top rows instead of rebuilding the whole list.
+        rewritten: number of top rows in new_shas whose commits were rewritten. When
+                   omitted it is derived from the first SHA difference from the bottom,
+                   which is enough for drop/move but not for message-only changes.
+        Returns False if the result doesn't line up and a full load_history() is needed.
+        """
+        if rewritten is None:
+            # Commits below the first difference (from the bottom) were not rewritten
+            unchanged = 0
+            while (unchanged < min(len(new_shas), len(original_shas))
+                   and new_shas[-1 - unchanged] == original_shas[-1 - unchanged]):
+                unchanged += 1
+            rewritten = len(new_shas) - unchanged
+
+        branch, current_full_head, entries, branch_map = self.run_in_background(
+            self._read_rewritten_top, rewritten, not self.git_batch.has_parent(self.commit_sha))
+        if len(entries) != rewritten or (rewritten == 0 and current_full_head != new_shas[0]):
+            return False
+
+        old_row = self.list_widget.currentRow()
+        if not self.list_widget.restore_order(new_shas, removed=set(original_shas) - set(new_shas)):
+            return False
+        self._history_branch_map = branch_map
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            for row, (sha, line) in enumerate(entries):
+                item = self.list_widget.item(row)
+                item.setText(line)
+                item.setData(Qt.UserRole, sha)
+                item.setData(Qt.UserRole + 2, line.lower())
+            # Branch tips moved with the rewrite, so relabel every loaded row
+            for row in range(self.list_widget.count()):
+                item = self.list_widget.item(row)
+                branches = self._history_branch_map.get(item.data(Qt.UserRole))
+                item.setData(Qt.UserRole + 1, ", ".join(branches) if branches else None)
+            if self.list_widget.currentRow() < 0 and self.list_widget.count() > 0:
+                self.list_widget.setCurrentRow(max(0, min(old_row, self.list_widget.count() - 1)))
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
+
+        self.update_side_diff()
+        self.update_failsafe_button(current_full_head)
+        return True
+
     def perform_move(self, new_shas, original_shas=None):
         """Performs commit reordering using our unified rebase logic."""
-        print("Performing commit reorder...")
+        if original_shas is not None and list(new_shas) == list(original_shas):
+            # Dropped back where it came from: nothing to rebase
+            return
+        logger.debug("Performing commit reorder...")
+        head_before = self.run_in_background(get_full_head_sha, self.repo_path)
         if self.run_interactive_rebase(new_shas, original_shas=original_shas, progress_title="Moving Commits", progress_text="Reordering commits. Please wait..."):
-            self.load_history()
+            if original_shas is None or not self._apply_rewrite_in_place(new_shas, original_shas):
+                self.load_history()
             QMessageBox.information(self, "Success", "Commits reordered successfully!")
             return
+        if original_shas is not None and self.run_in_background(get_full_head_sha, self.repo_path) == head_before:
+            # Rebase was aborted cleanly: undo the visual drag instead of reloading history
+            if self.list_widget.restore_order(original_shas):
+                return
         self.load_history()
 
     def run_interactive_rebase(self, new_shas, rephrase_map=None, squash_shas=None, original_shas=None, progress_title="Rebasing", progress_text="Executing interactive rebase. Please wait...\nThis might take a few moments."):
@@ -2383,25 +2755,29 @@ for i, filename in enumerate(files):
                        for prefix comparison instead of reading list_widget (which
                        may already show the new order after a drag-drop).
         """
+        if not rephrase_map and not squash_shas:
+            display_shas = original_shas if original_shas is not None else self._list_shas()
+            if list(new_shas) == list(display_shas):
+                # Nothing to rewrite; without this the prefix logic would take the
+                # top-drop path and `reset --hard` onto HEAD itself
+                return True
         self.save_undo_state()
-        print("Starting interactive rebase...")
+        logger.debug("Starting interactive rebase...")
         try:
             # 1. Determine common prefix to minimize work
             # Use the explicitly passed original order when available (e.g., after a drag)
             if original_shas is not None:
                 display_shas = original_shas
             else:
-                display_shas = [self.list_widget.item(i).text().split()[0] for i in range(self.list_widget.count())]
+                display_shas = self._list_shas()
             old_order = list(reversed(display_shas))
             proposed_order = list(reversed(new_shas))
             
-            common_count = 0
-            for old, new in zip(old_order, proposed_order):
-                # A commit is only "common" if it's the same SHA AND not being modified
-                if old == new and (not rephrase_map or old not in rephrase_map) and (not squash_shas or old not in squash_shas):
-                    common_count += 1
-                else:
-                    break
+            # A commit is only "common" if it's the same SHA AND not being modified
+            modified = set(rephrase_map or ()) | set(squash_shas or ())
+            common_count = next((i for i, (old, new) in enumerate(zip(old_order, proposed_order))
+                                 if old != new or old in modified),
+                                min(len(old_order), len(proposed_order)))
             
             # Determine upstream and suffix to re-process
             if common_count > 0:
@@ -2420,15 +2796,12 @@ for i, filename in enumerate(files):
                         common_count = 0 # Fall back to full rebase logic below
             
             if common_count == 0:
-                # Check root status
-                has_parent = False
-                try:
-                    subprocess.run(["git", "rev-parse", f"{self.commit_sha}^"], 
-                                   cwd=self.repo_path, check=True, capture_output=True)
-                    has_parent = True
-                except:
-                    has_parent = False
-                upstream = f"{self.commit_sha}^" if has_parent else "--root"
+                # While history is only partly loaded, commits below the oldest
+                # loaded row are untouched, so rebase from that row's parent
+                base_sha = old_order[0] if self._history_stream is not None and old_order else self.commit_sha
+                # Check root status (answered from the cached commit object, no git fork)
+                has_parent = self.git_batch.has_parent(base_sha)
+                upstream = f"{base_sha}^" if has_parent else "--root"
                 todo_shas = proposed_order
 
             # Show progress dialog
@@ -2439,16 +2812,11 @@ for i, filename in enumerate(files):
             try:
                 # Feature: Fast-track top-drops (reset --hard)
                 if not todo_shas and common_count > 0:
-                    print(f"Fast-tracking drop via reset --hard to {upstream}")
-                    process = subprocess.Popen(["git", "reset", "--hard", upstream], 
-                                               cwd=self.repo_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                    while process.poll() is None:
-                        QApplication.processEvents()
-                        time.sleep(0.05)
-                    
-                    if process.returncode != 0:
-                        stdout, stderr = process.communicate()
-                        raise Exception(f"Fast-track reset failed: {stderr}")
+                    logger.debug("Fast-tracking drop via reset --hard to %s", upstream)
+                    reset_result = self.run_in_background(subprocess.run, ["git", "reset", "--hard", upstream],
+                                                          cwd=self.repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+                    if reset_result.returncode != 0:
+                        raise Exception(f"Fast-track reset failed: {decode_output(reset_result.stderr)}")
                     
                     # Small non-blocking delay to ensure the progress window is seen by the user
                     # and has a chance to paint correctly if the operation was near-instant.
@@ -2457,72 +2825,79 @@ for i, filename in enumerate(files):
                         time.sleep(0.05)
                     return True
 
-                # 2. Proceed with rebase for non-trivial changes
-                # Write each rephrase message to a temp file to handle multi-line messages safely
-                msg_files = {}  # sha -> temp file path
-                if rephrase_map:
-                    for sha, msg in rephrase_map.items():
-                        if sha in todo_shas:
-                            mf = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8')
-                            mf.write(msg)
-                            mf.close()
-                            msg_files[sha] = mf.name
-
-                # Build a sequence editor script that writes the rebase todo
-                with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.py') as f:
-                    f.write("#!/usr/bin/env python3\n")
-                    f.write("import sys\n")
-                    f.write(f"new_order = {todo_shas}\n")
-                    f.write(f"msg_files = {repr(msg_files)}\n")
-                    f.write(f"squash_shas = {squash_shas or []}\n")
-                    f.write("todo_path = sys.argv[1]\n")
-                    f.write("with open(todo_path, 'w') as f:\n")
-                    f.write("    for sha in new_order:\n")
-                    f.write("        op = 'squash' if sha in squash_shas else 'pick'\n")
-                    f.write("        f.write(f'{op} {sha}\\n')\n")
-                    f.write("        if sha in msg_files:\n")
-                    f.write("            mf = msg_files[sha]\n")
-                    f.write("            f.write(f'exec git commit --amend -F {mf}\\n')\n")
-                    editor_script = f.name
-
-                os.chmod(editor_script, os.stat(editor_script).st_mode | stat.S_IEXEC)
-
-                env = os.environ.copy()
-                env["GIT_SEQUENCE_EDITOR"] = editor_script
-                env["GIT_EDITOR"] = "true"
-
-                if upstream == "--root":
-                    cmd = ["git", "rebase", "-i", "--autosquash", "--root"]
-                else:
-                    cmd = ["git", "rebase", "-i", "--autosquash", upstream]
-
+                # Feature: Fast-track rephrase/squash of the top commits (commit --amend)
+                amend_msg = self._top_amend_message(todo_shas, old_order[common_count:], rephrase_map, squash_shas) if common_count > 0 else None
+                if amend_msg is not None:
+                    logger.debug("Fast-tracking rewrite of %d top commit(s) via commit --amend", len(todo_shas))
+                    self.run_in_background(self._amend_top_commits, todo_shas, amend_msg)
+                    return True
 
-                process = subprocess.Popen(cmd, cwd=self.repo_path, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                while process.poll() is None:
-                    QApplication.processEvents()
-                    time.sleep(0.05)
+                # Feature: Fast-track message-only rewrites deeper down (commit-tree, no rebase)
+                rephrase_plan = self._rephrase_plan(todo_shas, old_order[common_count:], rephrase_map, squash_shas)
+                if rephrase_plan is not None:
+                    logger.debug("Fast-tracking rephrase of %d commit(s) via commit-tree", len(rephrase_plan))
+                    self.run_in_background(self._rephrase_by_commit_tree, rephrase_plan, rephrase_map)
+                    return True
 
-                stdout, stderr = process.communicate()
+                # 2. Proceed with rebase for non-trivial changes
+                # Write each rephrase message to a temp file to handle multi-line messages safely
+                # A todo line can't span lines: one-line messages go inline with -m,
+                # multi-line ones through a temp file
+                msg_args = {}  # sha -> commit --amend message argument
+                temp_paths = []
+                try:
+                    if rephrase_map:
+                        for sha, msg in rephrase_map.items():
+                            if sha not in todo_shas:
+                                continue
+                            if "\n" not in msg.strip() and "\r" not in msg:
+                                msg_args[sha] = f"-m {shlex.quote(msg.strip())}"
+                                continue
+                            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', dir=self._tmpdir, encoding='utf-8') as mf:
+                                temp_paths.append(mf.name)
+                                mf.write(msg)
+                            msg_args[sha] = f"-F {shlex.quote(mf.name)}"
+
+                    # Write the final rebase todo up front; the sequence editor just copies it
+                    # over git's todo, so no interpreter is started at editor time
+                    todo_lines = []
+                    for sha in todo_shas:
+                        op = 'squash' if squash_shas and sha in squash_shas else 'pick'
+                        todo_lines.append(f"{op} {sha}\n")
+                        if sha in msg_args:
+                            todo_lines.append(f"exec git commit --amend {msg_args[sha]}\n")
+                    with tempfile.NamedTemporaryFile(mode='w', delete=False, prefix='git_todo_', suffix='.txt', dir=self._tmpdir, encoding='utf-8') as f:
+                        temp_paths.append(f.name)
+                        f.writelines(todo_lines)
+                        todo_file = f.name
+
+                    env = rebase_env(f"cp {shlex.quote(todo_file)}")
+
+                    # The todo above is final and replaces git's own, so autosquash would only
+                    # scan every message in the range for nothing (even with rebase.autoSquash set)
+                    if upstream == "--root":
+                        cmd = ["git", "rebase", "-i", "--no-autosquash", "--root"]
+                    else:
+                        cmd = ["git", "rebase", "-i", "--no-autosquash", upstream]
 
-                result = subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
-                os.unlink(editor_script)
-                # Clean up message temp files
-                for mf_path in msg_files.values():
-                    try:
-                        os.unlink(mf_path)
-                    except Exception:
-                        pass
+                    # git's step counter is forwarded from the worker thread to the dialog's bar
+                    rebase_progress = RebaseProgressSignals()
+                    rebase_progress.advanced.connect(progress.set_progress)
+                    result = self.run_in_background(run_rebase_with_progress, cmd, self.repo_path, env, rebase_progress.advanced.emit)
+                finally:
+                    # Clean up the todo and message temp files, even if anything above raised
+                    remove_temp_files(temp_paths)
 
                 if result.returncode == 0:
-                    # Update bottom anchor SHA
-                    if new_shas:
+                    # Update bottom anchor SHA (only meaningful when the full range is loaded)
+                    if new_shas and self._history_stream is None:
                         self.commit_sha = new_shas[-1]
                     return True
                 else:
-                    subprocess.run(["git", "rebase", "--abort"], cwd=self.repo_path, capture_output=True)
+                    subprocess.run(["git", "rebase", "--abort"], cwd=self.repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                     QMessageBox.critical(self, "Rebase Failed",
                         f"Action failed (likely due to merge conflicts).\n"
-                        f"The rebase has been aborted.\n\nError: {result.stderr}")
+                        f"The rebase has been aborted.\n\nError: {decode_output(result.stderr)}")
                     return False
 
             finally:
@@ -2534,6 +2909,102 @@ for i, filename in enumerate(files):
 
 
 
+    def _top_amend_message(self, todo_shas, old_top, rephrase_map, squash_shas):
+        """
+        Returns the message to amend HEAD with when a rewrite needs no rebase: the
+        commits to replay keep their order and end at HEAD, the oldest is picked, every
+        newer one is squashed into it and only the newest carries a new message.
+        Returns None when the full rebase is needed.
+        """
+        if not todo_shas or todo_shas != old_top or not rephrase_map:
+            return None
+        squash_shas = set(squash_shas or ())
+        if todo_shas[0] in squash_shas or any(sha not in squash_shas for sha in todo_shas[1:]):
+            return None
+        if [sha for sha in todo_shas if sha in rephrase_map] != [todo_shas[-1]]:
+            return None
+        # The list must match the repository, and amend would also pick up anything staged
+        # (a submodule bump included); the check runs off the UI thread
+        if (self.git_batch.resolve_commit("HEAD") != todo_shas[-1]
+                or self.run_in_background(has_staged_changes, self.repo_path)):
+            return None
+        return rephrase_map[todo_shas[-1]]
+
+    def _amend_top_commits(self, todo_shas, message):
+        """Folds todo_shas (oldest first, ending at HEAD) into the oldest one with message."""
+        head = todo_shas[-1]
+        if len(todo_shas) > 1:
+            # Keep the combined tree staged; amending the oldest keeps its author like squash does
+            subprocess.run(["git", "reset", "--soft", todo_shas[0]], cwd=self.repo_path, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        result = subprocess.run(["git", "commit", "--amend", "-F", "-"], cwd=self.repo_path, input=message.encode('utf-8'),
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            subprocess.run(["git", "reset", "--soft", head], cwd=self.repo_path,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            raise Exception(f"Amend failed: {decode_output(result.stderr)}")
+
+    def _rephrase_plan(self, todo_shas, old_top, rephrase_map, squash_shas):
+        """
+        Returns [(sha, {header: value}, message_bytes)] (oldest first) when the rewrite
+        only changes messages of a linear run of commits ending at HEAD. Trees stay the
+        same, so the commits can be recreated with commit-tree. Returns None when the
+        full rebase is needed.
+        """
+        if not todo_shas or todo_shas != old_top or not rephrase_map or squash_shas:
+            return None
+        if self.git_batch.resolve_commit("HEAD") != todo_shas[-1]:
+            return None
+        plan = []
+        previous = None
+        for sha in todo_shas:
+            raw_headers, _, message = self.git_batch.get_commit(sha).partition(b"\n\n")
+            fields = [line.split(b" ", 1) for line in raw_headers.split(b"\n") if not line.startswith(b" ")]
+            parents = [value.decode('ascii') for key, value in fields if key == b"parent"]
+            # Merges and non-UTF-8 messages are left to rebase (signatures are dropped like rebase does)
+            if len(parents) > 1 or any(key == b"encoding" for key, _ in fields):
+                return None
+            if previous is not None and parents != [previous]:
+                return None
+            previous = sha
+            plan.append((sha, dict(fields), message))
+        # commit-tree runs none of the prepare-commit-msg, commit-msg (e.g. Gerrit's
+        # Change-Id) and post-rewrite hooks and ignores commit.cleanup; repositories
+        # relying on any of them take the rebase instead
+        if self.run_in_background(uses_message_rules, self.repo_path, COMMIT_REWRITE_HOOKS):
+            return None
+        return plan
+
+    def _rephrase_by_commit_tree(self, plan, rephrase_map):
+        """Recreates the planned commits on their new parents, then moves HEAD in one step."""
+        parent = plan[0][1].get(b"parent")
+        parent = parent.decode('ascii') if parent else None
+        for sha, headers, message in plan:
+            if sha in rephrase_map:
+                # Whitespace-only cleanup, as `commit --amend -F` does without an editor ('#' lines are kept)
+                message = subprocess.run(["git", "stripspace"], cwd=self.repo_path, check=True,
+                                         input=rephrase_map[sha].encode('utf-8'), stdout=subprocess.PIPE).stdout
+            # "Name <email> <epoch> <+hhmm>"; the committer becomes the current user, as with rebase
+            name, _, rest = headers[b"author"].partition(b" <")
+            email, _, date = rest.partition(b"> ")
+            env = {**os.environ,
+                   "GIT_AUTHOR_NAME": name.decode('utf-8', errors='replace'),
+                   "GIT_AUTHOR_EMAIL": email.decode('utf-8', errors='replace'),
+                   "GIT_AUTHOR_DATE": date.decode('ascii', errors='replace')}
+            cmd = ["git", "commit-tree", headers[b"tree"].decode('ascii')]
+            if parent:
+                cmd += ["-p", parent]
+            result = subprocess.run(cmd + ["-F", "-"], cwd=self.repo_path, env=env, input=message,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            if result.returncode != 0:
+                raise Exception(f"Rephrase failed: {decode_output(result.stderr)}")
+            parent = result.stdout.decode('ascii').strip()
+        # Guarded by the old value, so a HEAD that moved meanwhile is left alone
+        result = subprocess.run(["git", "update-ref", "-m", "rebase (reword)", "HEAD", parent, plan[-1][0]],
+                                cwd=self.repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            raise Exception(f"Rephrase failed: {decode_output(result.stderr)}")
+
     def handle_manual_refresh(self):
         """Shows a progress dialog during manual refresh."""
         progress = ProgressDialog("Refreshing", "Refreshing git history. Please wait...", self)
@@ -2544,6 +3015,115 @@ for i, filename in enumerate(files):
         finally:
             progress.close()
 
+    def _add_history_items(self, entries, branch_map, start_row=None):
+        """
+        Adds a chunk of (full_sha, 'short_sha subject') entries to the commit list,
+        appended unless start_row gives the row to insert them at.
+        """
+        if not entries:
+            return
+        # Scroll-triggered pages arrive with updates and signals live; suspend them
+        # for the whole chunk (load_history already does so for the first page)
+        updates_enabled = self.list_widget.updatesEnabled()
+        signals_blocked = self.list_widget.blockSignals(True)
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            # One bulk insert per chunk, then attach per-row data
+            if start_row is None:
+                start_row = self.list_widget.count()
+            self.list_widget.insertItems(start_row, [line for _, line in entries])
+            for row, (sha, line) in enumerate(entries, start_row):
+                item = self.list_widget.item(row)
+                # Full SHA is stored once here; everything else reads it back from Qt.UserRole
+                item.setData(Qt.UserRole, sha)
+                # Lowercased label for the search filter, so it isn't re-lowered per keystroke
+                item.setData(Qt.UserRole + 2, line.lower())
+                if sha in branch_map:
+                    branches_str = ", ".join(branch_map[sha])
+                    item.setData(Qt.UserRole + 1, branches_str)
+        finally:
+            self.list_widget.setUpdatesEnabled(updates_enabled)
+            self.list_widget.blockSignals(signals_blocked)
+
+    def _replace_history_items(self, entries):
+        """
+        Sets the commit list to entries. Rows whose SHAs are unchanged at the top and
+        bottom keep their items (typically all but the few rows a rewrite touched);
+        only the rows in between are taken out and rebuilt.
+        """
+        old_shas = self._list_shas()
+        new_shas = [sha for sha, _ in entries]
+        limit = min(len(old_shas), len(new_shas))
+        top = next((i for i in range(limit) if old_shas[i] != new_shas[i]), limit)
+        bottom = next((i for i in range(limit - top) if old_shas[-1 - i] != new_shas[-1 - i]), limit - top)
+        for _ in range(len(old_shas) - top - bottom):
+            self.list_widget.takeItem(top)
+        changed = entries[top:len(entries) - bottom]
+        self._add_history_items(changed, self._history_branch_map, start_row=top)
+        # Kept rows: branch tips may have moved, and the search filter was cleared
+        for row in itertools.chain(range(top), range(len(entries) - bottom, len(entries))):
+            item = self.list_widget.item(row)
+            branches = self._history_branch_map.get(item.data(Qt.UserRole))
+            item.setData(Qt.UserRole + 1, ", ".join(branches) if branches else None)
+            item.setHidden(False)
+        if changed:
+            # Warm the message/author cache for the rebuilt rows, as for scrolled pages
+            self.start_background(self.git_batch.prefetch_commits, [sha for sha, _ in changed])
+
+    def _close_history_stream(self):
+        if self._history_stream is not None:
+            self._history_stream.close()
+            self._history_stream = None
+
+    def _invalidate_sha_list(self, *args):
+        self._sha_list = None
+
+    def _on_list_data_changed(self, top_left, bottom_right, roles=()):
+        if not roles or Qt.UserRole in roles:
+            self._sha_list = None
+
+    def _list_shas(self):
+        """Full SHAs of all loaded rows, newest first (a fresh list the caller may modify)."""
+        if self._sha_list is None:
+            self._sha_list = [self.list_widget.item(i).data(Qt.UserRole) for i in range(self.list_widget.count())]
+        return list(self._sha_list)
+
+    def _read_history_page(self, count):
+        """Takes up to count more entries from the open history stream (all remaining if None)."""
+        chunk = []
+        for entry in self._history_stream:
+            chunk.append(entry)
+            if count is not None and len(chunk) >= count:
+                break
+        else:
+            # Stream exhausted: the whole range is now in the list
+            self._close_history_stream()
+        return chunk
+
+    def _load_history_page(self, count=HISTORY_CHUNK_SIZE):
+        """Appends up to count more commits from the open history stream (all remaining if None)."""
+        if self._history_stream is None:
+            return
+        chunk = self._read_history_page(count)
+        self._add_history_items(chunk, self._history_branch_map)
+        if chunk:
+            # Warm the message/author cache for the new rows in one pipelined
+            # cat-file exchange, so squash/rephrase/copy don't wait on git later
+            self.start_background(self.git_batch.prefetch_commits, [sha for sha, _ in chunk])
+
+    def _on_history_scrolled(self, value):
+        """Loads the next page of history when the viewport nears the last loaded row."""
+        if self._history_stream is None:
+            return
+        last_visible = self.list_widget.indexAt(self.list_widget.viewport().rect().bottomLeft()).row()
+        if last_visible != -1 and last_visible < self.list_widget.count() - HISTORY_PREFETCH_ROWS:
+            return
+        try:
+            self._load_history_page()
+        except Exception as e:
+            self._close_history_stream()
+            QMessageBox.critical(self, "Error", str(e))
+
     def load_history(self):
         """Fetches git history and populates the list widget."""
         # Clear search when reloading history
@@ -2552,38 +3132,40 @@ for i, filename in enumerate(files):
             self.search_edit.clear()
             self.search_edit.blockSignals(False)
 
-        print("Refreshing...")
-        self.update_window_title()
+        logger.debug("Refreshing...")
+        # One rev-parse shared by the title, the origin button, the branch labels
+        # and the failsafe check below
+        branch, current_full_head = get_head_state(self.repo_path)
+        self.update_window_title(branch)
         
         # Update origin reset button label with current branch
         if hasattr(self, 'reset_origin_btn'):
-            branch = get_current_branch(self.repo_path)
             self.reset_origin_btn.setText(f"git reset --hard origin/{branch}")
         
         # Save current row to restore selection
         old_row = self.list_widget.currentRow()
+        old_count = self.list_widget.count()
         
-        self.list_widget.clear()
         self.list_widget.setUpdatesEnabled(False)
         self.list_widget.blockSignals(True)
         try:
-            history = get_git_history(self.repo_path, self.commit_sha)
-            branch_map = get_local_branches_map(self.repo_path)
-            
-            for line in history:
-                item = QListWidgetItem(line)
-                sha = line.split()[0]
-                if sha in branch_map:
-                    branches_str = ", ".join(branch_map[sha])
-                    item.setData(Qt.UserRole + 1, branches_str)
-                    
-                self.list_widget.addItem(item)
+            self._history_branch_map = get_local_branches_map(self.repo_path, current_branch=branch)
+
+            # Only the first page is read now; the rest of the `git log` stream is
+            # pulled on demand as the user scrolls (see _on_history_scrolled).
+            # Reload at least as many rows as before so the selection survives.
+            self._close_history_stream()
+            self._history_stream = iter_git_history(self.repo_path, self.commit_sha,
+                                                    is_root=not self.git_batch.has_parent(self.commit_sha))
+            self._replace_history_items(self._read_history_page(max(HISTORY_CHUNK_SIZE, old_count)))
             
             if self.list_widget.count() > 0:
                 # If nothing was selected before (-1), default to topmost commit (0)
                 # Otherwise, bound it to the new list size
                 new_row = max(0, min(old_row if old_row >= 0 else 0, self.list_widget.count() - 1))
                 self.list_widget.setCurrentRow(new_row)
+                # The selection signal is blocked here and the row may now hold another commit
+                self._side_diff_timer.start()
             else:
                 self.update_side_diff()
         except Exception as e:
@@ -2592,10 +3174,38 @@ for i, filename in enumerate(files):
             self.list_widget.setUpdatesEnabled(True)
             self.list_widget.blockSignals(False)
             
-        # Update Failsafe button state
-        current_head = get_head_sha(self.repo_path)
-        uncommitted = has_uncommitted_changes(self.repo_path)
-        if current_head == self.start_time_head[:8] and not uncommitted:
+        self.update_failsafe_button(current_full_head)
+
+    def update_failsafe_button(self, current_full_head):
+        """Enables the START_TIME_HEAD reset only when HEAD moved or the tree is dirty."""
+        self._failsafe_check += 1
+        self._failsafe_status_wanted = current_full_head == self.start_time_full_head
+        if not self._failsafe_status_wanted:
+            self._set_failsafe_enabled(True)
+            return
+        # HEAD is unchanged, so the work tree decides; `git status` can take a while on
+        # large trees, so it runs off the UI thread and the button follows when it reports.
+        # Refreshes arriving while one runs share a single follow-up run.
+        if not self._failsafe_status_running:
+            self._start_failsafe_status()
+
+    def _start_failsafe_status(self):
+        self._failsafe_status_running = True
+        self.start_background(has_uncommitted_changes, self.repo_path,
+                              on_finished=partial(self._on_failsafe_status, self._failsafe_check))
+
+    def _on_failsafe_status(self, check, uncommitted, error):
+        self._failsafe_status_running = False
+        if check != self._failsafe_check:
+            # Refreshed again meanwhile; the result may predate that refresh
+            if self._failsafe_status_wanted:
+                self._start_failsafe_status()
+            return
+        # If the status could not be read, keep the reset available
+        self._set_failsafe_enabled(error is not None or uncommitted)
+
+    def _set_failsafe_enabled(self, enabled):
+        if not enabled:
             self.failsafe_btn.setEnabled(False)
             self.failsafe_btn.setText(f"Reset Hard to START_TIME_HEAD (Already at {self.start_time_head[:8]})")
         else:
@@ -4,13 +4,16 @@ if __name__ == "__main__":
     print("Please run the main app: git_interactive_rebase.py (git-interactive-rebase-gui-tool)")
     sys.exit(1)
 
+import weakref
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QListWidget, QVBoxLayout, 
     QWidget, QMessageBox, QListWidgetItem, QMenu, QDialog,
     QTextEdit, QPushButton, QHBoxLayout, QLabel, QRadioButton,
     QLineEdit, QSplitter, QInputDialog, QProgressBar, QScrollArea
 )
-from PySide6.QtCore import Qt, QSize, QSettings, QTimer
+from PySide6.QtCore import Qt, QSize, QSettings, QTimer, QPoint
 from PySide6.QtGui import QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QAction, QShortcut, QKeySequence
 
 from lib.git_helpers import (
@@ -18,25 +21,134 @@ from lib.git_helpers import (
     get_full_commit_message, get_commit_metadata, get_revert_commit_message
 )
 
+@lru_cache(maxsize=None)
+def mono_font(size):
+    """Shared "Courier New" QFont per point size (widgets copy it on setFont)."""
+    return QFont("Courier New", size)
+
+# Safety cap on the number of lines a diff view will hold
+MAX_DIFF_BLOCKS = 200000
+# Diffs larger than this (in characters) are shown in a dialog without syntax highlighting
+MAX_HIGHLIGHT_CHARS = 512 * 1024
+
+def clip_diff(diff_text):
+    """
+    Returns diff_text cut to MAX_DIFF_BLOCKS lines, the last one saying how much was
+    left out. Past the cap the view itself would drop lines from the start instead,
+    taking the first file headers with them and without any sign.
+    """
+    if diff_text.count('\n') < MAX_DIFF_BLOCKS:
+        return diff_text
+    end = -1
+    for _ in range(MAX_DIFF_BLOCKS - 1):
+        end = diff_text.find('\n', end + 1)
+    hidden = diff_text.count('\n', end + 1) + (not diff_text.endswith('\n'))
+    return f"{diff_text[:end + 1]}[... diff truncated: {hidden} more lines not shown ...]"
+
+def configure_diff_view(text_edit):
+    """Strips editing overhead (undo stack, word-wrap layout) from a read-only diff QTextEdit."""
+    text_edit.setUndoRedoEnabled(False)
+    text_edit.setLineWrapMode(QTextEdit.NoWrap)
+    document = text_edit.document()
+    document.setUndoRedoEnabled(False)
+    document.setDocumentMargin(0)
+    document.setMaximumBlockCount(MAX_DIFF_BLOCKS)
+
 class DiffHighlighter(QSyntaxHighlighter):
-    def __init__(self, parent=None, added_color="#a6e22e", removed_color="#f92672", header_color="#66d9ef"):
+    # Extra blocks highlighted around the viewport so short scrolls never show unformatted text
+    VISIBLE_MARGIN = 100
+    HIGHLIGHTED_STATE = 1
+    # color -> QTextCharFormat, shared by every highlighter (setFormat copies it)
+    _format_cache = {}
+
+    @classmethod
+    def _char_format(cls, color):
+        fmt = cls._format_cache.get(color)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            cls._format_cache[color] = fmt
+        return fmt
+
+    def __init__(self, parent=None, added_color="#a6e22e", removed_color="#f92672", header_color="#66d9ef", text_edit=None):
         super().__init__(parent)
-        self.added_format = QTextCharFormat()
-        self.added_format.setForeground(QColor(added_color))
-        
-        self.removed_format = QTextCharFormat()
-        self.removed_format.setForeground(QColor(removed_color))
-        
-        self.header_format = QTextCharFormat()
-        self.header_format.setForeground(QColor(header_color))
+        self._colors = None
+        self._set_colors(added_color, removed_color, header_color)
+
+        # When bound to a QTextEdit, only blocks near the viewport are formatted;
+        # the rest are picked up lazily as the user scrolls.
+        self._text_edit = weakref.ref(text_edit) if text_edit is not None else None
+        self._visible_range = (0, self.VISIBLE_MARGIN)
+        if text_edit is not None:
+            self._refresh_timer = QTimer(self)
+            self._refresh_timer.setSingleShot(True)
+            self._refresh_timer.setInterval(50)
+            self._refresh_timer.timeout.connect(self._refresh_visible_blocks)
+            scroll_bar = text_edit.verticalScrollBar()
+            scroll_bar.valueChanged.connect(self._schedule_refresh)
+            scroll_bar.rangeChanged.connect(self._schedule_refresh)
+            text_edit.textChanged.connect(self._schedule_refresh)
+
+    def _set_colors(self, added_color, removed_color, header_color):
+        self._colors = (added_color, removed_color, header_color)
+        self.added_format = self._char_format(added_color)
+        self.removed_format = self._char_format(removed_color)
+        self.header_format = self._char_format(header_color)
+
+        # First character -> (prefix, format applies when the line starts with prefix?, format)
+        self._dispatch = {
+            '+': ('+++', False, self.added_format),
+            '-': ('---', False, self.removed_format),
+            'c': ('commit', True, self.header_format),
+            'd': ('diff', True, self.header_format),
+            'i': ('index', True, self.header_format),
+        }
+
+    def update_colors(self, added_color, removed_color, header_color):
+        """Switches colors in place (e.g. on a theme change); re-highlights only if they changed."""
+        if (added_color, removed_color, header_color) == self._colors:
+            return
+        self._set_colors(added_color, removed_color, header_color)
+        self.rehighlight()
+
+    def _schedule_refresh(self, *args):
+        self._refresh_timer.start()
+
+    def _refresh_visible_blocks(self):
+        """Formats the blocks around the viewport that were skipped while off-screen."""
+        text_edit = self._text_edit() if self._text_edit else None
+        doc = self.document()
+        try:
+            if text_edit is None or doc is None or text_edit.document() is not doc:
+                return
+            viewport_height = text_edit.viewport().height()
+            first = text_edit.cursorForPosition(QPoint(0, 0)).blockNumber()
+            last = text_edit.cursorForPosition(QPoint(0, max(0, viewport_height - 1))).blockNumber()
+        except RuntimeError:
+            # Underlying QTextEdit already deleted
+            return
+        self._visible_range = (max(0, first - self.VISIBLE_MARGIN), last + self.VISIBLE_MARGIN)
+
+        block = doc.findBlockByNumber(self._visible_range[0])
+        while block.isValid() and block.blockNumber() <= self._visible_range[1]:
+            if block.userState() != self.HIGHLIGHTED_STATE:
+                self.rehighlightBlock(block)
+            block = block.next()
 
     def highlightBlock(self, text):
-        if text.startswith('+') and not text.startswith('+++'):
-            self.setFormat(0, len(text), self.added_format)
-        elif text.startswith('-') and not text.startswith('---'):
-            self.setFormat(0, len(text), self.removed_format)
-        elif text.startswith('commit') or text.startswith('diff') or text.startswith('index'):
-            self.setFormat(0, len(text), self.header_format)
+        if self._text_edit is not None:
+            block_number = self.currentBlock().blockNumber()
+            if not (self._visible_range[0] <= block_number <= self._visible_range[1]):
+                self.setCurrentBlockState(-1)
+                return
+            self.setCurrentBlockState(self.HIGHLIGHTED_STATE)
+
+        # Single first-character lookup and at most one startswith() per line
+        entry = self._dispatch.get(text[:1])
+        if entry is not None:
+            prefix, match, fmt = entry
+            if text.startswith(prefix) == match:
+                self.setFormat(0, len(text), fmt)
 
 class DiffViewerDialog(QDialog):
     """Base dialog for viewing diffs with centered buttons."""
@@ -54,24 +166,16 @@ class DiffViewerDialog(QDialog):
         # Diff View
         self.diff_view = QTextEdit()
         self.diff_view.setReadOnly(True)
-        self.diff_view.setFont(QFont("Courier New", self.font_size))
-        self.diff_view.setPlainText(diff_text)
-        
-        # Determine highlighting colors based on parent theme or default to dark
-        app = QApplication.instance()
-        main_win = parent if isinstance(parent, QMainWindow) else None
-        if main_win and hasattr(main_win, 'current_theme_colors'):
-             colors = main_win.current_theme_colors
-        else:
-             # Default dark-ish colors if not found
-             colors = {"added": "#a6e22e", "removed": "#f92672", "header": "#66d9ef"}
-             
-        self.highlighter = DiffHighlighter(self.diff_view.document(), 
-                                           added_color=colors["added"],
-                                           removed_color=colors["removed"],
-                                           header_color=colors["header"])
-        
+        configure_diff_view(self.diff_view)
+        self.diff_view.setFont(mono_font(self.font_size))
         self.layout.addWidget(self.diff_view)
+
+        self.highlighter = None
+        self._highlight_colors = None
+        self.highlight_notice = QLabel()
+        self.highlight_notice.setStyleSheet("color: gray;")
+        self.layout.addWidget(self.highlight_notice)
+        self.set_diff(diff_text)
         
         # Buttons
         self.btn_layout = QHBoxLayout()
@@ -86,6 +190,40 @@ class DiffViewerDialog(QDialog):
     def setup_buttons(self):
         pass # To be overridden
 
+    def set_diff(self, diff_text):
+        """Shows diff_text, highlighted unless it is larger than MAX_HIGHLIGHT_CHARS."""
+        # Determine highlighting colors based on parent theme or default to dark
+        main_win = self.parent() if isinstance(self.parent(), QMainWindow) else None
+        if main_win and hasattr(main_win, 'current_theme_colors'):
+             colors = main_win.current_theme_colors
+        else:
+             # Default dark-ish colors if not found
+             colors = {"added": "#a6e22e", "removed": "#f92672", "header": "#66d9ef"}
+        colors = (colors["added"], colors["removed"], colors["header"])
+
+        highlight = len(diff_text) <= MAX_HIGHLIGHT_CHARS
+        # Detach before loading so the text isn't highlighted with stale settings
+        if self.highlighter is not None and (not highlight or colors != self._highlight_colors):
+            self.highlighter.setDocument(None)
+            self.highlighter = None
+        clipped = clip_diff(diff_text)
+        self.diff_view.setPlainText(clipped)
+        if highlight and self.highlighter is None:
+            self.highlighter = DiffHighlighter(self.diff_view.document(), 
+                                               added_color=colors[0],
+                                               removed_color=colors[1],
+                                               header_color=colors[2],
+                                               text_edit=self.diff_view)
+            self._highlight_colors = colors
+
+        notices = []
+        if not highlight:
+            notices.append(f"Syntax highlighting disabled for large diff ({len(diff_text) / 1024:.0f} KB)")
+        if clipped is not diff_text:
+            notices.append(f"Only the first {MAX_DIFF_BLOCKS - 1} lines are shown")
+        self.highlight_notice.setText("; ".join(notices))
+        self.highlight_notice.setVisible(bool(notices))
+
 class SplitCommitDialog(QDialog):
     """Dialog for moving a single file's changes out of a commit."""
     def __init__(self, repo_path, sha, files, font_size=10, parent=None):
@@ -99,16 +237,22 @@ class SplitCommitDialog(QDialog):
 
         # Diff colors from parent theme
         main_win = parent if isinstance(parent, QMainWindow) else None
+        # Per-file diffs are cut from the main window's cached commit diff when available
+        self.git_batch = getattr(main_win, 'git_batch', None)
         if main_win and hasattr(main_win, 'current_theme_colors'):
             colors = main_win.current_theme_colors
         else:
             colors = {"added": "#a6e22e", "removed": "#f92672", "header": "#66d9ef"}
         self.colors = colors
 
-        # Fetch commit details
+        # Fetch commit details (through the main window's persistent git process when available)
         try:
-            meta = get_commit_metadata(repo_path, sha)
-            msg = get_full_commit_message(repo_path, sha)
+            if main_win and hasattr(main_win, 'git_batch'):
+                meta = main_win.git_batch.get_commit_metadata(sha)
+                msg = main_win.git_batch.get_commit_message(sha)
+            else:
+                meta = get_commit_metadata(repo_path, sha)
+                msg = get_full_commit_message(repo_path, sha)
         except:
             meta = "Unknown"
             msg = "Could not fetch message"
@@ -131,7 +275,7 @@ class SplitCommitDialog(QDialog):
         self.msg_view = QTextEdit()
         self.msg_view.setReadOnly(True)
         self.msg_view.setPlainText(msg)
-        self.msg_view.setFont(QFont("Courier New", font_size))
+        self.msg_view.setFont(mono_font(font_size))
         msg_layout.addWidget(self.msg_view)
         
         self.main_splitter.addWidget(msg_widget)
@@ -144,7 +288,7 @@ class SplitCommitDialog(QDialog):
         
         self.file_list = QListWidget()
         self.file_list.setMinimumHeight(60)
-        self.file_list.setFont(QFont("Courier New", font_size))
+        self.file_list.setFont(mono_font(font_size))
         for f in files:
             self.file_list.addItem(f)
         self.file_list.currentTextChanged.connect(self.on_file_selected)
@@ -161,13 +305,15 @@ class SplitCommitDialog(QDialog):
         self.diff_view = QTextEdit()
         self.diff_view.setMinimumHeight(100)
         self.diff_view.setReadOnly(True)
-        self.diff_view.setFont(QFont("Courier New", font_size))
+        configure_diff_view(self.diff_view)
+        self.diff_view.setFont(mono_font(font_size))
         self.diff_view.setPlaceholderText("Select a file above to view its diff...")
         self.highlighter = DiffHighlighter(
             self.diff_view.document(),
             added_color=colors["added"],
             removed_color=colors["removed"],
-            header_color=colors["header"]
+            header_color=colors["header"],
+            text_edit=self.diff_view
         )
         diff_layout.addWidget(self.diff_view)
         
@@ -204,8 +350,11 @@ class SplitCommitDialog(QDialog):
         self.selected_file = filepath
         self.move_btn.setEnabled(True)
         try:
-            diff = get_file_diff_only_in_commit(self.repo_path, self.sha, filepath)
-            self.diff_view.setPlainText(diff)
+            if self.git_batch is not None:
+                diff = self.git_batch.get_file_diff(self.sha, filepath)
+            else:
+                diff = get_file_diff_only_in_commit(self.repo_path, self.sha, filepath)
+            self.diff_view.setPlainText(clip_diff(diff))
         except Exception as e:
             self.diff_view.setPlainText(f"Error loading diff: {e}")
 
@@ -246,15 +395,31 @@ class ViewCommitDialog(DiffViewerDialog):
         label = QLabel(f"Showing changes for commit: <b>{sha}</b>  <span style='color:gray;'>({self._commit_meta})</span>")
         label.setTextFormat(Qt.RichText)
         self.layout.addWidget(label)
+        self.header_label = label
 
         # Commit message box
         msg_box = QTextEdit()
         msg_box.setReadOnly(True)
         msg_box.setPlainText(self._commit_message)
-        msg_box.setFont(QFont("Courier New", self.font_size))
+        msg_box.setFont(mono_font(self.font_size))
         msg_box.setLineWrapMode(QTextEdit.WidgetWidth)
         msg_box.setProperty("class", "commit-msg-view")
         self.layout.addWidget(msg_box)
+        self.msg_box = msg_box
+
+    def set_commit(self, sha, commit_message, commit_meta, diff_text, font_size=None):
+        """Re-targets an existing dialog at another commit, so it can be reused across opens."""
+        self._commit_message = commit_message
+        self._commit_meta = commit_meta
+        self.setWindowTitle(f"View Commit: {sha}")
+        self.header_label.setText(f"Showing changes for commit: <b>{sha}</b>  <span style='color:gray;'>({commit_meta})</span>")
+        self.msg_box.setPlainText(commit_message)
+        if font_size is not None and font_size != self.font_size:
+            self.font_size = font_size
+            self.msg_box.setFont(mono_font(font_size))
+            self.diff_view.setFont(mono_font(font_size))
+        self.diff_view.verticalScrollBar().setValue(0)
+        self.set_diff(diff_text)
 
     def setup_buttons(self):
         ok_btn = QPushButton("Ok")
@@ -274,15 +439,21 @@ class FileWiseViewDialog(QDialog):
         self.setMinimumSize(860, 620)
 
         main_win = parent if isinstance(parent, QMainWindow) else None
+        # Per-file diffs are cut from the main window's cached commit diff when available
+        self.git_batch = getattr(main_win, 'git_batch', None)
         if main_win and hasattr(main_win, 'current_theme_colors'):
             colors = main_win.current_theme_colors
         else:
             colors = {"added": "#a6e22e", "removed": "#f92672", "header": "#66d9ef"}
 
-        # Fetch commit details
+        # Fetch commit details (through the main window's persistent git process when available)
         try:
-            meta = get_commit_metadata(repo_path, sha)
-            msg = get_full_commit_message(repo_path, sha)
+            if main_win and hasattr(main_win, 'git_batch'):
+                meta = main_win.git_batch.get_commit_metadata(sha)
+                msg = main_win.git_batch.get_commit_message(sha)
+            else:
+                meta = get_commit_metadata(repo_path, sha)
+                msg = get_full_commit_message(repo_path, sha)
         except:
             meta = "Unknown"
             msg = "Could not fetch message"
@@ -305,7 +476,7 @@ class FileWiseViewDialog(QDialog):
         self.msg_view = QTextEdit()
         self.msg_view.setReadOnly(True)
         self.msg_view.setPlainText(msg)
-        self.msg_view.setFont(QFont("Courier New", font_size))
+        self.msg_view.setFont(mono_font(font_size))
         msg_layout.addWidget(self.msg_view)
         
         self.main_splitter.addWidget(msg_widget)
@@ -318,7 +489,7 @@ class FileWiseViewDialog(QDialog):
         
         self.file_list = QListWidget()
         self.file_list.setMinimumHeight(60)
-        self.file_list.setFont(QFont("Courier New", font_size))
+        self.file_list.setFont(mono_font(font_size))
         for f in files:
             self.file_list.addItem(f)
         self.file_list.currentTextChanged.connect(self.on_file_selected)
@@ -335,13 +506,15 @@ class FileWiseViewDialog(QDialog):
         self.diff_view = QTextEdit()
         self.diff_view.setMinimumHeight(100)
         self.diff_view.setReadOnly(True)
-        self.diff_view.setFont(QFont("Courier New", font_size))
+        configure_diff_view(self.diff_view)
+        self.diff_view.setFont(mono_font(font_size))
         self.diff_view.setPlaceholderText("Select a file above to view its diff...")
         self.highlighter = DiffHighlighter(
             self.diff_view.document(),
             added_color=colors["added"],
             removed_color=colors["removed"],
-            header_color=colors["header"]
+            header_color=colors["header"],
+            text_edit=self.diff_view
         )
         diff_layout.addWidget(self.diff_view)
         
@@ -369,13 +542,18 @@ class FileWiseViewDialog(QDialog):
         if not filepath:
             return
         try:
-            diff = get_file_diff_only_in_commit(self.repo_path, self.sha, filepath)
-            self.diff_view.setPlainText(diff)
+            if self.git_batch is not None:
+                diff = self.git_batch.get_file_diff(self.sha, filepath)
+            else:
+                diff = get_file_diff_only_in_commit(self.repo_path, self.sha, filepath)
+            self.diff_view.setPlainText(clip_diff(diff))
         except Exception as e:
             self.diff_view.setPlainText(f"Error loading diff: {e}")
 
 class DropDialog(DiffViewerDialog):
-    def __init__(self, sha, diff_text, font_size=10, parent=None):
+    def __init__(self, sha, diff_text, font_size=10, parent=None, full_diff_loader=None):
+        # When set, diff_text is only a summary and the full diff is fetched on demand
+        self.full_diff_loader = full_diff_loader
         super().__init__("Confirm Drop Commit", sha, diff_text, font_size, parent)
 
     def setup_header(self, sha):
@@ -406,6 +584,21 @@ class DropDialog(DiffViewerDialog):
         self.btn_layout.addWidget(self.yes_btn)
         self.btn_layout.addWidget(self.no_btn)
 
+        if self.full_diff_loader is not None:
+            self.full_diff_btn = QPushButton("Show Full Diff")
+            self.full_diff_btn.setMinimumWidth(120)
+            self.full_diff_btn.setProperty("class", "dialog-btn-secondary")
+            self.full_diff_btn.clicked.connect(self.show_full_diff)
+            self.btn_layout.addWidget(self.full_diff_btn)
+
+    def show_full_diff(self):
+        self.full_diff_btn.setEnabled(False)
+        try:
+            self.set_diff(self.full_diff_loader())
+        except Exception as e:
+            self.diff_view.setPlainText(f"Error loading diff: {e}")
+            self.full_diff_btn.setEnabled(True)
+
 class RephraseDialog(QDialog):
     """Dialog for editing commit message."""
     def __init__(self, sha, current_message, font_size=10, parent=None):
@@ -420,7 +613,7 @@ class RephraseDialog(QDialog):
         layout.addWidget(label)
         
         self.message_edit = QTextEdit()
-        self.message_edit.setFont(QFont("Courier New", self.font_size))
+        self.message_edit.setFont(mono_font(self.font_size))
         self.message_edit.setPlainText(current_message)
         layout.addWidget(self.message_edit)
         
@@ -472,7 +665,7 @@ class RevertCommitDialog(QDialog):
         layout.addWidget(label)
 
         self.message_edit = QTextEdit()
-        self.message_edit.setFont(QFont("Courier New", self.font_size))
+        self.message_edit.setFont(mono_font(self.font_size))
         self.message_edit.setPlainText(revert_message)
         layout.addWidget(self.message_edit)
 
@@ -530,7 +723,7 @@ class SquashDialog(QDialog):
         
         # Text Editor
         self.editor = QTextEdit()
-        self.editor.setFont(QFont("Courier New", self.font_size))
+        self.editor.setFont(mono_font(self.font_size))
         layout.addWidget(self.editor)
         
         # Connections
@@ -616,7 +809,7 @@ class MultiSquashDialog(QDialog):
         
         # Text editor
         self.editor = QTextEdit()
-        self.editor.setFont(QFont("Courier New", font_size))
+        self.editor.setFont(mono_font(font_size))
         self.editor.setMinimumHeight(100)
 
         # Add to splitter
@@ -696,6 +889,12 @@ class ProgressDialog(QDialog):
         # Add some spacing at the bottom
         layout.addSpacing(10)
 
+    def set_progress(self, done, total):
+        """Switches the bar from indeterminate to showing done of total steps."""
+        self.progress_bar.setFormat("%v / %m")
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+
 
 class UnstagedChangesDialog(QDialog):
     """Warning dialog for unstaged changes on startup."""
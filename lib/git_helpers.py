@@ -4,52 +4,596 @@ if __name__ == "__main__":
     print("Please run the main app: git_interactive_rebase.py (git-interactive-rebase-gui-tool)")
     sys.exit(1)
 
+import hashlib
+import logging
+import os
+import sqlite3
 import subprocess
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 
-def get_git_history(repo_path, commit_sha):
-    """Fetches git history from HEAD down to commit_sha inclusive."""
-    try:
-        # Check if commit_sha has a parent
-        has_parent = False
+# Trace output; shown with --verbose (see git_interactive_rebase.py)
+logger = logging.getLogger(__name__)
+
+def _git_env():
+    """
+    Environment for read-only git calls: skip optional index.lock refreshes,
+    skip locale lookups and never block on a credential prompt.
+    """
+    return {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C", "GIT_TERMINAL_PROMPT": "0"}
+
+def _run_git(cmd, **kwargs):
+    """subprocess.run() for read-only git commands (see _git_env)."""
+    # Pipes created by subprocess are already non-inheritable, so the fd sweep is wasted work
+    return subprocess.run(cmd, env=_git_env(), close_fds=(os.name != "posix"), **kwargs)
+
+class DiffDiskCache:
+    """
+    On-disk store of commit diffs for one repository, kept across app runs.
+    Commits are immutable, so entries are keyed by full SHA only and never go
+    stale; the least recently used ones are evicted once the file grows past
+    MAX_BYTES. Any sqlite/filesystem error simply disables the cache.
+    """
+
+    # Upper bound for the compressed diffs stored per repository
+    MAX_BYTES = 10 * 1024 * 1024
+
+    def __init__(self, repo_path):
+        self._db = None
+        # sha -> last read time; hits are written back with the next put() or close()
+        # so a cache read never turns into a disk write
+        self._touched = {}
         try:
-            subprocess.run(["git", "rev-parse", f"{commit_sha}^"], 
-                           cwd=repo_path, check=True, capture_output=True, encoding='utf-8', errors='replace')
-            has_parent = True
-        except:
-            has_parent = False
-
-        if has_parent:
-            # Exclusive range: commit_sha..HEAD shows only commits after commit_sha (not including it)
-            cmd = ["git", "log", f"{commit_sha}..HEAD", "--oneline"]
-        else:
-            # Root commit case: show everything reachable from HEAD
-            cmd = ["git", "log", "HEAD", "--oneline"]
-        
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
-        return [line for line in result.stdout.strip().split('\n') if line.strip()]
-    except subprocess.CalledProcessError as e:
-        raise Exception(f"Failed to fetch git history: {e.stderr}")
+            cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+            cache_dir = os.path.join(cache_root, "git_interactive_rebase")
+            os.makedirs(cache_dir, exist_ok=True)
+            name = hashlib.md5(os.path.realpath(repo_path).encode('utf-8')).hexdigest()
+            # Only used under GitCatFileBatch's lock, which may be taken from pool threads
+            self._db = sqlite3.connect(os.path.join(cache_dir, f"{name}.sqlite"), check_same_thread=False)
+            self._db.execute("PRAGMA synchronous=OFF")
+            self._db.execute("CREATE TABLE IF NOT EXISTS diffs (sha TEXT PRIMARY KEY, diff BLOB, size INTEGER, last_used REAL)")
+            self._db.commit()
+        except (sqlite3.Error, OSError):
+            self._db = None
+
+    def get(self, sha):
+        """Cached diff text for a full SHA, or None."""
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute("SELECT diff FROM diffs WHERE sha = ?", (sha,)).fetchone()
+            if row is None:
+                return None
+            self._touched[sha] = time.time()
+            return zlib.decompress(row[0]).decode('utf-8')
+        except (sqlite3.Error, zlib.error, UnicodeDecodeError):
+            return None
+
+    def put(self, sha, diff_text):
+        """Stores the diff for a full SHA and evicts the oldest entries beyond MAX_BYTES."""
+        if self._db is None:
+            return
+        data = zlib.compress(diff_text.encode('utf-8'))
+        if len(data) > self.MAX_BYTES:
+            return
+        try:
+            # Record pending hits first, so eviction below sees the real usage order
+            self._flush_touched()
+            self._db.execute("INSERT OR REPLACE INTO diffs VALUES (?, ?, ?, ?)", (sha, data, len(data), time.time()))
+            total = self._db.execute("SELECT SUM(size) FROM diffs").fetchone()[0] or 0
+            if total > self.MAX_BYTES:
+                evicted = []
+                for old_sha, size in self._db.execute("SELECT sha, size FROM diffs ORDER BY last_used"):
+                    if total <= self.MAX_BYTES:
+                        break
+                    evicted.append((old_sha,))
+                    total -= size
+                self._db.executemany("DELETE FROM diffs WHERE sha = ?", evicted)
+            self._db.commit()
+        except sqlite3.Error:
+            pass
+
+    def _flush_touched(self):
+        if self._touched:
+            self._db.executemany("UPDATE diffs SET last_used = ? WHERE sha = ?",
+                                 [(used, sha) for sha, used in self._touched.items()])
+            self._touched.clear()
+
+    def close(self):
+        if self._db is not None:
+            try:
+                self._flush_touched()
+                self._db.commit()
+            except sqlite3.Error:
+                pass
+            try:
+                self._db.close()
+            except sqlite3.Error:
+                pass
+            self._db = None
+
+class GitCatFileBatch:
+    """
+    Long-running `git cat-file --batch` process shared for the app's lifetime.
+    Diffs are served by a companion `git diff-tree --stdin` process and name
+    lookups by a `git cat-file --batch-check` one, so repeated View/Drop clicks
+    don't pay fork+exec+repo-open for every lookup.
+    """
+
+    # Number of commit diffs kept in memory (LRU)
+    DIFF_CACHE_SIZE = 128
+    # Number of parsed commit objects (headers + message) kept in memory (LRU).
+    # Entries are small, so this covers the whole visible history of most branches.
+    COMMIT_CACHE_SIZE = 4096
+    # Number of per-commit changed-file lists kept in memory (LRU)
+    FILES_CACHE_SIZE = 1024
+    # Number of commits (from HEAD down) whose diffs are prefetched at startup
+    PREFETCH_COUNT = 32
+
+    def __init__(self, repo_path):
+        self.repo_path = repo_path
+        self._lock = threading.Lock()
+        self._cat_file = None
+        self._cat_file_check = None
+        self._diff_tree = None
+        # Both caches are keyed by full SHA only, so a ref name can never return stale data
+        self._diff_cache = OrderedDict()
+        self._commit_cache = OrderedDict()
+        self._files_cache = OrderedDict()
+        # Diffs also survive restarts on disk, so reopening the same repo skips diff-tree
+        self._disk_cache = DiffDiskCache(repo_path)
+        # diff-tree echoes non-commit input lines verbatim, which marks the end of each diff
+        self._sentinel = f"--git-interactive-rebase-end-{uuid.uuid4().hex}--"
+
+    def _start(self, cmd):
+        return subprocess.Popen(cmd, cwd=self.repo_path, env=_git_env(), stdin=subprocess.PIPE,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+    def _read_object(self, sha):
+        if self._cat_file is None or self._cat_file.poll() is not None:
+            self._cat_file = self._start(["git", "cat-file", "--batch"])
+        proc = self._cat_file
+        proc.stdin.write(f"{sha}\n".encode('utf-8'))
+        proc.stdin.flush()
+
+        # Header: "<sha> <type> <size>" or "<name> missing" / "<name> ambiguous"
+        header = proc.stdout.readline().decode('utf-8', errors='replace').split()
+        if len(header) != 3:
+            raise Exception(f"Object not found: {sha}")
+        full_sha, obj_type, size = header
+        data = proc.stdout.read(int(size))
+        proc.stdout.read(1)  # trailing newline after the contents
+        return full_sha, obj_type, data
+
+    def resolve_commit(self, name):
+        """Full SHA of the commit that name (SHA, ref, `<sha>^` ...) points to, or None if it does not exist."""
+        with self._lock:
+            try:
+                if self._cat_file_check is None or self._cat_file_check.poll() is not None:
+                    self._cat_file_check = self._start(["git", "cat-file", "--batch-check"])
+                proc = self._cat_file_check
+                proc.stdin.write(f"{name}^{{commit}}\n".encode('utf-8'))
+                proc.stdin.flush()
+                # "<sha> commit <size>" or "<name> missing" / "<name> ambiguous"
+                header = proc.stdout.readline().decode('utf-8', errors='replace').split()
+            except (OSError, ValueError):
+                self._stop()
+                return None
+        if len(header) != 3:
+            return None
+        return header[0]
+
+    def get_object(self, sha):
+        """Returns (full_sha, type, raw_bytes) for the given object name."""
+        with self._lock:
+            try:
+                return self._read_object(sha)
+            except (OSError, ValueError) as e:
+                self._stop()
+                raise Exception(f"Failed to read object {sha}: {e}")
+
+    def get_commit(self, sha):
+        """Returns the raw commit object (headers + message) as bytes."""
+        full_sha, obj_type, data = self.get_object(f"{sha}^{{commit}}")
+        return data
+
+    @staticmethod
+    def _cache_put(cache, key, value, limit):
+        cache[key] = value
+        if len(cache) > limit:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _split_commit(data):
+        """Splits raw commit object bytes into ({header: value}, message)."""
+        raw_headers, _, raw_message = data.partition(b"\n\n")
+        headers = {}
+        for line in raw_headers.split(b"\n"):
+            if line.startswith(b" "):
+                continue  # continuation of a multi-line header (e.g. gpgsig)
+            key, _, value = line.partition(b" ")
+            headers.setdefault(key.decode('ascii', errors='replace'), value)
+        encoding = headers.get("encoding", b"utf-8").decode('ascii', errors='replace')
+        try:
+            message = raw_message.decode(encoding, errors='replace')
+        except LookupError:
+            message = raw_message.decode('utf-8', errors='replace')
+        return headers, message
+
+    def _parse_commit(self, sha):
+        """Splits a commit object into ({header: value}, message)."""
+        with self._lock:
+            if sha in self._commit_cache:
+                self._commit_cache.move_to_end(sha)
+                return self._commit_cache[sha]
+        full_sha, _, data = self.get_object(f"{sha}^{{commit}}")
+        parsed = self._split_commit(data)
+        with self._lock:
+            self._cache_put(self._commit_cache, full_sha, parsed, self.COMMIT_CACHE_SIZE)
+        return parsed
+
+    def prefetch_commits(self, shas):
+        """
+        Loads several commit objects into the cache with one pipelined exchange:
+        all names are written up front and the replies read back in order,
+        instead of a full request/response round-trip per commit.
+        """
+        with self._lock:
+            wanted = [sha for sha in shas if sha not in self._commit_cache]
+            if not wanted:
+                return
+            try:
+                if self._cat_file is None or self._cat_file.poll() is not None:
+                    self._cat_file = self._start(["git", "cat-file", "--batch"])
+                proc = self._cat_file
+                request = "".join(f"{sha}^{{commit}}\n" for sha in wanted).encode('utf-8')
+
+                # Write from a helper thread so a full stdout pipe can't deadlock us
+                def write_request():
+                    try:
+                        proc.stdin.write(request)
+                        proc.stdin.flush()
+                    except OSError:
+                        pass
+                writer = threading.Thread(target=write_request, daemon=True)
+                writer.start()
+                for _ in wanted:
+                    header = proc.stdout.readline().decode('utf-8', errors='replace').split()
+                    if not header:
+                        raise OSError("git cat-file exited unexpectedly")
+                    if len(header) != 3:
+                        continue  # "<name> missing": no contents follow
+                    full_sha, _, size = header
+                    data = proc.stdout.read(int(size))
+                    proc.stdout.read(1)
+                    self._cache_put(self._commit_cache, full_sha, self._split_commit(data), self.COMMIT_CACHE_SIZE)
+                writer.join()
+            except (OSError, ValueError) as e:
+                self._stop()
+                raise Exception(f"Failed to read commits: {e}")
+
+    def get_commit_message(self, sha):
+        """Full (multi-line) commit message, like `git log -1 --format=%B`."""
+        try:
+            return self._parse_commit(sha)[1].strip()
+        except Exception as e:
+            raise Exception(f"Failed to fetch commit message: {e}")
+
+    def has_parent(self, sha):
+        """True if the commit has at least one parent (False for root commits or unknown names)."""
+        try:
+            return "parent" in self._parse_commit(sha)[0]
+        except Exception:
+            return False
+
+    def get_commit_metadata(self, sha):
+        """Author name, email, and date, like get_commit_metadata() but without a git process."""
+        try:
+            headers, _ = self._parse_commit(sha)
+            # "Name <email> <epoch> <+hhmm>"
+            ident, epoch, tz = headers["author"].decode('utf-8', errors='replace').rsplit(" ", 2)
+            sign = -1 if tz.startswith("-") else 1
+            offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[3:5])) * sign
+            date = datetime.fromtimestamp(int(epoch), timezone(offset))
+            # Month names are spelled out so the result does not depend on the process locale
+            month = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")[date.month - 1]
+            return f"{ident}, {date.day:02d} {month} {date.year} {date.hour:02d}:{date.minute:02d}"
+        except Exception:
+            return "Unknown author"
+
+    def get_diff(self, sha):
+        """Fetches the diff for a specific commit (as `git show --format= --no-renames`)."""
+        with self._lock:
+            if sha in self._diff_cache:
+                self._diff_cache.move_to_end(sha)
+                return self._diff_cache[sha]
+            try:
+                full_sha, _, _ = self._read_object(f"{sha}^{{commit}}")
+                if full_sha in self._diff_cache:
+                    self._diff_cache.move_to_end(full_sha)
+                    return self._diff_cache[full_sha]
+                diff_text = self._disk_cache.get(full_sha)
+                if diff_text is not None:
+                    self._cache_put(self._diff_cache, full_sha, diff_text, self.DIFF_CACHE_SIZE)
+                    return diff_text
+                if self._diff_tree is None or self._diff_tree.poll() is not None:
+                    self._diff_tree = self._start(["git", "diff-tree", "--stdin", "--no-renames", "--diff-algorithm=myers", "--cc", "--root", "--no-commit-id"])
+                proc = self._diff_tree
+                proc.stdin.write(f"{full_sha}\n{self._sentinel}\n".encode('utf-8'))
+                proc.stdin.flush()
+
+                end_marker = f"{self._sentinel}\n".encode('utf-8')
+                chunks = []
+                while True:
+                    line = proc.stdout.readline()
+                    if not line:
+                        raise OSError("git diff-tree exited unexpectedly")
+                    if line == end_marker:
+                        break
+                    chunks.append(line)
+                diff_text = b"".join(chunks).decode('utf-8', errors='replace')
+            except (OSError, ValueError) as e:
+                self._stop()
+                raise Exception(f"Failed to fetch diff: {e}")
+
+            self._cache_put(self._diff_cache, full_sha, diff_text, self.DIFF_CACHE_SIZE)
+            self._disk_cache.put(full_sha, diff_text)
+            return diff_text
+
+    def get_commit_files(self, sha):
+        """Paths changed by a commit, like get_commit_files() but cached per full SHA."""
+        full_sha = self.resolve_commit(sha)
+        if full_sha is None:
+            raise Exception(f"Failed to list commit files: unknown commit {sha}")
+        with self._lock:
+            if full_sha in self._files_cache:
+                self._files_cache.move_to_end(full_sha)
+                return list(self._files_cache[full_sha])
+            diff_text = self._diff_cache.get(full_sha)
+        # Most commits clicked in the list already have their diff cached (prefetch,
+        # side panel), and its headers name every changed file
+        files = self._files_from_diff(diff_text) if diff_text is not None else None
+        if files is None:
+            files = get_commit_files(self.repo_path, full_sha)
+        with self._lock:
+            self._cache_put(self._files_cache, full_sha, tuple(files), self.FILES_CACHE_SIZE)
+        return files
+
+    @staticmethod
+    def _files_from_diff(diff_text):
+        """
+        Paths named by the 'diff --git a/P b/P' headers of a cached diff, in diff-tree
+        order, or None when they can't be read back reliably (quoted paths, merges).
+        """
+        files = []
+        for line in diff_text.split("\n"):
+            if not line.startswith("diff "):
+                continue
+            if not line.startswith("diff --git a/"):
+                return None  # combined (merge) diff or a quoted path
+            # Rename detection is off, so both halves are the same path: "a/P b/P"
+            paths = line[len("diff --git "):]
+            half = (len(paths) - 1) // 2
+            if len(paths) % 2 == 0 or paths[half] != " " or paths[2:half] != paths[half + 3:]:
+                return None
+            files.append(paths[2:half])
+        return files
+
+    def get_file_diff(self, sha, filepath):
+        """
+        One file's part of the commit diff, like get_file_diff_only_in_commit() but cut
+        out of the cached get_diff() text. Paths that git quotes in diff headers
+        fall back to the one-shot helper.
+        """
+        diff_text = self.get_diff(sha)
+        # Rename detection is off, so both sides of the header always name the same path
+        for header in (f"diff --git a/{filepath} b/{filepath}\n", f"diff --cc {filepath}\n"):
+            if diff_text.startswith(header):
+                start = 0
+            else:
+                start = diff_text.find("\n" + header) + 1
+                if not start:
+                    continue
+            # Diff content lines always start with ' ', '+', '-' or '@', never "diff --"
+            end = diff_text.find("\ndiff --", start + len(header))
+            return diff_text[start:end if end != -1 else len(diff_text)].strip()
+        return get_file_diff_only_in_commit(self.repo_path, sha, filepath)
+
+    def peek_diff(self, sha):
+        """Returns the cached diff for sha without spawning git, or None if it is not cached."""
+        with self._lock:
+            return self._diff_cache.get(sha)
+
+    def warm_diffs(self, shas):
+        """
+        Loads the diffs of shas into the cache one at a time, skipping cached ones.
+        The lock is released between commits, so interactive lookups are not held up
+        behind the whole batch. Returns the number of diffs fetched.
+        """
+        fetched = 0
+        for sha in shas:
+            if self.peek_diff(sha) is not None:
+                continue
+            try:
+                self.get_diff(sha)
+            except Exception:
+                continue
+            fetched += 1
+        return fetched
+
+    def prefetch_diffs(self, revision_range, limit=None):
+        """
+        Fills the diff cache for the newest commits of revision_range with a single
+        `git log -p` call instead of one diff-tree round-trip per commit.
+        Returns the number of diffs added.
+        """
+        limit = limit or self.PREFETCH_COUNT
+        # Porcelain `log -p` follows the user's diff.* settings (context, prefixes, textconv);
+        # pin them to what plumbing diff-tree prints, so get_diff() answers the same either way
+        cmd = ["git", "-c", "core.commitGraph=true", "log", "-p", "--no-renames", "--diff-algorithm=myers",
+               "--cc", "--no-color", "--no-ext-diff", "--no-textconv", "-U3", "--inter-hunk-context=0",
+               "--indent-heuristic", "--src-prefix=a/", "--dst-prefix=b/",
+               f"-n{limit}", "--format=%x1eCOMMIT %H", revision_range]
+        result = _run_git(cmd, cwd=self.repo_path, capture_output=True)
+        if result.returncode != 0:
+            raise Exception(f"Failed to prefetch diffs: {result.stderr.decode('utf-8', errors='replace')}")
+
+        added = 0
+        output = result.stdout.decode('utf-8', errors='replace')
+        with self._lock:
+            for record in output.split('\x1eCOMMIT ')[1:]:
+                sha, _, diff_text = record.partition('\n')
+                # git log puts a blank line between the (empty) header and the patch
+                if diff_text.startswith('\n'):
+                    diff_text = diff_text[1:]
+                # Never evict diffs that were actually requested
+                if sha in self._diff_cache or len(self._diff_cache) >= self.DIFF_CACHE_SIZE:
+                    continue
+                self._diff_cache[sha] = diff_text
+                added += 1
+        return added
+
+    def clear_cache(self):
+        """Drops all cached diffs, commit messages and file lists."""
+        with self._lock:
+            self._diff_cache.clear()
+            self._commit_cache.clear()
+            self._files_cache.clear()
+
+    def _stop(self):
+        for proc in (self._cat_file, self._cat_file_check, self._diff_tree):
+            if proc is None:
+                continue
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=2)
+            except Exception:
+                proc.kill()
+        self._cat_file = None
+        self._cat_file_check = None
+        self._diff_tree = None
+
+    def close(self):
+        """Terminates the background git processes."""
+        with self._lock:
+            self._stop()
+            self._disk_cache.close()
+
+def iter_git_history(repo_path, commit_sha, is_root=None):
+    """
+    Streams git history from HEAD down to commit_sha (commit_sha itself only if it
+    is a root commit), yielding (full_sha, '<short_sha> <subject>') one commit at a time.
+    is_root: whether commit_sha has no parent; callers holding a GitCatFileBatch pass
+             has_parent() from its cache, otherwise it is asked from git here.
+    """
+    if is_root is None:
+        probe = _run_git(["git", "rev-parse", "--verify", "-q", f"{commit_sha}^"], cwd=repo_path,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        is_root = probe.returncode != 0
+    # Root commit: everything reachable from HEAD (also covers a root that is HEAD
+    # itself, and histories with several roots); otherwise the exclusive range.
+    # Records are NUL-terminated (-z) and fields \x01-separated, so no whitespace guessing is needed.
+    cmd = ["git", "-c", "core.commitGraph=true", "log", "-z", "--no-decorate", "--no-color",
+           "--format=%H%x01%h%x01%s", "HEAD" if is_root else f"{commit_sha}..HEAD"]
+    proc = subprocess.Popen(cmd, cwd=repo_path, env=_git_env(), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def parse(record):
+        fields = record.decode('utf-8', errors='replace').split('\x01', 2)
+        if len(fields) != 3:
+            return None
+        full_sha, short_sha, subject = fields
+        return full_sha, f"{short_sha} {subject}"
+
+    try:
+        pending = b""
+        while True:
+            data = proc.stdout.read1(65536)
+            if not data:
+                break
+            *records, pending = (pending + data).split(b'\0')
+            for record in records:
+                entry = parse(record)
+                if entry:
+                    yield entry
+        if pending:
+            entry = parse(pending)
+            if entry:
+                yield entry
+        stderr = proc.stderr.read().decode('utf-8', errors='replace')
+        if proc.wait() != 0:
+            raise Exception(f"Failed to fetch git history: {stderr}")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+
+def ensure_commit_graph(repo_path):
+    """
+    Writes a commit-graph file (with changed-path Bloom filters) if the repository
+    has none yet, so history walks read a memory-mapped index instead of inflating
+    every commit object. Returns True if a graph was written.
+    """
+    try:
+        for name in ("objects/info/commit-graph", "objects/info/commit-graphs"):
+            result = _run_git(["git", "rev-parse", "--git-path", name], cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True, encoding='utf-8', errors='replace')
+            if os.path.exists(os.path.join(repo_path, result.stdout.strip())):
+                return False
+        cmd = ["git", "commit-graph", "write", "--reachable", "--changed-paths"]
+        subprocess.run(cmd, cwd=repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
+def get_git_history(repo_path, commit_sha):
+    """
+    Yields '<short_sha> <subject>' lines from HEAD down to commit_sha (commit_sha itself
+    only if it is a root commit) as git produces them, without building the whole list.
+    """
+    for _, line in iter_git_history(repo_path, commit_sha):
+        yield line
 
 def get_current_branch(repo_path):
     """Fetches current branch name."""
     try:
         cmd = ["git", "branch", "--show-current"]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True, encoding='utf-8', errors='replace')
         return result.stdout.strip() or "DETACHED"
-    except:
+    except (subprocess.CalledProcessError, OSError):
         return "Unknown"
 
-def get_local_branches_map(repo_path):
-    """Returns a dict mapping short_sha to a list of branch names (local + specific remotes)."""
+def get_head_state(repo_path):
+    """
+    Returns (current_branch, full_head_sha) from a single `git rev-parse` call.
+    Branch is "DETACHED" for a detached HEAD; both are "Unknown" on failure.
+    """
+    try:
+        cmd = ["git", "rev-parse", "HEAD", "--symbolic-full-name", "HEAD"]
+        result = _run_git(cmd, cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True, encoding='utf-8', errors='replace')
+        head_sha, ref = result.stdout.split()
+        if ref.startswith("refs/heads/"):
+            return ref[len("refs/heads/"):], head_sha
+        return "DETACHED", head_sha
+    except (subprocess.CalledProcessError, OSError, ValueError):
+        return "Unknown", "Unknown"
+
+def get_local_branches_map(repo_path, current_branch=None):
+    """Returns a dict mapping full SHA to a list of branch names (local + specific remotes)."""
     try:
-        # Get current branch to include its remote counterpart
-        current_branch = get_current_branch(repo_path)
+        # Get current branch to include its remote counterpart (unless the caller already knows it)
+        if current_branch is None:
+            current_branch = get_current_branch(repo_path)
         
         # for-each-ref with multiple patterns. %(refname:short) for remotes is origin/branch.
-        cmd = ["git", "for-each-ref", "--format=%(objectname:short) %(refname:short)", 
+        cmd = ["git", "for-each-ref", "--format=%(objectname) %(refname:short)", 
                "refs/heads/", "refs/remotes/origin/"]
         
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True, encoding='utf-8', errors='replace')
         
         target_remotes = ["origin/master", "origin/main"]
         if current_branch and current_branch != "DETACHED":
@@ -74,25 +618,25 @@ def get_head_sha(repo_path):
     """Fetches current HEAD SHA (short)."""
     try:
         cmd = ["git", "rev-parse", "--short", "HEAD"]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True, encoding='utf-8', errors='replace')
         return result.stdout.strip()
-    except:
+    except (subprocess.CalledProcessError, OSError):
         return "Unknown"
 
 def get_full_head_sha(repo_path):
     """Fetches current HEAD SHA (full)."""
     try:
         cmd = ["git", "rev-parse", "HEAD"]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True, encoding='utf-8', errors='replace')
         return result.stdout.strip()
-    except:
+    except (subprocess.CalledProcessError, OSError):
         return "Unknown"
 
 def get_root_commit(repo_path):
     """Fetches the very first commit SHA in the repository."""
     try:
         cmd = ["git", "rev-list", "--max-parents=0", "HEAD"]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
         return result.stdout.strip().split('\n')[0]
     except Exception as e:
         raise Exception(f"Failed to find root commit: {e}")
@@ -104,7 +648,7 @@ def get_recent_history_start(repo_path, count=1000):
     """
     try:
         cmd = ["git", "rev-list", "--max-count=1", f"--skip={count}", "HEAD"]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, cwd=repo_path, capture_output=True, text=True, encoding='utf-8', errors='replace')
         sha = result.stdout.strip()
         if sha:
             return sha
@@ -129,7 +673,7 @@ def get_branch_base_info(repo_path):
 
         # Collect all local branches with their tip SHAs
         cmd_branches = ["git", "for-each-ref", "--format=%(objectname) %(refname:short)", "refs/heads/"]
-        res_branches = subprocess.run(cmd_branches, cwd=repo_path, capture_output=True, text=True, encoding='utf-8', errors='replace')
+        res_branches = _run_git(cmd_branches, cwd=repo_path, capture_output=True, text=True, encoding='utf-8', errors='replace')
         head_sha = get_full_head_sha(repo_path)
 
         others = []
@@ -156,13 +700,13 @@ def get_branch_base_info(repo_path):
 
         for upstream in candidates:
             cmd_mb = ["git", "merge-base", "HEAD", upstream]
-            res_mb = subprocess.run(cmd_mb, cwd=repo_path, capture_output=True, text=True, encoding='utf-8', errors='replace')
+            res_mb = _run_git(cmd_mb, cwd=repo_path, capture_output=True, text=True, encoding='utf-8', errors='replace')
             if res_mb.returncode == 0:
                 base_sha = res_mb.stdout.strip()
                 if base_sha:
                     # Sanity check: ensure there is at least 1 commit after the base
                     cmd_check = ["git", "rev-list", f"{base_sha}..HEAD"]
-                    res_check = subprocess.run(cmd_check, cwd=repo_path, capture_output=True, text=True, encoding='utf-8', errors='replace')
+                    res_check = _run_git(cmd_check, cwd=repo_path, capture_output=True, text=True, encoding='utf-8', errors='replace')
                     unique = [c for c in res_check.stdout.strip().split('\n') if c.strip()]
                     print(f"[get_branch_base_info] merge-base with '{upstream}': {base_sha[:8]}, unique commits: {len(unique)}")
                     if unique:
@@ -178,17 +722,29 @@ def get_branch_base_info(repo_path):
 def get_commit_diff(repo_path, commit_sha):
     """Fetches the diff for a specific commit."""
     try:
-        cmd = ["git", "show", commit_sha, "--format="]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
-        return result.stdout
+        # Plumbing diff-tree skips the commit-message formatting done by `git show`;
+        # rename detection is off since it is quadratic in the number of touched files
+        cmd = ["git", "diff-tree", "-p", "--no-renames", "--diff-algorithm=myers", "--cc", "--root", "--no-commit-id", "--no-color", commit_sha]
+        # Capture raw bytes and decode once; text mode would add a second pass over large diffs
+        result = _run_git(cmd, cwd=repo_path, capture_output=True, check=True)
+        return result.stdout.decode('utf-8', errors='replace')
     except subprocess.CalledProcessError as e:
-        raise Exception(f"Failed to fetch diff: {e.stderr}")
+        raise Exception(f"Failed to fetch diff: {e.stderr.decode('utf-8', errors='replace')}")
+
+def get_commit_stat(repo_path, commit_sha):
+    """Fetches the diffstat summary (files touched, lines added/removed) for a commit."""
+    try:
+        cmd = ["git", "diff-tree", "--stat", "--summary", "--no-renames", "--root", "--no-commit-id", "--no-color", commit_sha]
+        result = _run_git(cmd, cwd=repo_path, capture_output=True, check=True)
+        return result.stdout.decode('utf-8', errors='replace')
+    except subprocess.CalledProcessError as e:
+        raise Exception(f"Failed to fetch diffstat: {e.stderr.decode('utf-8', errors='replace')}")
 
 def get_full_commit_message(repo_path, commit_sha):
     """Fetches the full (multi-line) commit message."""
     try:
         cmd = ["git", "log", "-1", "--format=%B", commit_sha]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
         raise Exception(f"Failed to fetch commit message: {e.stderr}")
@@ -198,7 +754,7 @@ def get_commit_metadata(repo_path, commit_sha):
     try:
         # %an = author name, %ae = author email, %ad = author date (human-readable)
         cmd = ["git", "log", "-1", "--format=%an <%ae>, %ad", "--date=format:%d %b %Y %H:%M", commit_sha]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
         return "Unknown author"
@@ -207,7 +763,7 @@ def get_commit_files(repo_path, commit_sha):
     """Returns a list of file paths changed by a given commit."""
     try:
         cmd = ["git", "diff-tree", "--no-commit-id", "--root", "-r", "--name-only", commit_sha]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
         return [f for f in result.stdout.strip().split('\n') if f.strip()]
     except subprocess.CalledProcessError as e:
         raise Exception(f"Failed to list commit files: {e.stderr}")
@@ -216,45 +772,70 @@ def get_file_diff_in_commit(repo_path, commit_sha, filepath):
     """Returns the diff for a single file within a commit."""
     try:
         cmd = ["git", "show", commit_sha, "--", filepath]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
-        return result.stdout
+        result = _run_git(cmd, cwd=repo_path, capture_output=True, check=True)
+        return result.stdout.decode('utf-8', errors='replace')
     except subprocess.CalledProcessError as e:
-        raise Exception(f"Failed to get file diff: {e.stderr}")
+        raise Exception(f"Failed to get file diff: {e.stderr.decode('utf-8', errors='replace')}")
 
 def get_file_diff_only_in_commit(repo_path, commit_sha, filepath):
     """Returns the diff for a single file within a commit, excluding the commit message header."""
     try:
         # Use --format= to suppress the commit log/header
         cmd = ["git", "show", "--format=", commit_sha, "--", filepath]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
-        return result.stdout.strip()
+        result = _run_git(cmd, cwd=repo_path, capture_output=True, check=True)
+        return result.stdout.decode('utf-8', errors='replace').strip()
     except subprocess.CalledProcessError as e:
-        raise Exception(f"Failed to get file diff: {e.stderr}")
+        raise Exception(f"Failed to get file diff: {e.stderr.decode('utf-8', errors='replace')}")
 
 def has_uncommitted_changes(repo_path):
-    """Returns True if there are uncommitted changes in the repository."""
+    """Returns True if there are uncommitted changes in the repository (submodule changes are reported, not counted)."""
     try:
-        # Check all changes
-        cmd_all = ["git", "status", "--porcelain", "--untracked-files=no"]
-        result_all = subprocess.run(cmd_all, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
-        changes_all = set(result_all.stdout.strip().split('\n')) if result_all.stdout.strip() else set()
-
-        # Check excluding submodules
-        cmd_ignored = ["git", "status", "--porcelain", "--untracked-files=no", "--ignore-submodules=all"]
-        result_ignored = subprocess.run(cmd_ignored, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
-        changes_ignored_list = result_ignored.stdout.strip().split('\n') if result_ignored.stdout.strip() else []
-        changes_ignored = set(changes_ignored_list)
-
-        submodule_changes = changes_all - changes_ignored
-        for sc in submodule_changes:
-            parts = sc.strip().split()
-            if len(parts) >= 2:
-                print(f"change in submodule {parts[1]} is detected, but continuing")
-
-        return bool(changes_ignored_list)
+        # One porcelain v2 status: its <sub> field ("N..." for files, "S..." for submodules)
+        # tells submodule entries apart, so no second `--ignore-submodules=all` run is needed
+        cmd = ["git", "status", "--porcelain=v2", "--untracked-files=no"]
+        result = _run_git(cmd, cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True, encoding='utf-8', errors='replace')
+
+        changed = False
+        for line in result.stdout.splitlines():
+            fields = line.split(' ', 3)
+            # Changed ("1"), renamed/copied ("2") and unmerged ("u") entries; the path follows
+            # a fixed number of fields for each
+            path_field = {"1": 8, "2": 9, "u": 10}.get(fields[0])
+            if path_field is None or len(fields) < 3:
+                continue
+            if fields[2].startswith('S'):
+                path = line.split(' ', path_field)[-1].split('\t')[0]
+                logger.debug("Change in submodule %s is detected, but continuing", path)
+            else:
+                changed = True
+        return changed
     except subprocess.CalledProcessError:
         return False
 
+def uses_message_rules(repo_path, hook_names):
+    """
+    Returns True if any of hook_names resolves to a hook file (core.hooksPath honoured)
+    or commit.cleanup is set: message handling a commit or rebase applies but plumbing
+    `git commit-tree` does not. Errors count as True.
+    """
+    hooks = _run_git(["git", "rev-parse"] + [arg for name in hook_names for arg in ("--git-path", f"hooks/{name}")],
+                     cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    if hooks.returncode != 0 or any(os.path.isfile(os.path.join(repo_path, path))
+                                    for path in hooks.stdout.decode('utf-8', errors='replace').splitlines()):
+        return True
+    cleanup = _run_git(["git", "config", "--get", "commit.cleanup"], cwd=repo_path,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return cleanup.returncode == 0
+
+def has_staged_changes(repo_path):
+    """
+    Returns True if the index differs from HEAD, submodule (gitlink) updates included;
+    anything `commit --amend` would fold into the commit. Errors count as changes.
+    """
+    cmd = ["git", "diff", "--cached", "--quiet", "--ignore-submodules=none"]
+    result = _run_git(cmd, cwd=repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return result.returncode != 0
+
 from datetime import datetime
 def stash_changes(repo_path, message=None):
     if message is None:
@@ -272,7 +853,7 @@ def stash_changes(repo_path, message=None):
             pass
 
         cmd = ["git", "stash", "push", "-m", message]
-        subprocess.run(cmd, cwd=repo_path, check=True, capture_output=True, text=True, encoding='utf-8', errors='replace')
+        subprocess.run(cmd, cwd=repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         
         # After stashing, check if refs/stash has changed or been created
         result = subprocess.run(["git", "rev-parse", "refs/stash"], cwd=repo_path, capture_output=True, text=True, encoding='utf-8', errors='replace')
@@ -315,7 +896,7 @@ def stash_pop(repo_path, stash_sha=None):
             pass
 
         cmd = ["git", "stash", "pop", target]
-        subprocess.run(cmd, cwd=repo_path, check=True, capture_output=True, text=True, encoding='utf-8', errors='replace')
+        subprocess.run(cmd, cwd=repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return True, message
     except subprocess.CalledProcessError:
         return False, ""
@@ -325,12 +906,12 @@ def branch_exists(repo_path, branch_name):
     try:
         # Check local branch
         cmd = ["git", "show-ref", "--verify", f"refs/heads/{branch_name}"]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True)
+        result = _run_git(cmd, cwd=repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         if result.returncode == 0:
             return True
         # Check remote branch (origin)
         cmd = ["git", "show-ref", "--verify", f"refs/remotes/origin/{branch_name}"]
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, cwd=repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return result.returncode == 0
     except:
         return False
@@ -339,7 +920,7 @@ def get_remote_head_sha(repo_url):
     """Fetches the current HEAD SHA from the remote repository without fetching objects."""
     try:
         cmd = ["git", "ls-remote", repo_url, "HEAD"]
-        result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
         if result.returncode == 0 and result.stdout.strip():
             return result.stdout.split()[0]
         return None
@@ -352,7 +933,7 @@ def get_unstaged_files(repo_path, ignore_submodules=False):
         if ignore_submodules:
             cmd.append("--ignore-submodules=all")
             
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
+        result = _run_git(cmd, cwd=repo_path, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
         files = []
         for line in result.stdout.strip().split('\n'):
             if not line.strip(): continue
@@ -370,9 +951,9 @@ def commit_file(repo_path, filepath, message):
     """Stages and commits a single file."""
     try:
         # Stage the file
-        subprocess.run(["git", "add", filepath], cwd=repo_path, check=True, capture_output=True)
+        subprocess.run(["git", "add", filepath], cwd=repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         # Commit the file
-        subprocess.run(["git", "commit", "-m", message], cwd=repo_path, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", message], cwd=repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return True
     except subprocess.CalledProcessError:
         return False
@@ -382,13 +963,13 @@ def get_revert_commit_message(repo_path, commit_sha):
     try:
         # Get the subject line only
         cmd_subject = ["git", "log", "-1", "--format=%s", commit_sha]
-        result_subject = subprocess.run(cmd_subject, cwd=repo_path, capture_output=True,
+        result_subject = _run_git(cmd_subject, cwd=repo_path, capture_output=True,
                                         text=True, check=True, encoding='utf-8', errors='replace')
         subject = result_subject.stdout.strip()
 
         # Get the full SHA for the body line
         cmd_full_sha = ["git", "rev-parse", commit_sha]
-        result_full_sha = subprocess.run(cmd_full_sha, cwd=repo_path, capture_output=True,
+        result_full_sha = _run_git(cmd_full_sha, cwd=repo_path, capture_output=True,
                                          text=True, check=True, encoding='utf-8', errors='replace')
         full_sha = result_full_sha.stdout.strip()
 
@@ -400,9 +981,9 @@ def bulk_commit_all(repo_path, message):
     """Stages all modified files and commits them as a single bulk commit."""
     try:
         # Stage all changes (excluding untracked files as per --untracked-files=no in checks)
-        subprocess.run(["git", "add", "-u"], cwd=repo_path, check=True, capture_output=True)
+        subprocess.run(["git", "add", "-u"], cwd=repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         # Commit
-        subprocess.run(["git", "commit", "-m", message], cwd=repo_path, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", message], cwd=repo_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return True
     except subprocess.CalledProcessError:
         return False
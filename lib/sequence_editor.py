@@ -0,0 +1,41 @@
+"""
+GIT_SEQUENCE_EDITOR for the split actions: inserts one todo line right after the
+pick line of a given commit. Everything it needs comes from the environment, so
+the same file serves every rebase instead of a script being generated per call.
+
+    GIT_IR_TARGET_SHA   commit whose todo line gets the new line after it
+    GIT_IR_EXEC_CMD     the todo line to insert (e.g. "exec python3 /tmp/action.py")
+"""
+import os
+import re
+import sys
+
+# "<command> <sha> ..." todo lines; comment lines (#) never match
+TODO_LINE = re.compile(rb'^[^#\s]\S*[ \t]+([0-9a-fA-F]+)\b[^\n]*(\n?)', re.M)
+
+
+def main():
+    target_sha = os.environ["GIT_IR_TARGET_SHA"].encode('ascii')
+    exec_line = os.environ["GIT_IR_EXEC_CMD"].encode('utf-8') + b'\n'
+    todo_path = sys.argv[1]
+
+    # The todo is handled as one bytes buffer in a single regex pass,
+    # rather than stripping and splitting every line
+    with open(todo_path, 'rb') as tf:
+        data = tf.read()
+
+    def insert_after(match):
+        name = match.group(1)
+        if target_sha.startswith(name) or name.startswith(target_sha):
+            # Add our exec line AFTER the pick line
+            return match.group(0) + (b'' if match.group(2) else b'\n') + exec_line
+        return match.group(0)
+
+    output = TODO_LINE.sub(insert_after, data)
+    if output != data:
+        with open(todo_path, 'wb') as tf:
+            tf.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
 import os
 import sys
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def get_assets_path():
     """
     Resolve path to 'assets' directory.
+    The lookup stats every sys.path entry, so the result is computed once per process.
 
     Priority:
     1. Installed via pip (site-packages)